@@ -24,7 +24,7 @@ from langgraph.prebuilt import ToolNode
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage, BaseMessage
 
-from docsagent.agents.llm import get_default_chat_model
+from docsagent.agents.llm import get_default_chat_model, get_model_name
 from docsagent.agents.tools import get_code_reading_tools
 from docsagent.domains.models import ConfigItem, VALID_CATALOGS, is_valid_catalog, get_default_catalog
 from docsagent.tools import stats
@@ -50,6 +50,9 @@ class ConfigDocAgent:
         config -> prepare_prompt -> generate (with tools) -> format -> documentation
     """
     
+    # Bump when the prompts change so cached docs are not reused
+    PROMPT_VERSION = "1"
+    
     def __init__(self, chat_model: BaseChatModel = None):
         """
         Initialize the config documentation agent
@@ -58,6 +61,7 @@ class ConfigDocAgent:
             chat_model: LangChain chat model (default: from config)
         """
         self.chat_model = chat_model or get_default_chat_model()
+        self.model_name = get_model_name(self.chat_model)
         
         # Get tools and bind to LLM
         self.tools = get_code_reading_tools()
@@ -129,4 +129,21 @@ def get_default_chat_model() -> BaseChatModel:
     global _default_chat_model
     if _default_chat_model is None:
         _default_chat_model = create_chat_model()
-    return _default_chat_model
\ No newline at end of file
+    return _default_chat_model
+
+
+def get_model_name(chat_model: BaseChatModel) -> str:
+    """
+    Get the name of the model behind a chat model instance
+    
+    Providers expose it as either `model_name` or `model`; falls back to
+    the configured LLM_MODEL when neither is set.
+    
+    Args:
+        chat_model: Chat model instance
+        
+    Returns:
+        Model name, used to keep cached responses of different models apart
+    """
+    name = getattr(chat_model, 'model_name', None) or getattr(chat_model, 'model', None)
+    return str(name) if name else config.LLM_MODEL
\ No newline at end of file
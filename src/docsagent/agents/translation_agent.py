@@ -14,19 +14,28 @@
 
 """TranslationAgent: Translate text to target languages"""
 
-from typing import Literal
+import json
+import re
+from typing import List, Literal
 from loguru import logger
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from docsagent.agents.llm import get_default_chat_model
+from docsagent.agents.llm import get_default_chat_model, get_model_name
 from docsagent.tools import stats
 
 
+# Optional ```json fence around a model's JSON reply
+_JSON_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
 class TranslationAgent:
     """Pure translation agent - text only, no document structure handling"""
     
+    # Bump when the prompts change so cached translations are not reused
+    PROMPT_VERSION = "1"
+    
     # Field name translation mapping
     FIELD_MAP = {
         "Type": {"ja": "タイプ", "zh": "类型", "en": "Type"},
@@ -39,9 +48,24 @@ class TranslationAgent:
     
     def __init__(self, source_lang: str = 'en'):
         self.chat_model = get_default_chat_model()
+        self.model_name = get_model_name(self.chat_model)
         self.source_lang = source_lang
         logger.debug("TranslationAgent initialized")
     
+    def warmup(self) -> None:
+        """
+        Open the model client's HTTP connection ahead of the first translation.
+        
+        Sends a one-token request so DNS, TLS and connection setup are paid
+        off the critical path. Failures are ignored; the real calls will
+        surface any configuration problem.
+        """
+        try:
+            self.chat_model.bind(max_tokens=1).invoke([HumanMessage(content="ping")])
+            logger.debug("TranslationAgent warmed up")
+        except Exception as e:
+            logger.debug(f"TranslationAgent warmup failed: {e}")
+    
     def translate(
         self, 
         text: str, 
@@ -70,32 +94,113 @@ class TranslationAgent:
             # Record agent call with language suffix
             stats.record_agent_call(f"TranslationAgent_{target_lang}")
             
-            system_prompt = self._build_system_prompt(target_lang)
-            user_prompt = self._build_user_prompt(text, target_lang, preserve_markers)
-            
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
+            messages = self._build_messages(text, target_lang, preserve_markers)
             response = self.chat_model.invoke(messages)
-            translated = response.content.strip()
-            
-            # Post-process: ensure all field names are translated
-            translated = self._post_process_field_names(translated, target_lang)
+            return self._finish_translation(text, response.content, target_lang)
             
-            # Record successful translation
-            stats.record_document(target_lang)
+        except Exception as e:
+            stats.record_error(f"Translation to {target_lang} failed: {e}")
+            logger.error(f"Translation failed: {e}")
+            # Re-raise exception to prevent storing failed translation
+            raise RuntimeError(f"Translation to {target_lang} failed: {str(e)}") from e
+    
+    async def atranslate(
+        self, 
+        text: str, 
+        target_lang: Literal['zh', 'ja', 'en'],
+        preserve_markers: bool = False
+    ) -> str:
+        """
+        Async twin of translate(), using the chat model's ainvoke().
+        
+        Lets callers keep several translation requests in flight at once.
+        """
+        logger.debug(f"Translating text to {target_lang} ({len(text)} chars, async)")
+        
+        try:
+            stats.record_agent_call(f"TranslationAgent_{target_lang}")
             
-            logger.debug(f"Translation completed: {len(text)} → {len(translated)} chars")
-            return translated
+            messages = self._build_messages(text, target_lang, preserve_markers)
+            response = await self.chat_model.ainvoke(messages)
+            return self._finish_translation(text, response.content, target_lang)
             
         except Exception as e:
             stats.record_error(f"Translation to {target_lang} failed: {e}")
             logger.error(f"Translation failed: {e}")
-            # Re-raise exception to prevent storing failed translation
             raise RuntimeError(f"Translation to {target_lang} failed: {str(e)}") from e
     
+    def translate_json(self, docs: List[str], target_lang: Literal['zh', 'ja', 'en']) -> List[str]:
+        """
+        Translate several docs in one call, exchanging them as a JSON array.
+        
+        Avoids separator parsing entirely: the reply must be a JSON array with
+        exactly one translated string per input doc.
+        
+        Args:
+            docs: Source documents
+            target_lang: Target language code
+        
+        Returns:
+            Translated documents, in input order
+        
+        Raises:
+            ValueError: If the reply is not a JSON array of len(docs) strings
+        """
+        stats.record_agent_call(f"TranslationAgent_{target_lang}")
+        response = self.chat_model.invoke(self._build_json_messages(docs, target_lang))
+        return self._parse_json_translation(response.content, docs, target_lang)
+    
+    async def atranslate_json(self, docs: List[str], target_lang: Literal['zh', 'ja', 'en']) -> List[str]:
+        """Async twin of translate_json()"""
+        stats.record_agent_call(f"TranslationAgent_{target_lang}")
+        response = await self.chat_model.ainvoke(self._build_json_messages(docs, target_lang))
+        return self._parse_json_translation(response.content, docs, target_lang)
+    
+    def _build_json_messages(self, docs: List[str], target_lang: str) -> list:
+        """Build the chat messages for a JSON-array batch translation"""
+        system_prompt = self._build_system_prompt(target_lang) + """
+
+        The input is a JSON array of documents. Reply with ONLY a JSON array of
+        strings containing the translation of each document, in the same order
+        and with exactly the same number of elements."""
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=json.dumps(docs, ensure_ascii=False))
+        ]
+    
+    def _parse_json_translation(self, content: str, docs: List[str], target_lang: str) -> List[str]:
+        """Validate a JSON-array reply and post-process each translated doc"""
+        try:
+            translated = json.loads(_JSON_FENCE_RE.sub('', content.strip()))
+        except ValueError as e:
+            raise ValueError(f"Translation reply is not valid JSON: {e}") from e
+        
+        if (not isinstance(translated, list) or len(translated) != len(docs)
+                or not all(isinstance(doc, str) for doc in translated)):
+            raise ValueError(f"Expected a JSON array of {len(docs)} strings")
+        
+        return [self._finish_translation(src, doc, target_lang) for src, doc in zip(docs, translated)]
+    
+    def _build_messages(self, text: str, target_lang: str, preserve_markers: bool) -> list:
+        """Build the chat messages for a translation request"""
+        return [
+            SystemMessage(content=self._build_system_prompt(target_lang)),
+            HumanMessage(content=self._build_user_prompt(text, target_lang, preserve_markers))
+        ]
+    
+    def _finish_translation(self, text: str, content: str, target_lang: str) -> str:
+        """Post-process the model output and record the translated document"""
+        translated = content.strip()
+        
+        # Post-process: ensure all field names are translated
+        translated = self._post_process_field_names(translated, target_lang)
+        
+        # Record successful translation
+        stats.record_document(target_lang)
+        
+        logger.debug(f"Translation completed: {len(text)} → {len(translated)} chars")
+        return translated
+    
     def _post_process_field_names(self, text: str, target_lang: str) -> str:
         """Post-process to ensure all field names are translated"""
         result = text
@@ -153,18 +258,18 @@ class TranslationAgent:
         preserve_markers: bool
     ) -> str:
         """Build user prompt for translation"""
-        prompt = f"Translate the following text to {target_lang}:\n\n"
+        parts = [f"Translate the following text to {target_lang}:\n\n"]
         
         if preserve_markers:
-            prompt += """
+            parts.append("""
             IMPORTANT: Keep ALL special markers EXACTLY as they are. Do NOT translate or modify:
             - HTML comments like: <!-- ... -->
             - Markers like: ====...====
             - Any text inside {{ }} or similar brackets
 
-            """
+            """)
         
-        prompt += f"{text}\n\n"
-        prompt += "Remember to preserve Markdown formatting and keep technical terms accurate."
+        parts.append(f"{text}\n\n")
+        parts.append("Remember to preserve Markdown formatting and keep technical terms accurate.")
         
-        return prompt
+        return "".join(parts)
@@ -44,6 +44,10 @@ class AppConfig(BaseSettings):
     DOCS_OUTPUT_DIR: str = Field(default_factory=lambda: str(Path(__file__).parent.parent.parent / 'output'))
     
     META_DIR: str = Field(default_factory=lambda: str(Path(__file__).parent.parent.parent / 'meta'))
+    META_PICKLE_CACHE: bool = False  # Keep a pickle copy of each meta file for faster reloads
+    META_PRETTY: bool = False  # Indent meta JSON for human inspection (compact by default)
+    META_DURABLE: bool = False  # fsync meta files before replacing them (slower, survives power loss)
+    EXTRACT_WORKERS: int = 1  # Processes parsing source files during extraction (0 = one per CPU)
     
     # LLM configuration
     LLM_MODEL: str = 'openai:gpt-3.5-turbo'
@@ -52,6 +56,8 @@ class AppConfig(BaseSettings):
     LLM_PROVIDER: str = ''
     LLM_TEMPERATURE: float = 0.1
     LLM_MAX_TOKENS: int = 5000
+    LLM_CACHE: bool = True  # Reuse cached LLM docs/translations under META_DIR
+    LLM_CACHE_TTL: float = 0  # Seconds a cached LLM response stays valid (0 = never expires)
     
     # Processing configuration
     TARGET_LANGS: List[str] = Field(default=['en', 'zh', 'ja'])
@@ -72,6 +78,9 @@ class AppConfig(BaseSettings):
     # Git and GitHub configuration
     GITHUB_TOKEN: str = ''  # GitHub personal access token for creating PRs
     GITHUB_REPO: str = 'StarRocks/starrocks'  # Target GitHub repository in format 'owner/repo' (e.g., 'StarRocks/starrocks')
+    ALLOW_RECLONE: bool = False  # Commit docs through a blob-less clone when STARROCKS_HOME is a full clone
+    RECLONE_DIR: str = Field(default_factory=lambda: str(Path(__file__).parent.parent.parent / 'repo'))  # Where the blob-less clone lives
+    VERSION_PICKAXE: bool = False  # Find first versions with `git log -S` instead of reading sources at every tag
 
 
     
@@ -90,7 +99,7 @@ class AppConfig(BaseSettings):
             return [lang.strip() for lang in v.split(',')]
         return v
     
-    @field_validator('MUST_USE_SR_CLIENT', mode='before')
+    @field_validator('MUST_USE_SR_CLIENT', 'ALLOW_RECLONE', 'META_PICKLE_CACHE', 'META_PRETTY', 'META_DURABLE', 'VERSION_PICKAXE', 'LLM_CACHE', mode='before')
     @classmethod
     def parse_bool(cls, v):
         """Parse boolean from string"""
@@ -25,13 +25,20 @@ from .protocols import (
     ItemExtractor,
     DocGenerator,
     DocPersister,
+    ContentHashMixin,
 )
 from .pipeline import (
     DocGenerationPipeline,
     DEFAULT_SEPARATOR,
     DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_TOKENS_PER_BATCH,
 )
+from .abcs import DocumentableItemABC, register_item_class, assert_slotted, is_documentable_item
 from .git_persister import GitPersister
+from .serialize import FieldsTupleMixin, pack_items, unpack_items
+from .intern import InternedDocumentsMixin
+from . import json_io
 
 __all__ = [
     # Protocols
@@ -39,10 +46,23 @@ __all__ = [
     'ItemExtractor',
     'DocGenerator',
     'DocPersister',
+    'ContentHashMixin',
+    'DocumentableItemABC',
+    'register_item_class',
+    'assert_slotted',
+    'is_documentable_item',
     # Pipeline
     'DocGenerationPipeline',
     'DEFAULT_SEPARATOR',
     'DEFAULT_BATCH_SIZE',
+    'DEFAULT_MAX_WORKERS',
+    'DEFAULT_MAX_TOKENS_PER_BATCH',
     # Git
     'GitPersister',
+    # Serialization
+    'FieldsTupleMixin',
+    'pack_items',
+    'unpack_items',
+    'InternedDocumentsMixin',
+    'json_io',
 ]
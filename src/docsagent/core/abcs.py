@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+ABC companions of the core protocols.
+
+DocumentableItem is a static-typing Protocol only: isinstance() against a
+@runtime_checkable Protocol checks every protocol member with hasattr on
+each call. Item classes register here instead, and runtime checks are a
+set lookup on the exact type, then the ABC (which caches per type), and
+only then a minimal duck-type probe for unregistered third-party types.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Set, Type
+
+
+class DocumentableItemABC(ABC):
+    """
+    Nominal counterpart of DocumentableItem.
+
+    Item classes are registered with DocumentableItemABC.register() rather
+    than inheriting from it, so dataclass fields can back the abstract
+    properties.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def documents(self) -> Dict[str, str]:
+        ...
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        ...
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentableItemABC":
+        ...
+
+
+# Exact types registered through register_item_class()
+_ITEM_CLASSES: Set[type] = set()
+
+
+def register_item_class(cls: Type) -> Type:
+    """
+    Register an item class as a DocumentableItem implementation.
+
+    Usable as a class decorator; also registers cls with DocumentableItemABC
+    so isinstance() checks against the ABC succeed.
+    """
+    DocumentableItemABC.register(cls)
+    _ITEM_CLASSES.add(cls)
+    return cls
+
+
+def assert_slotted(cls: Type) -> Type:
+    """
+    Assert that instances of cls carry no per-instance __dict__.
+
+    Every class in the MRO (except object) must declare __slots__; a single
+    base without them gives each instance a __dict__ again. The check is an
+    assert, so it is skipped under python -O.
+    """
+    unslotted = [base.__name__ for base in cls.__mro__[:-1] if '__slots__' not in base.__dict__]
+    assert not unslotted, f"{cls.__name__} should be slotted; missing __slots__ in: {', '.join(unslotted)}"
+    return cls
+
+
+def is_documentable_item(obj: Any) -> bool:
+    """
+    Check obj against DocumentableItem, cheaply for registered types.
+
+    Returns:
+        True if obj is a registered item type (or a subclass of one), or
+        at least has the name and documents members
+    """
+    if type(obj) in _ITEM_CLASSES or isinstance(obj, DocumentableItemABC):
+        return True
+    return hasattr(obj, 'name') and hasattr(obj, 'documents')
+
+
+__all__ = [
+    'DocumentableItemABC',
+    'register_item_class',
+    'assert_slotted',
+    'is_documentable_item',
+]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pickle cache of loaded items, next to the JSON meta files.
+
+The JSON meta file stays the durable format; the pickle is an opt-in
+(META_PICKLE_CACHE) copy that restores items without JSON decoding on
+incremental runs. Items using FieldsTupleMixin pickle as positional rows,
+so field names are not repeated per instance in the stream.
+
+write_atomic() is the shared helper for replacing meta, version and cache
+files without ever exposing a partial file.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, List, Optional
+
+from loguru import logger
+
+
+PICKLE_PROTOCOL = 5
+
+
+def cache_path_for(meta_path: Path) -> Path:
+    """Pickle cache location for a meta file"""
+    return meta_path.with_name(meta_path.name + '.pkl')
+
+
+def write_atomic(path: Path, content: bytes, durable: bool = False) -> None:
+    """
+    Replace path with content so readers never see a partial file.
+
+    The bytes go to a sibling .tmp file that is then os.replace()d over
+    path; with durable, the data is also fsync()ed before the rename.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(content)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def source_digest(content: bytes) -> bytes:
+    """Digest of the source file content a cache is built from"""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def write_cache(items: List[Any], path: Path, digest: Optional[bytes] = None) -> None:
+    """
+    Pickle items to path; failures are logged and otherwise ignored.
+
+    Args:
+        items: Items to cache
+        path: Cache file
+        digest: source_digest() of the content the items were loaded from
+    """
+    try:
+        write_atomic(path, pickle.dumps((digest, items), protocol=PICKLE_PROTOCOL))
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Failed to write item cache {path}: {e}")
+
+
+def read_cache(path: Path, digest: Optional[bytes] = None) -> Optional[List[Any]]:
+    """
+    Load pickled items.
+
+    The cache is matched by the content digest of its source rather than
+    by mtime, so a source rewritten within the same mtime tick (or restored
+    with an older mtime) is never served from a stale cache.
+
+    Args:
+        path: Cache file written by write_cache()
+        digest: source_digest() of the current source content; the cache
+            is ignored unless it was written with the same digest
+
+    Returns:
+        Cached items, or None if the cache is missing, stale or unreadable
+    """
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+        # Caches written before digests were stored are plain lists
+        if not isinstance(cached, tuple) or len(cached) != 2 or cached[0] != digest:
+            return None
+        return cached[1]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable item cache {path}: {e}")
+        return None
+
+
+__all__ = [
+    'cache_path_for',
+    'write_atomic',
+    'source_digest',
+    'write_cache',
+    'read_cache',
+]
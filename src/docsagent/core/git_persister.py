@@ -14,15 +14,125 @@
 
 """Base GitPersister for committing documentation to external repository"""
 
+import asyncio
+import hashlib
+import mmap
+import os
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional
 from pathlib import Path
 from loguru import logger
 
+import requests
+from git import Repo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from docsagent.tools.git_operator import GitOperator
 from docsagent import config
 from docsagent.tools import stats
 
 
+_PR_TITLE_TEMPLATE = "[Doc] docs({domain}): update {langs} documentation"
+
+_PR_BODY_TEMPLATE = """
+## Why I'm doing:
+
+## What I'm doing:  
+
+{message}
+
+This Pr is generated by [DocsAgent](https://github.com/StarRocks/DocsAgent)
+
+## What type of PR is this:
+
+- [ ] BugFix
+- [ ] Feature
+- [ ] Enhancement
+- [ ] Refactor
+- [ ] UT
+- [x] Doc
+- [ ] Tool
+
+Does this PR entail a change in behavior?
+
+- [ ] Yes, this PR will result in a change in behavior.
+- [x] No, this PR will not result in a change in behavior.
+
+If yes, please specify the type of change:
+
+- [ ] Interface/UI changes: syntax, type conversion, expression evaluation, display information
+- [ ] Parameter changes: default values, similar parameters but with different default values
+- [ ] Policy changes: use new policy to replace old one, functionality automatically enabled
+- [ ] Feature removed
+- [ ] Miscellaneous: upgrade & downgrade compatibility, etc.
+
+## Checklist:
+
+- [ ] I have added test cases for my bug fix or my new feature
+- [ ] This pr needs user documentation (for new or modified features or behaviors)
+  - [ ] I have added documentation for my new feature or new function
+- [ ] This is a backport pr
+
+## Bugfix cherry-pick branch check:
+- [x] I have checked the version labels which the pr will be auto-backported to the target branch
+  - [ ] 4.0
+  - [ ] 3.5
+  - [ ] 3.4
+  - [ ] 3.3
+"""
+
+
+@lru_cache(maxsize=1)
+def _get_git_operator(repo_path: str, github_token: str, github_repo: Optional[str]) -> GitOperator:
+    """
+    Get the shared GitOperator for the given repository settings.
+    
+    All domains commit into the same StarRocks checkout, so a single operator
+    (and its validated Repo handle) is reused instead of re-opening the
+    repository on every execute().
+    """
+    return GitOperator(
+        repo_path=repo_path,
+        github_token=github_token,
+        github_repo=github_repo
+    )
+
+
+# Files below this size are read directly; mmap page-table setup isn't worth it
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _file_digest(path: Path) -> bytes:
+    """
+    Compute a 128-bit blake2b digest of a file's content.
+    
+    Larger files are hashed over a read-only mmap so their content is never
+    copied into a Python bytes object.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.blake2b(mm, digest_size=16).digest()
+
+
+def _needs_copy(source: Path, target: Path) -> bool:
+    """
+    Check whether copying source over target would change the target.
+    
+    Compares file sizes first and only hashes both files when sizes match.
+    """
+    try:
+        target_size = os.stat(target).st_size
+    except FileNotFoundError:
+        return True
+    if os.stat(source).st_size != target_size:
+        return True
+    return _file_digest(source) != _file_digest(target)
+
+
 class GitPersister:
     """
     Base class for Git operations in documentation pipeline.
@@ -31,6 +141,9 @@ class GitPersister:
     Each domain can extend this to provide domain-specific file mappings.
     """
     
+    # Shared GitHub API session (connection reuse + retry), created on first use
+    _session: Optional[requests.Session] = None
+    
     def __init__(self, domain: str):
         """
         Initialize GitPersister.
@@ -47,6 +160,26 @@ class GitPersister:
         """
         Execute git operations: commit, push, and create PR.
         
+        Synchronous entry point; runs execute_async() on a new event loop.
+        
+        Args:
+            languages: List of languages that were updated
+            auto_commit: Whether to automatically commit changes
+            create_pr: Whether to create a Pull Request (implies push to remote)
+        
+        Returns:
+            True if operations succeeded (or skipped), False on error
+        """
+        return asyncio.run(self.execute_async(languages, auto_commit=auto_commit, create_pr=create_pr))
+    
+    async def execute_async(self, languages: List[str], auto_commit: bool = False, create_pr: bool = False) -> bool:
+        """
+        Execute git operations without blocking the event loop.
+        
+        Local git and file work runs in worker threads, `git push` runs as an
+        asyncio subprocess and the PR is created in a worker thread, so
+        several domains can run their git operations concurrently.
+        
         Args:
             languages: List of languages that were updated
             auto_commit: Whether to automatically commit changes
@@ -59,32 +192,45 @@ class GitPersister:
             logger.info("Git commit disabled, skipping git operations")
             return True
         
-        # Initialize git operator
-        self.git_operator = GitOperator(
-            repo_path=config.STARROCKS_HOME,
-            github_token=config.GITHUB_TOKEN,
-            github_repo=config.GITHUB_REPO if config.GITHUB_REPO else None
+        if not languages:
+            logger.info("No languages updated; skipping git operations")
+            return True
+        
+        # Reuse the shared git operator (cached per repository settings)
+        repo_path = await asyncio.to_thread(self._ensure_fast_clone)
+        self.git_operator = _get_git_operator(
+            repo_path,
+            config.GITHUB_TOKEN,
+            config.GITHUB_REPO if config.GITHUB_REPO else None
         )
         
         # Validate repository
-        if not self.git_operator.validate_repository():
+        if not await asyncio.to_thread(self.git_operator.validate_repository):
             logger.warning("Git operations skipped: invalid repository")
             return True  # Not an error, just skip
         
+        # Get file mappings (domain-specific) and drop those whose target
+        # already has identical content, before any branch is created
+        file_mappings = await asyncio.to_thread(lambda: self.file_mappings)
+        
+        if not file_mappings:
+            logger.warning("No file mappings defined, skipping commit")
+            return True
+        
+        file_mappings = await asyncio.to_thread(self._filter_unchanged, file_mappings)
+        
+        if not file_mappings:
+            logger.info("All mapped files are up to date, skipping commit")
+            return True
+        
         try:
             # Create branch
-            branch_name = self.git_operator.create_branch(self.domain)
+            branch_name = await asyncio.to_thread(self.git_operator.create_branch, self.domain)
             logger.info(f"Created branch: {branch_name}")
             
-            # Get file mappings (domain-specific)
-            file_mappings = self.get_file_mappings()
-            
-            if not file_mappings:
-                logger.warning("No file mappings defined, skipping commit")
-                return True
-            
             # Copy files and commit
-            success, changed_files = self.git_operator.copy_and_commit(
+            success, changed_files = await asyncio.to_thread(
+                self.git_operator.copy_and_commit,
                 file_mappings=file_mappings,
                 domain=self.domain,
                 languages=languages
@@ -103,13 +249,15 @@ class GitPersister:
             # Create PR if enabled (this implies push)
             if create_pr:
                 # First push to remote
-                if not self.git_operator.push():
+                if not await self.git_operator.push_async():
                     logger.error("Failed to push changes")
                     return False
                 logger.info("Pushed changes to remote")
                 
-                # Then create PR
-                pr_url = self._create_pull_request(branch_name, languages)
+                # Then create PR; cleanup waits for it (finally below), since
+                # the PR code reads the repository's remote
+                pr_url = await self._create_pull_request_async(branch_name, languages)
+                
                 if pr_url:
                     logger.info(f"Created Pull Request: {pr_url}")
                 else:
@@ -126,11 +274,88 @@ class GitPersister:
         finally:
             # Cleanup: return to original branch
             if self.git_operator:
-                self.git_operator.cleanup()
+                await asyncio.to_thread(self.git_operator.cleanup)
     
-    def get_file_mappings(self) -> Dict[str, str]:
+    def _filter_unchanged(self, file_mappings: Dict[str, str]) -> Dict[str, str]:
         """
-        Get file mappings for this domain.
+        Drop mappings whose target already has the same content as the source.
+        
+        Missing sources are kept so copy_and_commit() can report them.
+        """
+        repo_path = self.git_operator.repo_path
+        return {
+            source: target for source, target in file_mappings.items()
+            if not Path(source).exists() or _needs_copy(Path(source), repo_path / target)
+        }
+    
+    def _ensure_fast_clone(self) -> str:
+        """
+        Get the repository path used for git operations.
+        
+        Shallow or partial clones of STARROCKS_HOME are used as-is. For a full
+        clone, if ALLOW_RECLONE is enabled, docs are committed through a
+        blob-less clone (--filter=blob:none) in RECLONE_DIR instead, so branch,
+        status and push do not walk the full object history. STARROCKS_HOME
+        itself is left untouched since version tracking needs its tags.
+        
+        Returns:
+            Repository path to pass to GitOperator
+        """
+        repo_path = Path(config.STARROCKS_HOME)
+        git_dir = repo_path / ".git"
+        if not git_dir.exists() or not config.ALLOW_RECLONE:
+            return config.STARROCKS_HOME
+        
+        try:
+            repo = Repo(repo_path)
+            with repo.config_reader() as reader:
+                is_partial = reader.has_option("extensions", "partialClone") or \
+                    reader.get_value('remote "origin"', "promisor", default=False)
+            if (git_dir / "shallow").exists() or is_partial:
+                logger.debug(f"Using shallow/partial clone: {repo_path}")
+                return config.STARROCKS_HOME
+            
+            clone_path = Path(config.RECLONE_DIR)
+            if (clone_path / ".git").exists():
+                fast_repo = Repo(clone_path)
+                fast_repo.remote("origin").pull("main", ff_only=True)
+                logger.debug(f"Reusing blob-less clone: {clone_path}")
+            else:
+                remote_url = repo.remote("origin").url
+                logger.info(f"Creating blob-less clone of {remote_url} → {clone_path}")
+                fast_repo = Repo.clone_from(
+                    remote_url,
+                    clone_path,
+                    multi_options=["--filter=blob:none", "--single-branch", "--branch main"]
+                )
+            
+            with fast_repo.config_writer() as writer:
+                writer.set_value("core", "untrackedCache", "true")
+                writer.set_value("feature", "manyFiles", "true")
+            
+            return str(clone_path)
+        except Exception as e:
+            logger.warning(f"Failed to prepare blob-less clone, using {repo_path}: {e}")
+            return config.STARROCKS_HOME
+    
+    @cached_property
+    def file_mappings(self) -> Dict[str, str]:
+        """
+        File mappings for this domain, computed once per instance.
+        
+        Returns:
+            Dict mapping source paths to target paths in StarRocks repo
+            {source_absolute_path: target_relative_path}
+        """
+        return self._compute_file_mappings()
+    
+    def invalidate_file_mappings(self) -> None:
+        """Drop the cached file mappings so the next access recomputes them."""
+        self.__dict__.pop("file_mappings", None)
+    
+    def _compute_file_mappings(self) -> Dict[str, str]:
+        """
+        Compute file mappings for this domain.
         
         Returns:
             Dict mapping source paths to target paths in StarRocks repo
@@ -143,11 +368,33 @@ class GitPersister:
               For now, returns empty dict as a placeholder.
         """
         logger.warning(
-            f"get_file_mappings() not implemented for domain '{self.domain}'. "
+            f"_compute_file_mappings() not implemented for domain '{self.domain}'. "
             "Override this method to provide domain-specific mappings."
         )
         return {}
     
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Get the shared GitHub API session, creating it on first use.
+        
+        Only idempotent requests are retried (urllib3's default methods), so
+        a PR that GitHub created before answering 5xx is not POSTed again.
+        Rate-limit 403s are waited out by GitOperator._github_request().
+        """
+        if cls._session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            GitPersister._session = session
+        return cls._session
+    
     def _create_pull_request(
         self,
         branch_name: str,
@@ -164,12 +411,11 @@ class GitPersister:
         Returns:
             PR URL if successful, None otherwise
         """
-        if not self.git_operator:
+        if not self.git_operator or not languages:
             return None
         
         # Generate PR title
-        lang_str = ", ".join(languages)
-        title = f"[Doc] docs({self.domain}): update {lang_str} documentation"
+        title = _PR_TITLE_TEMPLATE.format(domain=self.domain, langs=", ".join(languages))
         
         # Generate PR body
         body = self._generate_pr_body()
@@ -178,9 +424,30 @@ class GitPersister:
             title=title,
             body=body,
             base="main",
-            head=branch_name
+            head=branch_name,
+            session=self._get_session()
         )
     
+    async def _create_pull_request_async(
+        self,
+        branch_name: str,
+        languages: List[str]
+    ) -> Optional[str]:
+        """
+        Run _create_pull_request() in a worker thread.
+        
+        The PR goes through the shared retrying session (403/429/5xx), so
+        there is a single code path for creating PRs.
+        
+        Args:
+            branch_name: Name of the branch
+            languages: List of languages updated
+        
+        Returns:
+            PR URL if successful, None otherwise
+        """
+        return await asyncio.to_thread(self._create_pull_request, branch_name, languages)
+    
     def _generate_pr_body(self) -> str:
         """
         Generate Pull Request description.
@@ -194,51 +461,4 @@ class GitPersister:
         """
         lines = ["    " + l for l in stats.get_stats().get_summary_lines() if "=====" not in l]
         message = "\n".join(lines)
-        body = f"""
-## Why I'm doing:
-
-## What I'm doing:  
-
-{message}
-
-This Pr is generated by [DocsAgent](https://github.com/StarRocks/DocsAgent)
-
-## What type of PR is this:
-
-- [ ] BugFix
-- [ ] Feature
-- [ ] Enhancement
-- [ ] Refactor
-- [ ] UT
-- [x] Doc
-- [ ] Tool
-
-Does this PR entail a change in behavior?
-
-- [ ] Yes, this PR will result in a change in behavior.
-- [x] No, this PR will not result in a change in behavior.
-
-If yes, please specify the type of change:
-
-- [ ] Interface/UI changes: syntax, type conversion, expression evaluation, display information
-- [ ] Parameter changes: default values, similar parameters but with different default values
-- [ ] Policy changes: use new policy to replace old one, functionality automatically enabled
-- [ ] Feature removed
-- [ ] Miscellaneous: upgrade & downgrade compatibility, etc.
-
-## Checklist:
-
-- [ ] I have added test cases for my bug fix or my new feature
-- [ ] This pr needs user documentation (for new or modified features or behaviors)
-  - [ ] I have added documentation for my new feature or new function
-- [ ] This is a backport pr
-
-## Bugfix cherry-pick branch check:
-- [x] I have checked the version labels which the pr will be auto-backported to the target branch
-  - [ ] 4.0
-  - [ ] 3.5
-  - [ ] 3.4
-  - [ ] 3.3
-"""
-        
-        return body
+        return _PR_BODY_TEMPLATE.format(message=message)
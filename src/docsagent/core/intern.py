@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+String interning for item documents.
+
+Every item carries a documents dict keyed by the same few language codes.
+Keys decoded from meta files are fresh string objects per item; interning
+them makes all items share one 'en'/'zh'/'ja' object and lets dict lookups
+succeed on the identity check.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, TypeVar
+
+V = TypeVar('V')
+
+
+def intern_keys(mapping: Dict[str, V]) -> Dict[str, V]:
+    """
+    Return mapping with every key interned.
+
+    The dict is only copied when some key is not the interned string yet.
+    """
+    intern = sys.intern
+    for key in mapping:
+        if intern(key) is not key:
+            return {intern(key): value for key, value in mapping.items()}
+    return mapping
+
+
+class InternedDocumentsMixin:
+    """
+    Interns the language keys of a dataclass item's documents on construction,
+    and answers the common documents queries without copying them.
+
+    Covers every constructor path (from_dict, from_tuple, extractors), since
+    they all go through the dataclass __init__.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        if self.documents:
+            self.documents = intern_keys(self.documents)
+
+    @property
+    def documents_view(self) -> Mapping[str, str]:
+        """Read-only view of documents, without copying"""
+        return MappingProxyType(self.documents)
+
+    def needs_languages(self, targets: FrozenSet[str]) -> FrozenSet[str]:
+        """Languages in targets without a document (one allocation per call)"""
+        return targets.difference(self.documents)
+
+
+__all__ = [
+    'intern_keys',
+    'InternedDocumentsMixin',
+]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encoding/decoding for meta and version files.
+
+Uses orjson when it is installed and the stdlib json module otherwise; both
+paths produce UTF-8 bytes and accept the same value types:
+
+- JSON primitives (str, int, float, bool, None), lists/tuples and dicts
+- datetime/date (ISO 8601 strings)
+- pathlib.Path (as str) and Enum (as its value)
+
+Anything else, e.g. functions or arbitrary objects, raises TypeError.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib encoder
+    orjson = None
+
+
+# Raised by loads() on malformed input (orjson's error subclasses this one)
+JSONDecodeError = json.JSONDecodeError
+
+
+def _encode(obj: Any) -> Any:
+    """Encode the non-primitive types allowed in to_dict() values"""
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode (see module docstring for allowed types)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_encode, option=option)
+    return json.dumps(obj, default=_encode, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = [
+    'JSONDecodeError',
+    'dumps',
+    'loads',
+]
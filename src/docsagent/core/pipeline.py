@@ -48,7 +48,18 @@ Usage:
     )
 """
 
-from typing import TypeVar, Generic, List, Dict, Optional, Any, Callable
+from __future__ import annotations
+
+import asyncio
+import copy
+import re
+import threading
+import time
+from array import array
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TypeVar, Generic, List, Dict, FrozenSet, Optional, Any, Callable
 from pathlib import Path
 from loguru import logger
 
@@ -57,11 +68,14 @@ from docsagent.core.protocols import (
     ItemExtractor,
     DocGenerator,
     DocPersister,
+    normalize_documents,
 )
+from docsagent.core.abcs import is_documentable_item
 from docsagent.core.git_persister import GitPersister
 from docsagent.core.version_extractor import BaseVersionExtractor
 from docsagent.agents.translation_agent import TranslationAgent
 from docsagent.tools import stats
+from docsagent.tools.llm_cache import ResponseCache
 
 
 # Type variable bound to DocumentableItem
@@ -70,6 +84,28 @@ T = TypeVar('T', bound=DocumentableItem)
 # Separator for batch translation
 DEFAULT_SEPARATOR = "<!-- ITEM_SEP_{index} -->"
 DEFAULT_BATCH_SIZE = 10
+DEFAULT_MAX_TOKENS_PER_BATCH = 6000
+_SEP_TOKENS = 12  # Estimated cost of one separator plus surrounding blank lines
+_SEP_RE = re.compile(r'<!--\s*ITEM_SEP_\d+\s*-->')
+
+# Batch protocols: 'separator' (marker-joined text) or 'json' (JSON array,
+# falling back to separators if the reply cannot be parsed)
+DEFAULT_BATCH_PROTOCOL = 'separator'
+
+# Concurrent LLM requests for document generation
+DEFAULT_MAX_WORKERS = 16
+
+# Retries (with exponential backoff) for a failed generation call
+DEFAULT_MAX_RETRIES = 3
+
+# Items per generate_many() call for generators that batch natively
+DEFAULT_GENERATE_BATCH_SIZE = 8
+
+# Translation batches kept in flight at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Documentation-status groups built by analyze_and_group
+_GROUP_KEYS = ('has_zh_and_en', 'has_zh_only', 'has_en_only', 'has_neither')
 
 
 class DocGenerationPipeline(Generic[T]):
@@ -124,6 +160,20 @@ class DocGenerationPipeline(Generic[T]):
         self.version_extractor = version_extractor
         self.item_type_name = item_type_name
         
+        # On-disk LLM response caches, set up per run (see _init_caches)
+        self.translation_cache: Optional[ResponseCache] = None
+        self.docgen_cache: Optional[ResponseCache] = None
+        
+        self.batch_protocol = DEFAULT_BATCH_PROTOCOL
+        self.max_tokens_per_batch = DEFAULT_MAX_TOKENS_PER_BATCH
+        
+        # Languages with a non-empty doc, per item name (see analyze_and_group)
+        self._present_langs: Dict[str, set] = {}
+        
+        # Item name -> lang -> input hash of the docs derived in this run
+        # (see _set_document)
+        self._doc_inputs: Dict[str, Dict[str, str]] = {}
+        
         logger.info(f"Initialized DocGenerationPipeline for {item_type_name}s")
     
     # ============ Core Pipeline Methods ============
@@ -145,15 +195,51 @@ class DocGenerationPipeline(Generic[T]):
         """
         Execute the complete documentation generation pipeline.
         
+        Synchronous entry point; runs run_async() on a new event loop.
+        
         Workflow:
         1. Extract items from source
         2. Analyze and group by documentation status
         3. Generate docs for items without any (optional)
-        4. Process items with Chinese: ZH → EN → Others
-        5. Process items with English only: EN → Others
-        6. Save all documentation files
+        4. Process items with Chinese: ZH → EN
+        5. Translate EN → Others, saving each language once it is final
+        6. Save metadata (and any languages not saved yet)
         7. Execute git operations (optional)
         """
+        return asyncio.run(self.run_async(
+            output_dir,
+            target_langs=target_langs,
+            force_search_code=force_search_code,
+            ignore_miss_usage=ignore_miss_usage,
+            only_meta=only_meta,
+            without_llm=without_llm,
+            limit=limit,
+            auto_commit=auto_commit,
+            create_pr=create_pr,
+            name_filter=name_filter,
+            **kwargs
+        ))
+    
+    async def run_async(
+        self,
+        output_dir: str,
+        target_langs: List[str] = None,
+        force_search_code: bool = False,
+        ignore_miss_usage: bool = True,
+        only_meta: bool = False,
+        without_llm: bool = False,
+        limit: Optional[int] = None,
+        auto_commit: bool = False,
+        create_pr: bool = False,
+        name_filter: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async pipeline: overlaps per-language saving with remaining translations.
+        
+        Blocking stages (extraction, generation, translation, file writes) run
+        in worker threads; see run() for the workflow and arguments.
+        """
         if target_langs is None:
             target_langs = ['en', 'zh']
         
@@ -161,99 +247,121 @@ class DocGenerationPipeline(Generic[T]):
         limit_info = f" | Limit: {limit}" if limit else ""
         logger.info(f"Starting {self.item_type_name} Pipeline | Languages: {', '.join(target_langs)}{limit_info}")
         
+        if not (only_meta or without_llm):
+            self._start_warmup()
+        self._doc_inputs = {}
+        
         # Step 1: Extract items
         logger.info(f"[1/6] Extracting {self.item_type_name}s...")
-        items = self.extractor.extract(force_search_code, ignore_miss_usage, **kwargs)
-        logger.info(f"  ✓ Extracted {len(items)} items")
+        ignore_metas = self._read_ignore_meta()
+        
+        # Filter while streaming, so only the kept items are ever collected
+        def collect_items():
+            kept = []
+            count = 0
+            for it in self.extractor.iter_extract(force_search_code, ignore_miss_usage, **kwargs):
+                count += 1
+                if not is_documentable_item(it):
+                    raise TypeError(f"{type(it).__name__} does not implement DocumentableItem")
+                if (not name_filter or it.name == name_filter) and it.name not in ignore_metas:
+                    kept.append(it)
+            return kept, count
+        
+        items, extracted_count = await asyncio.to_thread(collect_items)
+        logger.info(f"  ✓ Extracted {extracted_count} items")
         
         # Record meta items count
-        stats.record_meta_items(len(items))
+        stats.record_meta_items(extracted_count)
         
-        if name_filter:
-            items = [it for it in items if name_filter == it.name]
-            
-        ignore_metas = self._read_ignore_meta()
         if ignore_metas:
-            items = [it for it in items if it.name not in ignore_metas]
             logger.info(f"  ✓ After ignore meta: {len(items)} items remain")
         
         # Step 1.5: Update item versions (track new if requested, or load from cache)
         if self.version_extractor:
             track_new = kwargs.get('track_version', False)
-            self.version_extractor.update_item_versions(items, track_new=track_new)
+            await asyncio.to_thread(self.version_extractor.update_item_versions, items, track_new=track_new)
         
         # Step 2: Analyze and group
         logger.info(f"[2/6] Analyzing documents...")
-        groups = self.analyze_and_group(items)
-        logger.info(f"  ✓ Groups: zh={len(groups['has_zh'])}, en={len(groups['has_en_only'])}, none={len(groups['has_neither'])}")
+        if kwargs.get('refresh_changed', False) and not (only_meta or without_llm):
+            self._drop_stale_documents(items)
+        groups = self._index_groups(items)
+        logger.info(f"  ✓ Groups: {self._format_groups(groups)}")
         
         if only_meta:
             logger.info("  ⊘ Diff mode: skipping generation and translation")
             return self._build_stats(items, groups, target_langs)
 
+        wanted_langs = frozenset(target_langs)
+        if not without_llm and all(not item.needs_languages(wanted_langs) for item in items):
+            logger.info("  ⊘ All items already have every target language: skipping generation and translation")
+            without_llm = True
+        
         if not without_llm:
+            self._init_caches(
+                use_cache=kwargs.get('use_cache'),
+                cache_ttl=kwargs.get('cache_ttl')
+            )
+            self.batch_protocol = kwargs.get('batch_protocol', DEFAULT_BATCH_PROTOCOL)
+            self.max_tokens_per_batch = kwargs.get('max_tokens_per_batch', DEFAULT_MAX_TOKENS_PER_BATCH)
+            
             # Apply limit to items that need processing
             if limit:
-                needs_processing = groups['has_zh'] + groups['has_en_only'] + groups['has_neither']
-                total_needs_processing = len(needs_processing)
+                total_needs_processing = sum(len(groups[key]) for key in _GROUP_KEYS)
                 
                 if limit < total_needs_processing:
-                    # Take first 'limit' items that need processing
-                    limited_items = []
-                    for item in needs_processing:
-                        if len(limited_items) >= limit:
-                            break
-                        if len(item.documents) < len(target_langs):
-                            limited_items.append(item)
-                    
-                    limited_names = {item.name for item in limited_items}
+                    # Take first 'limit' items that need processing; stops as
+                    # soon as enough indices are found
+                    needs_processing = chain.from_iterable(groups[key] for key in _GROUP_KEYS)
+                    limited = set(islice(
+                        (i for i in needs_processing if items[i].needs_languages(wanted_langs)),
+                        limit
+                    ))
                     
                     # Update groups to only include limited items
-                    groups['has_zh'] = [item for item in groups['has_zh'] if item.name in limited_names]
-                    groups['has_en_only'] = [item for item in groups['has_en_only'] if item.name in limited_names]
-                    groups['has_neither'] = [item for item in groups['has_neither'] if item.name in limited_names]
+                    for key in _GROUP_KEYS:
+                        groups[key] = array('i', (i for i in groups[key] if i in limited))
                     
-                    logger.info(f"  After limit {limit}/{total_needs_processing}: zh={len(groups['has_zh'])}, en={len(groups['has_en_only'])}, none={len(groups['has_neither'])}")
-                    logger.info("  Choose items: " + ", ".join(sorted(limited_names)))
+                    logger.info(f"  After limit {limit}/{total_needs_processing}: {self._format_groups(groups)}")
+                    logger.info("  Choose items: " + ", ".join(sorted(items[i].name for i in limited)))
             # Step 3: Generate for items without docs
             if groups['has_neither']:
                 if self.doc_generator is None:
                     logger.warning(f"[3/6] Skipped: no doc_generator provided")
                 else:
                     logger.info(f"[3/6] Generating {len(groups['has_neither'])} docs...")
-                    self._generate_for_missing(groups['has_neither'])
+                    await asyncio.to_thread(
+                        self._generate_for_missing,
+                        [items[i] for i in groups['has_neither']],
+                        max_workers=kwargs.get('max_workers', DEFAULT_MAX_WORKERS),
+                        batch_size=kwargs.get('generate_batch_size', DEFAULT_GENERATE_BATCH_SIZE)
+                    )
                     # Move to has_en_only group (assuming we generate in English)
                     groups['has_en_only'].extend(groups['has_neither'])
-                    groups['has_neither'] = []
+                    groups['has_neither'] = array('i')
                     logger.info(f"  ✓ Generation completed")
             else:
                 logger.info(f"[3/6] Skipped: all items have one doc at least")
             
-            # Step 4: Process items with Chinese (ZH → EN → Others)
-            if groups['has_zh']:
-                logger.info(f"[4/6] Translating {len(groups['has_zh'])} items (zh→en→others)...")
-                self.process_with_zh(groups['has_zh'], target_langs)
-                logger.info(f"  ✓ Chinese-based translation completed")
-            else:
-                logger.info(f"[4/6] Skipped: no Chinese docs")
-            
-            # Step 5: Process items with English only (EN → Others)
-            if groups['has_en_only']:
-                logger.info(f"[5/6] Translating {len(groups['has_en_only'])} items (en→others)...")
-                self.process_with_en(groups['has_en_only'], target_langs)
-                logger.info(f"  ✓ English-based translation completed")
-            else:
-                logger.info(f"[5/6] Skipped: no English-only docs")
+            # Steps 4-5: translate, saving each language as soon as it is final
+            saved_langs = await self._translate_and_save_async(items, groups, target_langs, output_dir)
+        else:
+            saved_langs = []
         
         # Step 6: Save results
+        self._record_content_hashes(items)
+        remaining_langs = [lang for lang in target_langs if lang not in saved_langs]
         logger.info(f"[6/6] Saving {len(items)} items to {output_dir}...")
-        self.persister.save(items, output_dir, target_langs, **kwargs)
+        if remaining_langs:
+            await asyncio.to_thread(self.persister.save, items, output_dir, remaining_langs, **kwargs)
+        else:
+            await asyncio.to_thread(self.persister.save_meta, items)
         logger.info(f"  ✓ Saved to {output_dir}")
         
         # Step 7: Git operations (optional)
         if auto_commit or create_pr:
             logger.info(f"[7/7] Git operations...")
-            success = self.git_persister.execute(languages=target_langs, auto_commit=auto_commit, create_pr=create_pr)
+            success = await self.git_persister.execute_async(languages=target_langs, auto_commit=auto_commit, create_pr=create_pr)
             logger.info(f"  ✓ Git {'committed' if success else 'skipped'}")
         
         logger.info("=" * 60)
@@ -262,19 +370,178 @@ class DocGenerationPipeline(Generic[T]):
         
         return self._build_stats(items, groups, target_langs)
     
+    def _drop_stale_documents(self, items: List[T]) -> None:
+        """
+        Drop derived docs whose input changed since they were made.
+        
+        contentHashes holds, per derived doc, the hash of the input it was
+        generated or translated from (see _record_content_hashes). A doc is
+        stale when that hash matches none of the item's current inputs
+        (content_hashes) other than itself. A dropped doc is no longer an
+        input, so translations made from it are dropped with it, while docs
+        made from unchanged inputs are kept. Docs without a stored hash were
+        not made by the pipeline (e.g. ZH docs imported from the docs repo)
+        and are never dropped.
+        """
+        stale_count = 0
+        for item in items:
+            stored = getattr(item, 'contentHashes', None)
+            if not stored or not item.documents:
+                continue
+            
+            inputs = item.content_hashes
+            dropped = set()
+            while True:
+                stale = [
+                    lang for lang in item.documents
+                    if lang in stored and lang not in dropped and stored[lang] not in {
+                        digest for key, digest in inputs.items() if key != lang and key not in dropped
+                    }
+                ]
+                if not stale:
+                    break
+                dropped.update(stale)
+            
+            if not dropped:
+                continue
+            item.documents = {lang: doc for lang, doc in item.documents.items() if lang not in dropped}
+            stale_count += 1
+            logger.debug(f"  Source changed: {item.name} (dropped {', '.join(sorted(dropped))})")
+        
+        if stale_count:
+            logger.info(f"  ✓ {stale_count} items changed since their docs were saved")
+    
+    def _record_content_hashes(self, items: List[T]) -> None:
+        """
+        Store the input hash of every derived doc in the item's meta.
+        
+        Docs made in this run take the hash recorded by _set_document();
+        other docs keep their stored hash, and docs that never had one
+        (imported) get none.
+        """
+        for item in items:
+            if not hasattr(item, 'contentHashes'):
+                continue
+            derived = self._doc_inputs.get(item.name)
+            if not derived and not item.contentHashes:
+                continue
+            hashes = dict(item.contentHashes or {})
+            if derived:
+                hashes.update(derived)
+            item.contentHashes = {lang: digest for lang, digest in hashes.items() if lang in item.documents}
+    
+    def _start_warmup(self) -> None:
+        """
+        Warm up the LLM clients in background threads while extraction runs.
+        
+        Any component exposing a warmup() method (TranslationAgent does) gets
+        its connection opened before the first real request.
+        """
+        for component in (self.translation_agent, self.doc_generator):
+            warmup = getattr(component, 'warmup', None)
+            if callable(warmup):
+                threading.Thread(target=warmup, name="llm-warmup", daemon=True).start()
+    
+    async def _translate_and_save_async(
+        self,
+        items: List[T],
+        groups: Dict[str, array],
+        target_langs: List[str],
+        output_dir: str
+    ) -> List[str]:
+        """
+        Run the translation steps and save each language as soon as it is final.
+        
+        EN is final once ZH → EN is done; every other language once its own
+        EN → lang translation is done. Languages translate concurrently and
+        their files are written while the remaining languages are in flight,
+        so each save gets a snapshot of the items (see _snapshot_items())
+        instead of the documents the translation threads are still writing.
+        
+        Args:
+            items: All items to save (including ones that needed no work)
+            groups: Index groups from _index_groups (after generation)
+            target_langs: Target languages
+            output_dir: Output directory for the persister
+        
+        Returns:
+            Languages whose documents have been saved
+        """
+        saved_langs = []
+        save_tasks = []
+        
+        def schedule_save(lang: str) -> None:
+            saved_langs.append(lang)
+            save_tasks.append(asyncio.create_task(
+                asyncio.to_thread(self.persister.save_partial, self._snapshot_items(items), output_dir, [lang])
+            ))
+        
+        # Step 4: Process items with Chinese (ZH → EN)
+        zh_items = [items[i] for i in chain(groups['has_zh_only'], groups['has_zh_and_en'])]
+        missing_en = [item for item in zh_items if 'en' not in self._get_present_langs(item)]
+        if 'en' in target_langs and missing_en:
+            logger.info(f"[4/6] Translating {len(missing_en)} items (zh→en)...")
+            await asyncio.to_thread(self.translate_and_update, missing_en, 'zh', 'en')
+            logger.info(f"  ✓ Chinese-based translation completed")
+        else:
+            logger.info(f"[4/6] Skipped: no Chinese-only docs")
+        if 'en' in target_langs:
+            schedule_save('en')
+        
+        # Step 5: EN → others for every item that now has EN
+        en_items = [
+            item for item in chain(zh_items, (items[i] for i in groups['has_en_only']))
+            if 'en' in self._get_present_langs(item)
+        ]
+        other_langs = [lang for lang in target_langs if lang != 'en']
+        if not other_langs or not en_items:
+            logger.info(f"[5/6] Skipped: nothing to translate from English")
+            await asyncio.gather(*save_tasks)
+            # Languages without translation work are saved by the final step
+            return saved_langs
+        
+        logger.info(f"[5/6] Translating {len(en_items)} items (en→{', '.join(other_langs)})...")
+        
+        async def translate_lang(lang: str) -> None:
+            await asyncio.to_thread(self.translate_and_update, en_items, 'en', lang)
+            schedule_save(lang)
+        
+        await asyncio.gather(*(translate_lang(lang) for lang in other_langs))
+        logger.info(f"  ✓ English-based translation completed")
+        
+        await asyncio.gather(*save_tasks)
+        return saved_langs
+    
+    @staticmethod
+    def _snapshot_items(items: List[T]) -> List[T]:
+        """
+        Shallow copies of items with their own documents dict.
+        
+        Taken on the event loop thread; dict() copies a dict without
+        releasing the GIL, so a copy never sees a half-applied write.
+        """
+        snapshot = []
+        for item in items:
+            copied = copy.copy(item)
+            copied.documents = dict(item.documents)
+            snapshot.append(copied)
+        return snapshot
+    
     # ============ Analysis and Grouping ============
     
     def analyze_and_group(self, items: List[T]) -> Dict[str, List[T]]:
         """
         Analyze and group items by documentation status.
         
-        Groups items into 3 categories:
-        - has_zh: Items with Chinese documentation
+        Groups items into 4 categories:
+        - has_zh_and_en: Items with Chinese and English documentation
+        - has_zh_only: Items with Chinese but no English
         - has_en_only: Items with English but no Chinese
         - has_neither: Items without Chinese or English
         
         This grouping determines the translation strategy:
-        - has_zh: ZH → EN → Others
+        - has_zh_and_en: EN → Others (EN is the pivot)
+        - has_zh_only: ZH → EN → Others
         - has_en_only: EN → Others
         - has_neither: Generate → Translate
         
@@ -282,138 +549,196 @@ class DocGenerationPipeline(Generic[T]):
             items: List of items to analyze
         
         Returns:
-            Dict with keys 'has_zh', 'has_en_only', 'has_neither'
+            Dict with keys 'has_zh_and_en', 'has_zh_only', 'has_en_only', 'has_neither'
         """
-        groups = {
-            'has_zh': [],
-            'has_en_only': [],
-            'has_neither': []
-        }
+        groups = self._index_groups(items)
+        return {key: [items[i] for i in indices] for key, indices in groups.items()}
+    
+    def _index_groups(self, items: List[T]) -> Dict[str, array]:
+        """
+        Group items as in analyze_and_group(), but as int index arrays into items.
         
-        for item in items:
-            # Clean up empty docs
-            item.documents = {k: v for k, v in item.documents.items() if v and v.strip() != ""}
-            
-            docs = item.documents
-            has_zh = 'zh' in docs and docs['zh'].strip() != ""
-            has_en = 'en' in docs and docs['en'].strip() != ""
+        The pipeline narrows and merges groups (limit, generation) without
+        building new lists of item references.
+        """
+        groups = {key: array('i') for key in _GROUP_KEYS}
+        
+        self._present_langs = {}
+        
+        for i, item in enumerate(items):
+            # Extractors already drop empty docs; this only rebuilds the dict
+            # for items that did not come through iter_extract()
+            normalize_documents(item)
+            present = set(item.documents)
+            self._present_langs[item.name] = present
             
-            if has_zh:
-                groups['has_zh'].append(item)
-            elif has_en:
-                groups['has_en_only'].append(item)
+            if 'zh' in present:
+                groups['has_zh_and_en' if 'en' in present else 'has_zh_only'].append(i)
+            elif 'en' in present:
+                groups['has_en_only'].append(i)
             else:
-                groups['has_neither'].append(item)
+                groups['has_neither'].append(i)
         
         logger.debug(f"Grouped {self.item_type_name}s: "
-                    f"{len(groups['has_zh'])} with ZH, "
+                    f"{len(groups['has_zh_and_en'])} with ZH and EN, "
+                    f"{len(groups['has_zh_only'])} with ZH only, "
                     f"{len(groups['has_en_only'])} with EN only, "
                     f"{len(groups['has_neither'])} with neither")
         
         return groups
     
+    @staticmethod
+    def _format_groups(groups: Dict[str, Any]) -> str:
+        """One-line group summary for logging"""
+        return (f"zh+en={len(groups['has_zh_and_en'])}, zh={len(groups['has_zh_only'])}, "
+                f"en={len(groups['has_en_only'])}, none={len(groups['has_neither'])}")
+    
+    def _get_present_langs(self, item: T) -> set:
+        """Languages the item has a non-empty doc for (computed once per item)"""
+        present = self._present_langs.get(item.name)
+        if present is None:
+            present = {k for k, v in item.documents.items() if v and v.strip()}
+            self._present_langs[item.name] = present
+        return present
+    
+    def _set_document(self, item: T, lang: str, doc: str, source: Optional[str] = None) -> None:
+        """
+        Store a derived doc on the item and keep the language-presence index in sync.
+        
+        For items tracking contentHashes, the hash of the doc's input (the
+        doc in language source, or the item's source fields for None) is
+        kept for _record_content_hashes().
+        """
+        if hasattr(item, 'contentHashes'):
+            self._doc_inputs.setdefault(item.name, {})[lang] = item.input_hash(source)
+        item.documents[lang] = doc
+        if doc and doc.strip():
+            self._get_present_langs(item).add(lang)
+    
     # ============ Document Generation ============
     
-    def _generate_for_missing(self, items: List[T]) -> None:
+    def _generate_for_missing(
+        self,
+        items: List[T],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_size: int = DEFAULT_GENERATE_BATCH_SIZE
+    ) -> None:
         """
         Generate documentation for items without any docs.
         
+        Generation calls are network-bound, so they are dispatched concurrently
+        on a thread pool; each item only writes its own documents dict.
+        Generators that implement generate_many() get chunks of batch_size
+        items per call instead of one item per call.
+        
         Args:
             items: Items without documentation
+            max_workers: Maximum number of concurrent generation calls
+            batch_size: Items per generate_many() call, for batching generators
         """
         if not self.doc_generator:
             logger.warning("Cannot generate: no doc_generator provided")
             return
         
+        if self._supports_batch_generation():
+            units = [items[i:i + batch_size] for i in range(0, len(items), max(1, batch_size))]
+        else:
+            units = [[item] for item in items]
+        
         total = len(items)
+        done = 0
         generated_count = 0
         
-        for i, item in enumerate(items, 1):
-            logger.info(f"  Generating doc {i}/{total}: {item.name}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(units)))) as executor:
+            futures = {executor.submit(self._generate_unit, unit): unit for unit in units}
             
-            try:
-                doc = self.doc_generator.generate(item)
-                item.documents['en'] = doc  # Default to English
-                generated_count += 1
-            except Exception as e:
-                logger.error(f"  Failed to generate doc for {item.name}: {e}")
-                # Add fallback doc
-                item.documents['en'] = f"## {item.name}\n\nDocumentation generation failed."
+            for future in as_completed(futures):
+                unit = futures[future]
+                try:
+                    docs = future.result()
+                except Exception as e:
+                    logger.error(f"  Failed to generate doc for {', '.join(item.name for item in unit)}: {e}")
+                    docs = None
+                
+                for j, item in enumerate(unit):
+                    done += 1
+                    if docs is None:
+                        # Add fallback doc
+                        self._set_document(item, 'en', f"## {item.name}\n\nDocumentation generation failed.")
+                        if item.name in self._doc_inputs:
+                            # Matches no input: the next refresh_changed run generates it again
+                            self._doc_inputs[item.name]['en'] = ''
+                        continue
+                    self._set_document(item, 'en', docs[j])  # Default to English
+                    generated_count += 1
+                    logger.info(f"  Generated doc {done}/{total}: {item.name}")
         
         logger.info(f"  Generated {generated_count}/{total} new documents")
     
-    # ============ Translation Processing ============
+    def _supports_batch_generation(self) -> bool:
+        """Whether the generator overrides the default per-item generate_many()"""
+        impl = getattr(type(self.doc_generator), 'generate_many', None)
+        return impl is not None and impl is not DocGenerator.generate_many
     
-    def process_with_zh(self, items: List[T], target_langs: List[str]) -> None:
+    def _generate_unit(self, items: List[T], max_retries: int = DEFAULT_MAX_RETRIES) -> List[str]:
         """
-        Process items with Chinese documentation.
-        
-        Translation path: ZH → EN → Other languages
+        Generate docs for one unit of work, retrying with exponential backoff.
         
-        Steps:
-        1. Translate ZH → EN (if EN is missing)
-        2. Translate EN → other target languages
+        Cached docs are served first; only the misses reach the generator, via
+        generate_many() for batching generators and generate() otherwise.
+        Absorbs transient provider errors (rate limits, 5xx) before giving up.
         
         Args:
-            items: Items with Chinese documentation
-            target_langs: Target languages to generate
-        """
-        if not items:
-            return
-        
-        logger.debug(f"[Processing {len(items)} items with Chinese docs]")
+            items: Items to document (a single item unless batching)
+            max_retries: Number of retries after the first attempt
         
-        # Step 1: Ensure all items have English (ZH → EN)
-        if 'en' in target_langs:
-            self.translate_and_update(
-                items=items,
-                source_lang='zh',
-                target_lang='en'
-            )
-        
-        # Step 2: Translate EN → other languages
-        for lang in target_langs:
-            if lang in ['zh', 'en']:
-                continue  # Skip Chinese and English
-            
-            self.translate_and_update(
-                items=items,
-                source_lang='en',
-                target_lang=lang
-            )
-    
-    def process_with_en(self, items: List[T], target_langs: List[str]) -> None:
+        Returns:
+            Generated documents, in item order
         """
-        Process items with English documentation (but no Chinese).
+        docs: List[Optional[str]] = [None] * len(items)
+        cache_keys: Dict[int, str] = {}
+        if self.docgen_cache:
+            for i, item in enumerate(items):
+                cache_keys[i] = self.doc_generator.cache_key(item)
+                docs[i] = self.docgen_cache.get(cache_keys[i])
+                if docs[i] is not None:
+                    logger.debug(f"  Cache hit for {item.name}")
         
-        Translation path: EN → All other languages
+        missing = [i for i, doc in enumerate(docs) if doc is None]
+        if not missing:
+            return docs
         
-        Args:
-            items: Items with English but no Chinese
-            target_langs: Target languages to generate
-        """
-        if not items:
-            return
-        
-        logger.debug(f"[Processing {len(items)} items with English docs only]")
+        misses = [items[i] for i in missing]
+        for attempt in range(max_retries + 1):
+            try:
+                if len(misses) == 1 and not self._supports_batch_generation():
+                    generated = [self.doc_generator.generate(misses[0])]
+                else:
+                    generated = self.doc_generator.generate_many(misses)
+                if len(generated) != len(misses):
+                    raise ValueError(f"generate_many returned {len(generated)} docs for {len(misses)} items")
+                break
+            except Exception as e:
+                if attempt == max_retries:
+                    raise
+                delay = 2 ** attempt
+                logger.warning(f"  Generation failed for {', '.join(item.name for item in misses)} ({e}), retrying in {delay}s")
+                time.sleep(delay)
         
-        # Translate EN → all other target languages
-        for lang in target_langs:
-            if lang == 'en':
-                continue  # Already have English
-            
-            self.translate_and_update(
-                items=items,
-                source_lang='en',
-                target_lang=lang
-            )
+        for i, doc in zip(missing, generated):
+            docs[i] = doc
+            if i in cache_keys:
+                self.docgen_cache.set(cache_keys[i], doc)
+        return docs
+    
+    # ============ Translation Processing ============
     
     def translate_and_update(
         self,
         items: List[T],
         source_lang: str,
         target_lang: str,
-        batch_size: int = DEFAULT_BATCH_SIZE
+        batch_size: Optional[int] = None
     ) -> None:
         """
         Batch translate documents and update items in place.
@@ -425,13 +750,13 @@ class DocGenerationPipeline(Generic[T]):
             items: List of items to translate
             source_lang: Source language code (e.g., 'en', 'zh')
             target_lang: Target language code (e.g., 'ja', 'zh')
-            batch_size: Number of items per batch
+            batch_size: Optional cap on items per batch (batches are otherwise
+                sized by max_tokens_per_batch)
         """
         # Filter items that need translation
         items_need_translation = [
             item for item in items
-            if target_lang not in item.documents
-            or not item.documents[target_lang]
+            if target_lang not in self._get_present_langs(item)
         ]
         
         if not items_need_translation:
@@ -439,38 +764,116 @@ class DocGenerationPipeline(Generic[T]):
             return
         
         logger.debug(f"  Translating {len(items_need_translation)} docs: {source_lang} → {target_lang}")
+        stats.record_translated_items(item.name for item in items_need_translation)
+        
+        # Serve unchanged source docs from the cache
+        cache_keys = {}
+        if self.translation_cache:
+            items_to_translate = []
+            for item in items_need_translation:
+                key = ResponseCache.make_key(
+                    item.documents[source_lang], target_lang,
+                    self.translation_agent.PROMPT_VERSION, self.translation_agent.model_name
+                )
+                cached = self.translation_cache.get(key)
+                if cached is not None:
+                    self._set_document(item, target_lang, cached, source_lang)
+                else:
+                    cache_keys[item.name] = key
+                    items_to_translate.append(item)
+            
+            cache_hits = len(items_need_translation) - len(items_to_translate)
+            if cache_hits:
+                logger.info(f"  ✓ {cache_hits} {target_lang} documents served from cache")
+            items_need_translation = items_to_translate
+            if not items_need_translation:
+                return
+        
+        # Extract source language documents, translating each distinct doc once
+        source_docs = []
+        doc_positions: Dict[str, int] = {}
+        item_positions = []
         for item in items_need_translation:
-            stats.record_translated_item(item.name)
+            doc = item.documents[source_lang]
+            pos = doc_positions.get(doc)
+            if pos is None:
+                pos = doc_positions[doc] = len(source_docs)
+                source_docs.append(doc)
+            item_positions.append(pos)
         
-        # Extract source language documents
-        source_docs = [item.documents[source_lang] for item in items_need_translation]
+        duplicates = len(items_need_translation) - len(source_docs)
+        if duplicates:
+            logger.debug(f"  Skipping {duplicates} duplicate source docs")
         
         # Batch translate with separator method
         try:
             translated_docs = self._translate_with_separators(
                 docs=source_docs,
                 target_lang=target_lang,
-                batch_size=batch_size
+                batch_size=batch_size,
+                max_tokens_per_batch=self.max_tokens_per_batch
             )
             
-            # Update item documents
-            for item, translated_doc in zip(items_need_translation, translated_docs):
-                item.documents[target_lang] = translated_doc
-
-            logger.info(f"  ✓ Updated {len(translated_docs)} {self.item_type_name}s with {target_lang} documents")
+            # Update item documents, fanning each translation out to its duplicates
+            cached_positions = set()
+            updated = 0
+            for item, pos in zip(items_need_translation, item_positions):
+                translated_doc = translated_docs[pos]
+                # Docs whose batch could not be split stay untranslated
+                if translated_doc is None:
+                    continue
+                self._set_document(item, target_lang, translated_doc, source_lang)
+                updated += 1
+                if item.name in cache_keys and pos not in cached_positions and translated_doc:
+                    self.translation_cache.set(cache_keys[item.name], translated_doc)
+                    cached_positions.add(pos)
+            
+            logger.info(f"  ✓ Updated {updated} {self.item_type_name}s with {target_lang} documents")
+            if updated < len(items_need_translation):
+                logger.warning(f"  {len(items_need_translation) - updated} {target_lang} translations failed, left untranslated")
         except Exception as e:
             logger.error(f"  Translation failed for {source_lang} → {target_lang}: {e}")
             logger.warning(f"  Skipping translation for {len(items_need_translation)} items")
             # Do not update documents, just skip this translation
     
+    # ============ Response Cache ============
+    
+    def _init_caches(self, use_cache: Optional[bool] = None, cache_ttl: Optional[float] = None) -> None:
+        """
+        Set up on-disk caches for translations and generated docs.
+        
+        Translations are keyed by (source doc, target language, prompt version,
+        model); generated docs by DocGenerator.cache_key(), so a changed item,
+        prompt or model misses the cache and is generated again.
+        
+        Args:
+            use_cache: Disable to always call the LLM (None = config.LLM_CACHE)
+            cache_ttl: Seconds a cache entry stays valid
+                (None = config.LLM_CACHE_TTL; 0 there means never expires)
+        """
+        from ..config import config
+        if use_cache is None:
+            use_cache = config.LLM_CACHE
+        if cache_ttl is None:
+            cache_ttl = config.LLM_CACHE_TTL or None
+        if not use_cache:
+            self.translation_cache = None
+            self.docgen_cache = None
+            return
+        
+        meta_dir = Path(config.META_DIR)
+        self.translation_cache = ResponseCache(meta_dir / 'translation_cache', ttl=cache_ttl)
+        self.docgen_cache = ResponseCache(meta_dir / 'docgen_cache', ttl=cache_ttl)
+    
     # ============ Batch Translation with Separators ============
     
     def _translate_with_separators(
         self,
         docs: List[str],
         target_lang: str,
-        batch_size: int = DEFAULT_BATCH_SIZE
-    ) -> List[str]:
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: int = DEFAULT_MAX_TOKENS_PER_BATCH
+    ) -> List[Optional[str]]:
         """
         Translate multiple docs using separator method for consistency.
         
@@ -483,82 +886,234 @@ class DocGenerationPipeline(Generic[T]):
         Args:
             docs: List of documents to translate
             target_lang: Target language code
-            batch_size: Maximum number of docs per batch
+            batch_size: Optional cap on docs per batch
+            max_tokens_per_batch: Estimated token budget per batch
         
         Returns:
-            List of translated documents (same order as input)
+            List of translated documents (same order as input), None for docs
+            that could not be translated
         """
         if not docs:
             return []
         
-        # If docs count is within batch size, process as single batch
-        if len(docs) <= batch_size:
-            return self._translate_single_batch(docs, target_lang)
+        batches = self._pack_batches(docs, max_tokens_per_batch, batch_size)
+        # Format the separators once, sized for the largest batch
+        separators = self._make_separators(max(map(len, batches)))
         
-        # Split into batches
-        logger.debug(f"Processing {len(docs)} docs in batches of {batch_size}")
-        all_translated = []
+        # Common case: everything fits in one batch
+        if len(batches) == 1:
+            return self._translate_single_batch(batches[0], target_lang, separators)
+        
+        # Multiple batches: dispatch them concurrently
+        return asyncio.run(self._translate_with_separators_async(batches, target_lang, separators=separators))
+    
+    @staticmethod
+    def _make_separators(count: int) -> List[str]:
+        """Separators for batch positions 0..count-1"""
+        return [DEFAULT_SEPARATOR.format(index=i) for i in range(count)]
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Cheap token estimate: ~4 ASCII chars per token, one token per other char.
+        
+        Counting non-ASCII chars individually keeps Chinese/Japanese source
+        docs from being underestimated by the usual len(text) // 4.
+        """
+        ascii_chars = len(text.encode('ascii', 'ignore'))
+        return ascii_chars // 4 + (len(text) - ascii_chars)
+    
+    def _pack_batches(
+        self,
+        docs: List[str],
+        max_tokens_per_batch: int,
+        batch_size: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Greedily pack consecutive docs into batches within the token budget.
+        
+        A doc that exceeds the budget on its own is sent as a single-doc batch.
         
-        for i in range(0, len(docs), batch_size):
-            batch = docs[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(docs) + batch_size - 1) // batch_size
+        Args:
+            docs: Documents in translation order
+            max_tokens_per_batch: Estimated token budget per batch
+            batch_size: Optional cap on docs per batch
+        
+        Returns:
+            Batches of docs, preserving input order
+        """
+        batches = []
+        current = []
+        current_tokens = 0
+        
+        for doc in docs:
+            tokens = self._estimate_tokens(doc) + _SEP_TOKENS
             
-            logger.debug(f"  Batch {batch_num}/{total_batches} ({len(batch)} docs)")
-            translated_batch = self._translate_single_batch(batch, target_lang)
-            all_translated.extend(translated_batch)
+            if tokens > max_tokens_per_batch:
+                logger.warning(f"Doc of ~{tokens} tokens exceeds batch budget {max_tokens_per_batch}, translating alone")
+                if current:
+                    batches.append(current)
+                    current, current_tokens = [], 0
+                batches.append([doc])
+                continue
+            
+            if current and (current_tokens + tokens > max_tokens_per_batch
+                            or (batch_size and len(current) >= batch_size)):
+                batches.append(current)
+                current, current_tokens = [], 0
+            
+            current.append(doc)
+            current_tokens += tokens
         
+        if current:
+            batches.append(current)
+        return batches
+    
+    async def _translate_with_separators_async(
+        self,
+        batches: List[List[str]],
+        target_lang: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        separators: Optional[List[str]] = None
+    ) -> List[Optional[str]]:
+        """
+        Translate batches with up to max_concurrency LLM calls in flight.
+        
+        Args:
+            batches: Batches of documents (see _pack_batches)
+            target_lang: Target language code
+            max_concurrency: Maximum number of batches translated at once
+            separators: Preformatted separators, at least as many as the largest batch
+        
+        Returns:
+            List of translated documents (same order as input), None for docs
+            that could not be translated
+        """
+        total_batches = len(batches)
+        if separators is None:
+            separators = self._make_separators(max(map(len, batches)))
+        logger.debug(f"Processing {sum(map(len, batches))} docs in {total_batches} batches")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_batch(batch_num: int, batch: List[str]) -> List[Optional[str]]:
+            async with semaphore:
+                logger.debug(f"  Batch {batch_num}/{total_batches} ({len(batch)} docs)")
+                return await self._translate_single_batch_async(batch, target_lang, separators)
+        
+        # gather() returns results in submission order
+        results = await asyncio.gather(
+            *(run_batch(num, batch) for num, batch in enumerate(batches, 1))
+        )
+        
+        all_translated = []
+        for translated_batch in results:
+            all_translated.extend(translated_batch)
         return all_translated
     
-    def _translate_single_batch(self, docs: List[str], target_lang: str) -> List[str]:
+    def _translate_single_batch(
+        self,
+        docs: List[str],
+        target_lang: str,
+        separators: Optional[List[str]] = None
+    ) -> List[Optional[str]]:
         """
         Translate a single batch of documents.
         
+        A reply that cannot be split back into one doc per source doc is
+        retried as two half batches; a single doc that still fails comes
+        back as None rather than as its untranslated source.
+        
         Args:
             docs: List of documents (within batch size limit)
             target_lang: Target language code
+            separators: Preformatted separators (default: formatted on demand)
         
         Returns:
-            List of translated documents
+            List of translated documents, None for docs that failed
         """
         if not docs:
             return []
         
-        # Combine with separators
-        separators = [DEFAULT_SEPARATOR.format(index=i) for i in range(len(docs))]
-        combined_text = ""
-        for doc, sep in zip(docs, separators):
-            combined_text += doc + "\n\n" + sep + "\n\n"
+        if self.batch_protocol == 'json':
+            try:
+                return self.translation_agent.translate_json(docs, target_lang)
+            except ValueError as e:
+                logger.warning(f"JSON batch translation failed ({e}), falling back to separators")
         
-        # Translate combined text
         translated_combined = self.translation_agent.translate(
-            text=combined_text,
-            target_lang=target_lang
+            text=self._combine_batch(docs, separators),
+            target_lang=target_lang,
+            preserve_markers=True
         )
+        try:
+            return self._split_batch(translated_combined, docs)
+        except ValueError as e:
+            if len(docs) == 1:
+                logger.warning(f"Translation failed ({e}), leaving the doc untranslated")
+                return [None]
+            logger.warning(f"{e}, retrying as two batches")
+            half = len(docs) // 2
+            return (self._translate_single_batch(docs[:half], target_lang, separators)
+                    + self._translate_single_batch(docs[half:], target_lang, separators))
+    
+    async def _translate_single_batch_async(
+        self,
+        docs: List[str],
+        target_lang: str,
+        separators: Optional[List[str]] = None
+    ) -> List[Optional[str]]:
+        """Async variant of _translate_single_batch()"""
+        if not docs:
+            return []
         
-        # Split by separators
-        translated_docs = []
-        parts = translated_combined.split(DEFAULT_SEPARATOR.format(index=0))
+        if self.batch_protocol == 'json':
+            try:
+                return await self.translation_agent.atranslate_json(docs, target_lang)
+            except ValueError as e:
+                logger.warning(f"JSON batch translation failed ({e}), falling back to separators")
         
-        if len(parts) > 1:
-            translated_docs.append(parts[0].strip())
-            
-            for i in range(1, len(docs)):
-                sep = DEFAULT_SEPARATOR.format(index=i)
-                parts = parts[i].split(sep) if i < len(parts) else ['']
-                translated_docs.append(parts[0].strip())
-        else:
-            # Fallback: split by double newlines
-            logger.warning("Separator split failed, using fallback method")
-            translated_docs = [doc.strip() for doc in translated_combined.split('\n\n\n') if doc.strip()]
+        translated_combined = await self.translation_agent.atranslate(
+            text=self._combine_batch(docs, separators),
+            target_lang=target_lang,
+            preserve_markers=True
+        )
+        try:
+            return self._split_batch(translated_combined, docs)
+        except ValueError as e:
+            if len(docs) == 1:
+                logger.warning(f"Translation failed ({e}), leaving the doc untranslated")
+                return [None]
+            logger.warning(f"{e}, retrying as two batches")
+            half = len(docs) // 2
+            first, second = await asyncio.gather(
+                self._translate_single_batch_async(docs[:half], target_lang, separators),
+                self._translate_single_batch_async(docs[half:], target_lang, separators)
+            )
+            return first + second
+    
+    def _combine_batch(self, docs: List[str], separators: Optional[List[str]] = None) -> str:
+        """Join docs into one text, each followed by its separator"""
+        if separators is None:
+            separators = self._make_separators(len(docs))
+        return "".join(f"{doc}\n\n{sep}\n\n" for doc, sep in zip(docs, separators))
+    
+    def _split_batch(self, translated_combined: str, docs: List[str]) -> List[str]:
+        """
+        Split a translated batch back into one document per source doc.
+        
+        Raises:
+            ValueError: If the reply does not hold exactly one doc per source doc
+        """
+        # One pass over the reply: each doc is followed by its separator, so
+        # N docs yield N+1 parts with an empty tail
+        translated_docs = [part.strip() for part in _SEP_RE.split(translated_combined)]
+        if len(translated_docs) == len(docs) + 1 and not translated_docs[-1]:
+            translated_docs.pop()
         
-        # Validate count
+        # Validate count: padding with source docs would save them as translations
         if len(translated_docs) != len(docs):
-            logger.warning(f"Translation count mismatch: expected {len(docs)}, got {len(translated_docs)}")
-            # Pad or trim
-            while len(translated_docs) < len(docs):
-                translated_docs.append(docs[len(translated_docs)])
-            translated_docs = translated_docs[:len(docs)]
+            raise ValueError(f"Translation count mismatch: expected {len(docs)}, got {len(translated_docs)}")
         
         return translated_docs
     
@@ -567,14 +1122,15 @@ class DocGenerationPipeline(Generic[T]):
     def _build_stats(
         self,
         items: List[T],
-        groups: Dict[str, List[T]],
+        groups: Dict[str, Any],
         target_langs: List[str]
     ) -> Dict[str, Any]:
         """Build statistics dictionary."""
         return {
             'total': len(items),
             'processed': {
-                'has_zh': len(groups['has_zh']),
+                'has_zh_and_en': len(groups['has_zh_and_en']),
+                'has_zh_only': len(groups['has_zh_only']),
                 'has_en_only': len(groups['has_en_only']),
                 'generated': len(groups['has_neither'])
             },
@@ -582,16 +1138,26 @@ class DocGenerationPipeline(Generic[T]):
             'item_type': self.item_type_name
         }
 
-    def _read_ignore_meta(self) -> List[str]:
+    def _read_ignore_meta(self) -> FrozenSet[str]:
         from ..config import config
         ignore_file = Path(config.META_DIR) / 'ignore.meta'
-        if not ignore_file.exists():
-            return []
-        
-        with ignore_file.open('r', encoding='utf-8') as f:
-            ignores = [line.strip() for line in f if line.strip()]
+        try:
+            mtime_ns = ignore_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
         
-        logger.info(f"Loaded {len(ignores)} ignore patterns from {ignore_file}")
-        return ignores
+        # Keyed by mtime, so the file is only re-read after it changes
+        return _load_ignore_meta(str(ignore_file), mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_ignore_meta(path: str, mtime_ns: int) -> FrozenSet[str]:
+    """Parse ignore.meta into a frozenset of item names (cached per mtime)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        ignores = frozenset(name for name in (line.strip() for line in f) if name)
+    
+    logger.info(f"Loaded {len(ignores)} ignore patterns from {path}")
+    return ignores
 
-__all__ = ['DocGenerationPipeline', 'DEFAULT_SEPARATOR', 'DEFAULT_BATCH_SIZE']
+__all__ = ['DocGenerationPipeline', 'DEFAULT_SEPARATOR', 'DEFAULT_BATCH_SIZE', 'DEFAULT_MAX_WORKERS', 'DEFAULT_BATCH_PROTOCOL',
+           'DEFAULT_MAX_TOKENS_PER_BATCH']
@@ -24,18 +24,35 @@ explicit inheritance.
 Design Philosophy:
 - Protocol over Inheritance: Leverage Python's structural subtyping
 - Minimal Contract: Only require essential fields and methods
-- Type Safety: Use @runtime_checkable for both static and runtime validation
+- Type Safety: Static typing via the protocols; runtime item checks use
+  core.abcs.is_documentable_item() rather than isinstance on a Protocol
 - Extensibility: Easy to add new document types without modifying core code
+
+Annotations are postponed (PEP 563), so the many subscripted types in
+signatures are not built when the module is imported.
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from operator import attrgetter, methodcaller
 from pathlib import Path
-from typing import Protocol, TypeVar, Dict, Any, List, Optional, runtime_checkable
+from string import Template
+from typing import Protocol, TypeVar, Callable, ClassVar, Dict, Any, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, runtime_checkable
 from abc import abstractmethod
 from loguru import logger
 
-@runtime_checkable
+from docsagent import config
+from . import json_io
+from .cache import PICKLE_PROTOCOL, cache_path_for, read_cache, source_digest, write_atomic, write_cache
+from .serialize import is_packed, pack_items, unpack_rows
+
 class DocumentableItem(Protocol):
     """
     Protocol for any item that can be documented in multiple languages.
@@ -47,11 +64,18 @@ class DocumentableItem(Protocol):
     - name: Unique identifier for the item
     - documents: Dict mapping language codes to documentation content
     - to_dict/from_dict: Serialization support for persistence
+    - FIELDS/to_tuple/from_tuple: Positional serialization for meta files
+    - content_hashes: Per-language hash of the inputs each doc derives from
     
     Example implementations:
     - ConfigItem: FE/BE configuration parameters
     - FunctionItem: Function signatures and docstrings
     - VariableItem: Session/system variables
+    
+    Implementations held in bulk (meta lists of thousands of items) should
+    be slotted, e.g. @dataclass(slots=True) with mixins declaring
+    __slots__ = (), so items carry no per-instance __dict__; check with
+    core.abcs.assert_slotted().
     """
     
     @property
@@ -91,6 +115,33 @@ class DocumentableItem(Protocol):
                 'en': 'Configuration description...',
                 'ja': '設定項目の説明...'
             }
+            
+        Note:
+            Build the dict with interned keys ({sys.intern(k): v ...}, see
+            core.intern), so all items share the language code strings.
+        """
+        ...
+    
+    @property
+    def documents_view(self) -> Mapping[str, str]:
+        """
+        Read-only view of documents, for callers that only inspect them.
+        
+        Returns:
+            Mapping[str, str]: Language code -> documentation content
+        """
+        ...
+    
+    def needs_languages(self, targets: FrozenSet[str]) -> FrozenSet[str]:
+        """
+        Target languages this item has no document for yet.
+        
+        Args:
+            targets: Wanted language codes; pass one frozenset shared by all
+                items rather than building a set per item
+        
+        Returns:
+            FrozenSet[str]: Languages in targets missing from documents
         """
         ...
         
@@ -117,6 +168,36 @@ class DocumentableItem(Protocol):
         """
         ...
     
+    @property
+    def content_hashes(self) -> Dict[str, str]:
+        """
+        Hash of every input a derived document can be made from.
+        
+        A generated doc derives from the item's own source fields (key
+        SOURCE_INPUT), a translation from the doc of another language (key:
+        that language). The pipeline stores the hash of the input each
+        derived doc was made from (contentHashes); on a later run a doc whose
+        stored hash matches no current input is stale, so only docs whose
+        inputs changed are regenerated or re-translated.
+        
+        Returns:
+            Dict[str, str]: SOURCE_INPUT or language code -> hex digest
+        """
+        ...
+    
+    def input_hash(self, source: Optional[str] = None) -> str:
+        """
+        One entry of content_hashes, without hashing the other inputs.
+        
+        Args:
+            source: Language of the doc a translation is made from, or None
+                for the item's source fields
+        
+        Returns:
+            str: Hex digest
+        """
+        ...
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Serialize the item to a dictionary.
@@ -131,7 +212,9 @@ class DocumentableItem(Protocol):
             
         Note:
             Should include all fields needed to reconstruct the item
-            via from_dict()
+            via from_dict(). Values must be JSON primitives, lists/dicts
+            of them, or datetime/Path/Enum values (see core.json_io);
+            anything else fails to persist.
         """
         ...
     
@@ -155,11 +238,175 @@ class DocumentableItem(Protocol):
             Should be the inverse of to_dict()
         """
         ...
+    
+    # Positional field order; dataclasses generate it from their fields
+    __match_args__: ClassVar[Tuple[str, ...]]
+    
+    # Attribute names in to_tuple() order, shared by every item of the class
+    FIELDS: ClassVar[Tuple[str, ...]]
+    
+    # Attribute persisters group pages by (e.g. 'catalog', 'scope')
+    CATEGORY_FIELD: ClassVar[str]
+    
+    def to_tuple(self) -> tuple:
+        """
+        Serialize the item as a positional row, ordered like FIELDS.
+        
+        Used for packed meta files (see core.serialize), where field names
+        are written once per file instead of once per item.
+        
+        Returns:
+            tuple: Field values in FIELDS order
+        """
+        ...
+    
+    @classmethod
+    def from_tuple(cls, row: tuple) -> 'DocumentableItem':
+        """
+        Deserialize the item from a positional row.
+        
+        Args:
+            row: Field values in FIELDS order
+            
+        Returns:
+            DocumentableItem: Reconstructed item instance
+            
+        Note:
+            Should be the inverse of to_tuple(). When FIELDS follows
+            __match_args__, call cls(*row) rather than building a keyword
+            dict (see core.serialize.FieldsTupleMixin).
+        """
+        ...
 
 
 # Type variable bound to DocumentableItem for generic implementations
 T = TypeVar('T', bound=DocumentableItem)
 
+# Concurrent file writes in DocPersister.save_batch()
+DEFAULT_WRITE_WORKERS = 32
+
+# Code paths walked at once in ItemExtractor._get_source_code_paths()
+DEFAULT_SCAN_WORKERS = 8
+
+
+def normalize_documents(item: DocumentableItem) -> None:
+    """
+    Drop empty or whitespace-only docs, so a present language key always
+    means real content. The dict is only rebuilt when something is empty.
+    """
+    docs = item.documents
+    if any(not doc or not doc.strip() for doc in docs.values()):
+        item.documents = {lang: doc for lang, doc in docs.items() if doc and doc.strip()}
+
+
+# Key of the item's own source fields in content_hashes
+SOURCE_INPUT = 'source'
+
+
+class ContentHashMixin:
+    """
+    Default content_hashes and input_hash for items.
+    
+    Generated docs derive from the item's source fields (everything except
+    SOURCE_EXCLUDE), translations from the doc they were translated from.
+    """
+    
+    # Fields that are outputs of the pipeline or move without changing meaning
+    SOURCE_EXCLUDE: ClassVar[FrozenSet[str]] = frozenset({
+        'documents', 'version', 'useLocations', 'testCases', 'define', 'catalog', 'contentHashes'
+    })
+    
+    __slots__ = ()
+    
+    @staticmethod
+    def _digest(*parts: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def source_signature(self) -> str:
+        """Stable string over the source fields the EN doc is generated from"""
+        names = getattr(self, 'FIELDS', None) or sorted(self.to_dict())
+        return '\0'.join(
+            f"{name}={getattr(self, name)!r}" for name in names if name not in self.SOURCE_EXCLUDE
+        )
+    
+    @property
+    def content_hashes(self) -> Dict[str, str]:
+        hashes = {SOURCE_INPUT: self.input_hash()}
+        for lang, doc in self.documents.items():
+            hashes[lang] = self._digest(self.name, doc)
+        return hashes
+    
+    def input_hash(self, source: Optional[str] = None) -> str:
+        if source is None:
+            return self._digest(self.name, self.source_signature())
+        return self._digest(self.name, self.documents[source])
+
+
+# Bound once, so serializing a list skips the per-item method lookup
+_to_dict = methodcaller('to_dict')
+
+# Directory names excluded from source scans (compared lower-cased)
+_TEST_DIR_NAMES = frozenset({'test', 'tests'})
+
+
+def _walk_source_tree(root: str, prune_test_dirs: bool = True) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (name, path) of the files under root.
+    
+    Walks top-down in os.walk order with os.scandir, without following
+    directory symlinks; unreadable directories are skipped.
+    
+    Args:
+        root: Directory to walk
+        prune_test_dirs: Do not descend into directories named in
+            _TEST_DIR_NAMES
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir():
+                        if not entry.is_symlink() and not (prune_test_dirs and name.lower() in _TEST_DIR_NAMES):
+                            subdirs.append(entry.path)
+                        continue
+                    yield name, entry.path
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _file_holds(path: Path, content: bytes) -> bool:
+    """Whether path exists with exactly content (size checked before reading)"""
+    try:
+        if path.stat().st_size != len(content):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def load_template(path: Path) -> Optional[Template]:
+    """
+    Read and compile a docs page template once per process.
+    
+    Returns:
+        Template, or None if the file does not exist
+    """
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
 
 @runtime_checkable
 class ItemExtractor(Protocol[T]):
@@ -227,14 +474,19 @@ class ItemExtractor(Protocol[T]):
         
         # Filter items without usage (if configured)
         if ignore_miss_usage:
-            original_count = len(items)
-            items = [item for item in items if not self._is_ignored_item(item)]
-            filtered = original_count - len(items)
-            if filtered > 0:
-                logger.info(f"Filtered {filtered} items without usage: ")
-                for item in items:
-                    if not item.useLocations:
-                        logger.info(f" - {item.name}")
+            is_ignored = self._is_ignored_item
+            # Usually nothing is ignored: only rebuild the list from the first hit
+            first = next((i for i, item in enumerate(items) if is_ignored(item)), None)
+            if first is not None:
+                dropped = [items[first]]
+                kept = items[:first]
+                for item in islice(items, first + 1, None):
+                    (dropped if is_ignored(item) else kept).append(item)
+                items = kept
+                info = logger.info
+                info(f"Filtered {len(dropped)} items without usage: ")
+                for item in dropped:
+                    info(" - {}", item.name)
         
         # Log statistics
         stats = self.get_statistics(items) if hasattr(self, 'get_statistics') else {}
@@ -242,78 +494,244 @@ class ItemExtractor(Protocol[T]):
         
         return items
     
+    def iter_extract(
+        self,
+        force_search_code: bool = False,
+        ignore_miss_usage: bool = True,
+        **kwargs
+    ) -> Iterator[T]:
+        """
+        Streaming variant of extract(): yield items one at a time.
+        
+        Items are handed over and released as they are consumed, so a caller
+        that filters while iterating never holds the full extraction and its
+        filtered copy at the same time.
+        
+        Args:
+            force_search_code: If True, force code usage search
+            ignore_miss_usage: If True, skip items without usage locations
+            **kwargs: Extractor-specific options
+        
+        Yields:
+            T: Extracted items with metadata, in extraction order
+        """
+        logger.info("Starting extraction...")
+        
+        kwargs['force_search_code'] = force_search_code
+        items = self._extract_all_items(**kwargs)
+        
+        # Pop from the end of a reversed list: keeps order, drops references
+        items.reverse()
+        yielded = 0
+        while items:
+            item = items.pop()
+            if ignore_miss_usage and self._is_ignored_item(item):
+                continue
+            normalize_documents(item)
+            yielded += 1
+            yield item
+        
+        logger.info(f"Extracted {yielded} items")
+    
+    def extract_parallel(self, sources: List[str], workers: Optional[int] = None) -> List[T]:
+        """
+        Run _extract_file() over source files in worker processes.
+        
+        The regex-based parsers are pure Python and hold the GIL, so files
+        are spread over a process pool; results keep the order of sources.
+        The extractor is pickled to the workers, so it must only hold
+        picklable state (paths, sets, plain values).
+        
+        Args:
+            sources: Source file paths
+            workers: Worker processes (None = config.EXTRACT_WORKERS,
+                0 = os.cpu_count(), 1 = run inline)
+        
+        Returns:
+            List[T]: Items from all files, in file order
+        
+        Raises:
+            TypeError: If the subclass does not implement _extract_file()
+        """
+        if type(self)._extract_file is ItemExtractor._extract_file:
+            # Checked up front: _extract_file_safe() would log and skip every file
+            raise TypeError(f"{type(self).__name__} must implement _extract_file() to use extract_parallel()")
+        if workers is None:
+            workers = config.EXTRACT_WORKERS
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(sources) <= 1:
+            return list(chain.from_iterable(map(self._extract_file_safe, sources)))
+        
+        # Large chunks: each task pickles the extractor along with its files
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(chain.from_iterable(executor.map(self._extract_file_safe, sources, chunksize=chunksize)))
+    
+    def _extract_file_safe(self, file_path: str) -> List[T]:
+        """_extract_file() with per-file error isolation"""
+        try:
+            items = self._extract_file(file_path)
+        except Exception as e:
+            logger.error(f"Error processing file {file_path}: {e}")
+            return []
+        
+        if items:
+            logger.debug("Found {} items in {}", len(items), file_path)
+        return items
+    
+    def _extract_file(self, file_path: str) -> List[T]:
+        """
+        Extract the items defined in one source file.
+        
+        Hook required by extract_parallel(); extractors that parse file by
+        file implement it.
+        """
+        raise NotImplementedError
+    
     def _is_ignored_item(self, item: T) -> bool:
         """
         Check if an item should be ignored.
         """
-        return item.useLocations is None or len(item.useLocations) <= 0
+        return not item.useLocations
     
     def load_meta(self) -> List[T]:
         """
         Load items from meta JSON file.
         
         Default implementation with error handling:
-        1. Check if meta file exists
+        1. Check if meta file exists and is not empty, and rebuild the items of
+           the previous call from an in-memory pickle if its content digest is
+           unchanged (or, with META_PICKLE_CACHE, load the pickled copy if it
+           was built from the same meta file content)
         2. Parse JSON
-        3. Deserialize items using _item_from_dict()
+        3. Deserialize items: packed rows via item_class.from_tuple(),
+           legacy lists of dicts via _item_from_dict()
         4. Handle errors gracefully
         
         Returns:
-            List[T]: Loaded items, or empty list if file doesn't exist
+            List[T]: Loaded items, or empty list if file doesn't exist.
+            Every call returns fresh item objects, so callers may mutate
+            them (and alias their fields) freely.
         """
-        if not self.meta_path or not self.meta_path.exists():
+        try:
+            st = self.meta_path.stat() if self.meta_path else None
+        except FileNotFoundError:
+            st = None
+        if st is None:
             logger.info(f"Meta file does not exist: {self.meta_path}")
             return []
+        if st.st_size <= 2:
+            # Empty file or '[]' (first run): nothing to open or decode
+            logger.info(f"Meta file is empty: {self.meta_path}")
+            return []
         
+        cache_path = cache_path_for(self.meta_path) if config.META_PICKLE_CACHE else None
         try:
-            with open(self.meta_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # One read() sized to the file; json_io wants bytes anyway
+            content = self.meta_path.read_bytes()
+            # Keyed by content rather than mtime/size, which miss a rewrite
+            # of the same size within one mtime tick
+            digest = source_digest(content)
+            cached = getattr(self, '_meta_cache', None)
+            if cached is not None and cached[0] == digest:
+                logger.debug(f"Meta file unchanged, rebuilding items from memory: {self.meta_path}")
+                return pickle.loads(cached[1])
             
-            items = [self._item_from_dict(item) for item in data]
+            if cache_path is not None:
+                items = read_cache(cache_path, digest)
+                if items is not None:
+                    logger.info(f"Loaded {len(items)} items from {cache_path}")
+                    self._meta_cache = (digest, pickle.dumps(items, protocol=PICKLE_PROTOCOL))
+                    return items
+            
+            data = json_io.loads(content)
+            
+            if is_packed(data):
+                items = unpack_rows(self.item_class, data)
+            else:
+                from_dict = self._item_builder()
+                items = [from_dict(item) for item in data]
             logger.info(f"Loaded {len(items)} items from {self.meta_path}")
+            if cache_path is not None:
+                write_cache(items, cache_path, digest)
+            # Pickled rather than kept as objects: callers mutate the items,
+            # so each call gets its own copy
+            self._meta_cache = (digest, pickle.dumps(items, protocol=PICKLE_PROTOCOL))
             return items
             
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in meta file: {e}")
             return []
         except Exception as e:
             logger.error(f"Failed to load from {self.meta_path}: {e}")
             return []
     
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes of extract_parallel() do not need the loaded meta
+        state = self.__dict__.copy()
+        state.pop('_meta_cache', None)
+        return state
+    
     def _get_source_code_paths(self) -> List[Path]:
         """
         Scan and collect all source files from default paths.
         
         Default implementation:
         1. Get default paths from _get_default_code_paths()
-        2. Walk directory tree
+        2. Walk directory tree with os.scandir (see _scan_code_path); with
+           several paths, each is walked on its own thread, since the walk
+           mostly waits on directory I/O with the GIL released
         3. Filter files using _should_process_file()
-        4. Return list of file paths
+        4. Return list of file paths, in code path order
         
         Returns:
             List[Path]: List of source file paths to process
         """
-        codes = []
+        code_paths = []
         for code_path in self._get_default_code_paths():
             if not os.path.exists(code_path):
                 logger.warning(f"Code path does not exist: {code_path}")
                 continue
                 
             logger.info(f"Scanning code path: {code_path}")
-            
-            for root, dirs, files in os.walk(code_path):
-                for file in files:
-                    file_path = Path(root) / file
-                    
-                    logger.debug(f"Checking file: {file_path}")
-                    
-                    if not self._should_process_file(file_path):
-                        logger.debug(f"Skipping file: {file_path}")
-                        continue
-
-                    codes.append(str(file_path))
-        return codes
-
+            code_paths.append(code_path)
+        
+        if len(code_paths) <= 1:
+            return [file for code_path in code_paths for file in self._scan_code_path(code_path)]
+        
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_SCAN_WORKERS, len(code_paths))) as executor:
+            scans = executor.map(lambda code_path: list(self._scan_code_path(code_path)), code_paths)
+            return list(chain.from_iterable(scans))
+    
+    def _scan_code_path(self, code_path: str) -> Iterator[str]:
+        """
+        Yield the files under code_path that pass _should_process_file().
+        
+        Walks top-down in os.walk order without following directory
+        symlinks. With the default _should_process_file(), filtering is done
+        on DirEntry names: test directories are pruned instead of walked,
+        and files are checked by name with _should_process_name(), so no
+        Path is built. An overridden _should_process_file() is still called
+        with a Path for every file.
+        """
+        if type(self)._should_process_file is not ItemExtractor._should_process_file:
+            # Locals: looked up once instead of per file
+            should_process, debug = self._should_process_file, logger.debug
+            for _, path in _walk_source_tree(code_path, prune_test_dirs=False):
+                if should_process(Path(path)):
+                    yield path
+                else:
+                    debug("Skipping file: {}", path)
+            return
+        
+        if any(part.lower() in _TEST_DIR_NAMES for part in Path(code_path).parts):
+            return
+        
+        accept_name = self._should_process_name
+        for name, path in _walk_source_tree(code_path):
+            if accept_name(name):
+                yield path
+    
     def _should_process_file(self, file_path: Path) -> bool:
         """
         Check if a file should be processed.
@@ -331,20 +749,39 @@ class ItemExtractor(Protocol[T]):
         Returns:
             bool: True if file should be processed
         """
-        if file_path.suffix not in self.supported_extensions:
-            return False
-        
-        # Skip test directories and files conservatively
-        parts_lower = [p.lower() for p in file_path.parts]
-        if any(p in {'test', 'tests'} for p in parts_lower):
+        if not self._should_process_name(file_path.name):
             return False
-        # Common test file naming
-        name_lower = file_path.name.lower()
-        if name_lower.endswith('test') or name_lower.startswith('test'):
+        # Skip test directories conservatively (stops at the first match)
+        if any(part.lower() in _TEST_DIR_NAMES for part in file_path.parts):
             return False
         
         return True
     
+    def _should_process_name(self, name: str) -> bool:
+        """
+        File-name part of _should_process_file(), on the raw name string.
+        
+        The scanner calls this with DirEntry.name, so the per-file check
+        involves no pathlib objects. Subclass can override to filter by name
+        while keeping the fast scan.
+        
+        Args:
+            name: File name without directories
+            
+        Returns:
+            bool: True if the name has a supported extension and is not a
+            test file
+        """
+        # Cheapest reject first: most files in a source tree have other
+        # suffixes (same rule as PurePath.suffix: no suffix for dotfiles)
+        dot = name.rfind('.')
+        if dot <= 0 or name[dot:] not in self.supported_extensions:
+            return False
+        
+        # Common test file naming
+        name_lower = name.lower()
+        return not (name_lower.endswith('test') or name_lower.startswith('test'))
+    
     def _item_from_dict(self, data: Dict[str, Any]) -> T:
         """
         Deserialize item from dictionary.
@@ -361,12 +798,27 @@ class ItemExtractor(Protocol[T]):
         Raises:
             AttributeError: If item_class is not set on the subclass
         """
-        if not hasattr(self, 'item_class') or self.item_class is None:
+        return self._item_builder()(data)
+    
+    def _item_builder(self) -> Callable[[Dict[str, Any]], T]:
+        """
+        Resolve the per-row deserializer once, for use in a loop.
+        
+        Returns an overridden _item_from_dict(), or item_class.from_dict
+        itself so rows skip the item_class check and attribute lookups.
+        
+        Raises:
+            AttributeError: If item_class is not set on the subclass
+        """
+        if type(self)._item_from_dict is not ItemExtractor._item_from_dict:
+            return self._item_from_dict
+        item_class = getattr(self, 'item_class', None)
+        if item_class is None:
             raise AttributeError(
                 f"{self.__class__.__name__} must set 'item_class' attribute "
                 f"(e.g., item_class = ConfigItem)"
             )
-        return self.item_class.from_dict(data)
+        return item_class.from_dict
     
     # ===== Abstract methods (must be implemented by subclass) =====
     
@@ -419,7 +871,7 @@ class ItemExtractor(Protocol[T]):
                 exists_metas = {m.name: m for m in self.load_meta()}
                 for item in all_items:
                     if item.name in exists_metas:
-                        item.documents = exists_metas[item.name].documents
+                        item.documents = dict(exists_metas[item.name].documents)
                         item.useLocations = exists_metas[item.name].useLocations
                 
                 return all_items
@@ -450,7 +902,6 @@ class ItemExtractor(Protocol[T]):
         ...
 
 
-@runtime_checkable
 class DocGenerator(Protocol[T]):
     """
     Protocol for generating documentation for a single item.
@@ -503,9 +954,67 @@ class DocGenerator(Protocol[T]):
             - Should be relatively fast (will be called in batch)
         """
         ...
+    
+    def generate_many(
+        self,
+        items: Sequence[T],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Generate documentation for several items.
+        
+        Default implementation calls generate() once per item. Generators
+        backed by an API that accepts many prompts at once should override
+        this; the pipeline then hands them chunks of items instead of single
+        items.
+        
+        Args:
+            items: Items to document
+            context: Optional additional context, as for generate()
+        
+        Returns:
+            List[str]: One generated document per item, in item order
+        """
+        if context is None:
+            return [self.generate(item) for item in items]
+        return [self.generate(item, context=context) for item in items]
+    
+    def cache_key(self, item: T, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Key identifying the output of generate(item, context).
+        
+        Since generation is idempotent, a doc cached under this key can be
+        reused instead of calling the LLM again; the pipeline's docgen cache
+        uses it. The key covers the generator type, its agent's
+        PROMPT_VERSION and model name (when it has an `agent`), the item's
+        fields and the context; override when the output depends on more.
+        
+        Args:
+            item: The item to document
+            context: Optional additional context, as for generate()
+        
+        Returns:
+            str: Hex digest over the generation inputs
+        """
+        data = item.to_dict()
+        data.pop('contentHashes', None)  # bookkeeping, not a generation input
+        agent = getattr(self, 'agent', None)
+        parts = [
+            type(self).__name__,
+            str(getattr(agent, 'PROMPT_VERSION', '')),
+            str(getattr(agent, 'model_name', '')),
+            json.dumps(data, sort_keys=True, ensure_ascii=False, default=str),
+        ]
+        if context:
+            parts.append(json.dumps(context, sort_keys=True, ensure_ascii=False, default=str))
+        
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
 
 
-@runtime_checkable
 class DocPersister(Protocol[T]):
     """
     Protocol for saving generated documentation to files.
@@ -572,35 +1081,188 @@ class DocPersister(Protocol[T]):
         
         logger.info(f"Saved {len(items)} items")
     
-    def _save_meta(self, items: List[T]) -> None:
+    def save_partial(
+        self,
+        items: List[T],
+        output_dir: str,
+        target_langs: List[str]
+    ) -> None:
+        """
+        Save documents for a subset of languages, without metadata.
+        
+        Lets the pipeline write a language as soon as its translation is
+        final; metadata is written once at the end via save_meta().
+        
+        Args:
+            items: List of items with generated documentation
+            output_dir: Root directory for output files
+            target_langs: Languages to save now
+        """
+        if not items or not target_langs:
+            return
+        
+        self._save_documents(items, output_dir, target_langs)
+        logger.info(f"Saved {len(items)} items [{', '.join(target_langs)}]")
+    
+    def format(self, item: T, lang: str) -> str:
+        """
+        Render one item's documentation body for a language.
+        
+        Formatting is separate from writing so persisters render each
+        (item, language) once and assemble or write the results in bulk.
+        Default implementation returns the stripped document, or '' if the
+        item has none in that language.
+        """
+        return item.documents.get(lang, '').strip()
+    
+    def target_path(self, item: T, lang: str, output_dir: str) -> Optional[Path]:
+        """
+        Output file of one item's page, for persisters writing a file per item.
+        
+        Returns:
+            Path, or None if the item is not written on its own
+        """
+        return None
+    
+    def group_by_category(self, items: Sequence[T], order_by: str = 'name') -> Dict[Any, List[T]]:
+        """
+        Group items by their class's CATEGORY_FIELD.
+        
+        One sort on (category, order_by) followed by groupby, both keyed with
+        attrgetter, so the grouping loop stays in C. Items with an empty
+        category are left out.
+        
+        Args:
+            items: Items of one class
+            order_by: Attribute ordering the items within each group
+            
+        Returns:
+            Dict[Any, List[T]]: Category -> items, in category order
+        """
+        if not items:
+            return {}
+        
+        category_field = type(items[0]).CATEGORY_FIELD
+        category = attrgetter(category_field)
+        ordered = sorted(filter(category, items), key=attrgetter(category_field, order_by))
+        return {key: list(group) for key, group in groupby(ordered, category)}
+    
+    def save_meta(self, items: List[T]) -> None:
+        """Save metadata only (see _save_meta())."""
+        if not items:
+            logger.warning("No items to save")
+            return
+        
+        self._save_meta(items)
+    
+    def save_batch(
+        self,
+        files: List[Tuple[Path, Union[str, bytes]]],
+        max_workers: int = DEFAULT_WRITE_WORKERS,
+        skip_unchanged: bool = False
+    ) -> int:
+        """
+        Write many small files concurrently.
+        
+        Parent directories are created once per unique directory, then the
+        writes are issued from a thread pool so they overlap instead of
+        running one after another on the caller's thread.
+        
+        Args:
+            files: (path, content) pairs; str content is written as UTF-8
+                text, bytes content (e.g. from json_io.dumps) as-is
+            max_workers: Maximum number of concurrent writes
+            skip_unchanged: Leave files that already hold their bytes
+                content untouched (no write, mtime preserved)
+        
+        Returns:
+            int: Number of files written
+        """
+        if not files:
+            return 0
+        
+        for parent in {path.parent for path, _ in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+        
+        def write(entry: Tuple[Path, Union[str, bytes]]) -> bool:
+            path, content = entry
+            if isinstance(content, bytes):
+                if skip_unchanged and _file_holds(path, content):
+                    return False
+                with open(path, 'wb') as f:
+                    f.write(content)
+                return True
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            return True
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(files)))) as executor:
+            # sum() re-raises the first write error, if any
+            written = sum(executor.map(write, files))
+        
+        logger.debug(f"Wrote {written}/{len(files)} files")
+        return written
+    
+    def _save_meta(self, items: List[T], durable: Optional[bool] = None) -> None:
         """
         Save metadata in JSON format.
         
         Default implementation:
-        1. Serialize items to dict via to_dict()
-        2. Write to meta_path as JSON
+        1. Serialize items as packed rows via to_tuple() (see core.serialize),
+           or as a list of dicts via to_dict() for items without FIELDS;
+           compact unless META_PRETTY is set
+        2. Write to meta_path as JSON, unless the file already holds exactly
+           these bytes (mtime is then preserved); the write goes through a
+           temp file and os.replace(), so a crash never leaves a truncated
+           meta file behind
         3. Handle errors gracefully
         
         Args:
             items: List of items to save
+            durable: fsync the data before replacing meta_path
+                (default: config.META_DURABLE)
             
         Returns:
             None
         """
         logger.info(f"Saving metadata → {self.meta_path}")
         
+        # Serialize up front: the file is only open for the write itself
+        pretty = config.META_PRETTY
+        item_class = type(items[0]) if items else None
+        if getattr(item_class, 'FIELDS', None):
+            content = pack_items(items, item_class, indent=pretty)
+        else:
+            content = json_io.dumps(list(map(_to_dict, items)), indent=pretty)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        
         try:
-            data = [item.to_dict() for item in items]
-            self.meta_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._meta_unchanged(content, digest):
+                logger.info(f"Metadata unchanged, skipped writing {self.meta_path}")
+                return
             
-            with open(self.meta_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.meta_path.parent.mkdir(parents=True, exist_ok=True)
+            if durable is None:
+                durable = config.META_DURABLE
+            write_atomic(self.meta_path, content, durable)
+            st = self.meta_path.stat()
+            self._last_meta = (digest, st.st_mtime_ns, st.st_size)
             
             logger.info(f"Saved {len(items)} items to {self.meta_path}")
         except Exception as e:
             logger.error(f"Failed to save metadata to {self.meta_path}: {e}")
-        
-        logger.info("Metadata saved")
+    
+    def _meta_unchanged(self, content: bytes, digest: bytes) -> bool:
+        """Whether meta_path already holds content"""
+        try:
+            st = self.meta_path.stat()
+        except OSError:
+            return False
+        last = getattr(self, '_last_meta', None)
+        if last is not None and (st.st_mtime_ns, st.st_size) == last[1:]:
+            # Untouched since this persister wrote it: the digest decides
+            return last[0] == digest
+        return st.st_size == len(content) and _file_holds(self.meta_path, content)
     
     # ===== Abstract methods (must be implemented by subclass) =====
     
@@ -630,20 +1292,21 @@ class DocPersister(Protocol[T]):
             
         Example:
             def _save_documents(self, items, output_dir, target_langs):
-                # Organize items by catalog
-                catalogs = self._organize_by_catalog(items)
+                # Organize items by CATEGORY_FIELD, sorted by name
+                catalogs = self.group_by_category(items)
                 
                 # Generate docs for each language
                 for lang in target_langs:
-                    content = ""
-                    for catalog, items in catalogs.items():
-                        content += f"## {catalog}\\n\\n"
-                        for item in items:
-                            if lang in item.documents:
-                                content += item.documents[lang] + "\\n\\n"
+                    parts = []
+                    for catalog, group in catalogs.items():
+                        parts.append(f"## {catalog}\\n\\n")
+                        for item in group:
+                            body = self.format(item, lang)
+                            if body:
+                                parts.append(body + "\\n\\n")
                     
                     # Apply template and save
-                    self._apply_template_and_save(content, lang, output_dir)
+                    self._apply_template_and_save("".join(parts), lang, output_dir)
         """
         ...
 
@@ -654,5 +1317,9 @@ __all__ = [
     'ItemExtractor',
     'DocGenerator',
     'DocPersister',
+    'ContentHashMixin',
+    'SOURCE_INPUT',
+    'normalize_documents',
+    'load_template',
     'T',
 ]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Positional (row) serialization for documentable items.
+
+Meta files repeat every field name once per item when stored as a list of
+dicts. The packed layout stores the field names once and each item as a row:
+
+    {"fields": ["name", "type", ...], "rows": [["query_timeout", "int", ...], ...]}
+"""
+
+from operator import methodcaller
+from typing import Any, ClassVar, Dict, Iterable, List, Tuple, Type
+
+from . import json_io
+
+
+# Bound once, so serializing a list skips the per-item method lookup
+_to_tuple = methodcaller('to_tuple')
+
+
+class FieldsTupleMixin:
+    """
+    Default to_tuple()/from_tuple() for items declaring FIELDS.
+
+    When FIELDS matches the constructor's __match_args__ (as for dataclasses
+    listing their fields in order), rows are passed positionally, which
+    skips building and parsing a keyword dict per item. Rows of another
+    length (meta written by an older schema) are rebuilt by keyword, so
+    missing trailing fields take their defaults.
+    """
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    __slots__ = ()
+
+    def to_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle as a positional row instead of an instance __dict__
+        return (self.__class__.from_tuple, (self.to_tuple(),))
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> Any:
+        if len(row) == len(cls.FIELDS) and cls.FIELDS == getattr(cls, '__match_args__', None):
+            return cls(*row)
+        return cls(**dict(zip(cls.FIELDS, row)))
+
+
+def is_packed(data: Any) -> bool:
+    """Whether decoded meta data uses the packed fields/rows layout"""
+    return isinstance(data, dict) and 'fields' in data and 'rows' in data
+
+
+def pack_items(items: Iterable[Any], item_class: Type, indent: bool = False) -> bytes:
+    """
+    Serialize items as one field list plus positional rows.
+
+    Args:
+        items: Items implementing to_tuple()
+        item_class: Item class providing FIELDS
+        indent: Pretty-print for human inspection
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    data = {'fields': list(item_class.FIELDS), 'rows': list(map(_to_tuple, items))}
+    return json_io.dumps(data, indent=indent)
+
+
+def unpack_rows(item_class: Type, data: Dict[str, Any]) -> List[Any]:
+    """
+    Rebuild items from decoded packed data.
+
+    Rows are passed straight to from_tuple() when the stored field list
+    matches item_class.FIELDS; otherwise (meta written by an older schema)
+    each row is mapped by field name through from_dict().
+    """
+    fields = tuple(data['fields'])
+    if fields == tuple(item_class.FIELDS):
+        return [item_class.from_tuple(row) for row in data['rows']]
+    return [item_class.from_dict(dict(zip(fields, row))) for row in data['rows']]
+
+
+def unpack_items(item_class: Type, blob: bytes) -> List[Any]:
+    """
+    Inverse of pack_items().
+
+    Args:
+        item_class: Item class implementing from_tuple()/from_dict()
+        blob: Bytes produced by pack_items()
+
+    Returns:
+        List of reconstructed items
+    """
+    return unpack_rows(item_class, json_io.loads(blob))
+
+
+__all__ = [
+    'FieldsTupleMixin',
+    'is_packed',
+    'pack_items',
+    'unpack_rows',
+    'unpack_items',
+]
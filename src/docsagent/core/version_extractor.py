@@ -21,13 +21,31 @@ item types (FE/BE configs, variables, functions).
 Uses duck typing (no ABC) to maintain consistency with the project's protocol design.
 """
 
-import json
+import hashlib
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple
 from loguru import logger
 
-from docsagent.tools.git_operator import GitOperator
+from docsagent import config
+from docsagent.core import json_io
+from docsagent.core.cache import write_atomic
+from docsagent.tools.git_operator import GitOperator, semver_key
+
+# Concurrent git log/describe calls in _find_first_versions_pickaxe()
+DEFAULT_PICKAXE_WORKERS = 8
+
+# On-disk layout written by _save_version_file(); files without the key use
+# the original item → {branch: version} layout
+VERSION_SCHEMA = 2
+
+# Part of the tag cache key (see BaseVersionExtractor._tag_cache_key());
+# bump when the cache layout or _items_in_content() changes
+TAG_CACHE_SCHEMA = 1
 
 
 class BaseVersionExtractor:
@@ -60,6 +78,10 @@ class BaseVersionExtractor:
         _extract_all_items_from_content(content) -> set
     """
     
+    # Part of the tag cache key; bump in a subclass when its parsing changes
+    # in a way its module's regexes do not show
+    EXTRACTION_VERSION: ClassVar[int] = 1
+    
     def __init__(
         self,
         repo_path: str,
@@ -88,6 +110,14 @@ class BaseVersionExtractor:
         
         self.version_file = version_file
         self.item_identifier_field = item_identifier_field
+        # Unless a subclass overrides it, _get_item_identifier() is a plain
+        # attribute read; bind it as a C-level attrgetter
+        if type(self)._get_item_identifier is BaseVersionExtractor._get_item_identifier:
+            self._get_item_identifier = attrgetter(item_identifier_field)
+        
+        # Blob id → item names, shared by every tag holding the same blob;
+        # loaded from the tag cache on first use
+        self._blob_items: Optional[Dict[str, FrozenSet[str]]] = None
         
         # Ensure version file directory exists
         self.version_file.parent.mkdir(parents=True, exist_ok=True)
@@ -98,7 +128,8 @@ class BaseVersionExtractor:
         """
         Extract all item names from file content.
         
-        Subclasses must implement this to batch extract all items.
+        Subclasses must implement this or _extract_all_items_from_bytes()
+        to batch extract all items.
         This is the core method for batch processing.
         
         Args:
@@ -107,10 +138,43 @@ class BaseVersionExtractor:
         Returns:
             Set of item names found in content
         """
+        if type(self)._extract_all_items_from_bytes is not BaseVersionExtractor._extract_all_items_from_bytes:
+            return self._extract_all_items_from_bytes(content.encode('utf-8'))
         raise NotImplementedError(
             f"{self.__class__.__name__} must implement _extract_all_items_from_content()"
         )
     
+    def _extract_all_items_from_bytes(self, content: bytes) -> set:
+        """
+        Extract all item names from raw file content, as git returns it.
+        
+        Item names are ASCII identifiers, so subclasses can match bytes
+        patterns directly and decode only the names instead of the whole
+        blob. The default decodes and calls _extract_all_items_from_content().
+        
+        Args:
+            content: File content (bytes)
+        
+        Returns:
+            Set of item names (str) found in content
+        """
+        return self._extract_all_items_from_content(content.decode('utf-8', errors='replace'))
+    
+    def _items_in_content(self, content: bytes) -> FrozenSet[str]:
+        """
+        _extract_all_items_from_bytes() as a frozen set of interned names.
+        
+        Names repeat across every blob and tag; interned, the set operations
+        of the tag scan compare them by identity first (see _blob_items).
+        
+        Args:
+            content: File content (bytes)
+        
+        Returns:
+            Frozen set of item names found in content
+        """
+        return frozenset(map(sys.intern, self._extract_all_items_from_bytes(content)))
+    
     def track_versions(self, items: List[any]) -> Dict[str, Dict[str, str]]:
         """
         Track versions for a list of items.
@@ -127,11 +191,25 @@ class BaseVersionExtractor:
               "another_config": {"3.2": "3.2.0", "3.3": "3.3.0"}
             }
         """
+        return self._track_version_data(items)["versions"]
+    
+    def _track_version_data(self, items: List[any]) -> Dict:
+        """
+        track_versions() returning the whole version data.
+        
+        Returns:
+            {
+              "metadata": {...},
+              "versions": {item_name: {branch: version}}
+            }
+            as saved to (or already held by) the version file, so callers
+            need no second load_version_file()
+        """
         logger.info(f"Tracking versions for {len(items)} items...")
         
-        # Load existing cache
+        # Load existing cache (copied: load_version_file() may return its memo)
         cached_data = self.load_version_file()
-        cached_versions = cached_data.get("versions", {})
+        cached_versions = dict(cached_data.get("versions", {}))
         
         # Filter items that need tracking
         items_to_track = []
@@ -144,7 +222,7 @@ class BaseVersionExtractor:
         
         if not items_to_track:
             logger.info("All items already cached")
-            return cached_versions
+            return cached_data
         
         logger.info(f"Tracking {len(items_to_track)} new items...")
         
@@ -156,7 +234,10 @@ class BaseVersionExtractor:
         logger.info(f"Processing in batch mode (optimized)...")
         
         # Batch process all items
-        new_versions = self._find_first_versions_batch(item_names_to_track, branches)
+        if config.VERSION_PICKAXE:
+            new_versions = self._find_first_versions_pickaxe(item_names_to_track, branches)
+        else:
+            new_versions = self._find_first_versions_batch(item_names_to_track, branches)
         
         # Log results
         found_count = sum(1 for v in new_versions.values() if v)
@@ -166,10 +247,10 @@ class BaseVersionExtractor:
         cached_versions.update(new_versions)
         
         # Save updated cache
-        self._save_version_file(cached_versions, list(branches.keys()))
+        version_data = self._save_version_file(cached_versions, list(branches.keys()))
         
         logger.info(f"Version tracking completed: {len(new_versions)} new items tracked")
-        return cached_versions
+        return version_data
     
     def _get_item_identifier(self, item: any) -> str:
         """
@@ -187,7 +268,8 @@ class BaseVersionExtractor:
         This is the main entry point for version management. It:
         1. Loads existing version data from cache file
         2. Optionally tracks new items if track_new=True
-        3. Computes display versions using filtering rules
+        3. Computes display versions using filtering rules, against the
+           maintained branches recorded in the cache metadata
         4. Updates each item's version field
         
         Args:
@@ -199,19 +281,25 @@ class BaseVersionExtractor:
         """
         # Load version data (from cache or track new)
         if track_new:
-            version_data_map = self.track_versions(items)
+            cached_data = self._track_version_data(items)
         else:
             cached_data = self.load_version_file()
-            version_data_map = cached_data.get("versions", {})
+        version_data_map = cached_data.get("versions", {})
+        maintained_branches = cached_data.get("metadata", {}).get("maintained_branches")
         
         if not version_data_map:
             logger.debug("No version data available")
             return 0
         
+        # Prefer the maintained branches stored with the versions; derive
+        # them from the versions only when the metadata lacks them
+        if not maintained_branches:
+            maintained_branches = self._get_maintained_branches(version_data_map)
+        
         # Prepare version data structure for display computation
         version_data = {
             "metadata": {
-                "maintained_branches": list(self._get_maintained_branches(version_data_map))
+                "maintained_branches": list(maintained_branches)
             },
             "versions": version_data_map
         }
@@ -225,17 +313,16 @@ class BaseVersionExtractor:
             item_names=item_names
         )
         
-        # Update items
+        # Update items (single pass, reusing the names computed above); items
+        # without display versions keep any version they already carry
         updated_count = 0
-        for item in items:
-            item_name = self._get_item_identifier(item)
-            if item_name in display_versions:
-                display_list = display_versions[item_name]
-                if display_list:
-                    item.version = display_list
-                    updated_count += 1
-            
-            if item.version is None:
+        get_display_versions = display_versions.get
+        for item, item_name in zip(items, item_names):
+            display_list = get_display_versions(item_name)
+            if display_list:
+                item.version = display_list
+                updated_count += 1
+            elif item.version is None:
                 item.version = []
         logger.info(f"  ✓ Updated {updated_count}/{len(items)} items with version info")
         return updated_count
@@ -253,7 +340,7 @@ class BaseVersionExtractor:
         branches = set()
         for item_versions in version_data_map.values():
             branches.update(item_versions.keys())
-        return sorted(branches, key=lambda b: [int(x) for x in b.split('.')])
+        return sorted(branches, key=semver_key)
     
     def _group_tags_by_branch(self, tags: List[str], keep_recent: int = 5) -> Dict[str, List[str]]:
         """
@@ -285,10 +372,10 @@ class BaseVersionExtractor:
         
         # Sort tags within each branch
         for branch in branches:
-            branches[branch].sort(key=lambda v: [int(x) for x in v.split('.')])
+            branches[branch].sort(key=semver_key)
         
         # Keep only the most recent N branches
-        sorted_branches = sorted(branches.keys(), key=lambda b: [int(x) for x in b.split('.')])
+        sorted_branches = sorted(branches.keys(), key=semver_key)
         if len(sorted_branches) > keep_recent:
             recent_branches = sorted_branches[-keep_recent:]
             branches = {b: branches[b] for b in recent_branches}
@@ -305,9 +392,11 @@ class BaseVersionExtractor:
         Batch process: Find first version for multiple items across branches.
         
         Optimized approach using set operations:
-        1. For each tag, extract all item names once
-        2. Use set intersection to find matching items
-        3. No repeated regex matching per item
+        1. Look up the blob ids of all source files at all tags in one batch
+        2. Extract item names once per blob; blobs parsed by earlier runs
+           come from the tag cache (see _load_tag_cache())
+        3. Use set intersection to find matching items
+        4. No repeated regex matching per item
         
         Args:
             item_names: List of item identifiers to track
@@ -320,55 +409,159 @@ class BaseVersionExtractor:
               "item2": {"3.1": "3.1.0", "3.2": "3.2.5"}
             }
         """
+        # Interned like the extracted names (see _items_in_content())
+        item_names = list(map(sys.intern, item_names))
+        
         # Initialize result structure: {item_name: {branch: first_version}}
         results = {name: {} for name in item_names}
         
         # Track which items still need to be found in each branch
         pending_items = {branch: set(item_names) for branch in branches.keys()}
         
-        # Process by branch → tag → file
-        for branch, tags in sorted(branches.items()):
-            logger.debug(f"  Processing branch {branch} with {len(tags)} tags...")
+        # Blob id of every source file at every tag (one git process, no content)
+        blob_ids = self.git_op.get_blob_ids_at_tags_batch([
+            (tag, source_file)
+            for tags in branches.values()
+            for tag in tags
+            for source_file in self.source_files
+        ])
+        if self._blob_items is None:
+            self._blob_items = self._load_tag_cache()
+        blob_items = self._blob_items
+        
+        # Fetch and parse only blobs neither this nor an earlier run has seen
+        new_blobs = {
+            blob_id: pair
+            for pair, blob_id in blob_ids.items()
+            if blob_id is not None and blob_id not in blob_items
+        }
+        if new_blobs:
+            logger.debug(f"  Parsing {len(new_blobs)} new source file versions...")
+            contents = self._fetch_by_branch(list(new_blobs.values()), branches)
+            for blob_id, (tag, source_file) in new_blobs.items():
+                content = contents[(tag, source_file)]
+                try:
+                    blob_items[blob_id] = self._items_in_content(content) if content else frozenset()
+                except Exception as e:
+                    logger.warning(f"Failed to extract items from {source_file}@{tag}: {e}")
+            self._save_tag_cache(blob_items)
+        
+        # One pass over all tags in ascending version order
+        all_tags = sorted(
+            ((tag, branch) for branch, tags in branches.items() for tag in tags),
+            key=lambda entry: semver_key(entry[0])
+        )
+        previous_blobs: Dict[str, Tuple[Optional[str], ...]] = {}
+        for tag, branch in all_tags:
+            pending = pending_items[branch]
+            if not pending:
+                # All items found in this branch
+                continue
             
-            for tag in tags:
-                if not pending_items[branch]:
-                    # All items found in this branch
-                    break
-                
-                # Extract items from all source files at this tag
-                items_in_tag = set()
-                for source_file in self.source_files:
-                    content = self.git_op.get_file_at_tag(tag, source_file)
-                    
-                    if not content:
-                        continue
-                    
-                    # Extract all items from content once (fast!)
-                    try:
-                        extracted_items = self._extract_all_items_from_content(content)
-                        items_in_tag.update(extracted_items)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract items from {source_file}@{tag}: {e}")
-                        continue
-                
-                # Find intersection with pending items (set operation is very fast)
-                found_items = pending_items[branch] & items_in_tag
-                
-                if found_items:
-                    # Record first version for found items
-                    for item_name in found_items:
-                        results[item_name][branch] = tag
-                    
-                    # Remove from pending
-                    pending_items[branch] -= found_items
-                    
-                    logger.debug(f"    {branch}@{tag}: found {len(found_items)} items")
-                
-                if not pending_items[branch]:
-                    break
+            # Source files unchanged since the previous tag of the branch hold
+            # no item that is still pending there
+            tag_blobs = tuple(blob_ids[(tag, source_file)] for source_file in self.source_files)
+            if previous_blobs.get(branch) == tag_blobs:
+                continue
+            previous_blobs[branch] = tag_blobs
             
-            if pending_items[branch]:
-                logger.debug(f"  Branch {branch}: {len(pending_items[branch])} items not found in any tag")
+            # Find pending items in any source file at this tag (set operations)
+            found_items = set()
+            for blob_id in tag_blobs:
+                if blob_id in blob_items:
+                    found_items |= pending & blob_items[blob_id]
+            
+            if found_items:
+                # Record first version for found items
+                for item_name in found_items:
+                    results[item_name][branch] = tag
+                pending -= found_items
+                
+                logger.debug(f"    {branch}@{tag}: found {len(found_items)} items")
+        
+        for branch, pending in sorted(pending_items.items()):
+            if pending:
+                logger.debug(f"  Branch {branch}: {len(pending)} items not found in any tag")
+        
+        return results
+    
+    def _fetch_by_branch(
+        self,
+        pairs: List[Tuple[str, str]],
+        branches: Dict[str, List[str]]
+    ) -> Dict[Tuple[str, str], Optional[bytes]]:
+        """
+        Fetch (tag, source_file) raw contents with one git process per branch.
+        
+        The per-branch `git cat-file --batch` processes run side by side, so
+        git inflates blobs of different branches in parallel; the threads
+        only wait on the pipes.
+        
+        Args:
+            pairs: (tag, source_file) pairs to fetch
+            branches: Branch → tags mapping
+        
+        Returns:
+            Dict of (tag, source_file) → content, or None if missing
+        """
+        tag_branches = {tag: branch for branch, tags in branches.items() for tag in tags}
+        by_branch: Dict[str, List[Tuple[str, str]]] = {}
+        for pair in pairs:
+            by_branch.setdefault(tag_branches[pair[0]], []).append(pair)
+        
+        contents: Dict[Tuple[str, str], Optional[bytes]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(by_branch))) as executor:
+            fetch = partial(self.git_op.get_files_at_tags_batch, decode=False)
+            for fetched in executor.map(fetch, by_branch.values()):
+                contents.update(fetched)
+        return contents
+    
+    def _find_first_versions_pickaxe(
+        self,
+        item_names: List[str],
+        branches: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Find first versions by asking git which commit introduced each item.
+        
+        Alternative to _find_first_versions_batch() (enabled by
+        VERSION_PICKAXE): per (item, branch), `git log -S` from the newest
+        tag of the branch finds the introducing commit, and the nearest tag
+        of the branch containing it is the first version. The git calls are
+        subprocess-bound and run on a thread pool.
+        
+        Note:
+            Pickaxe matches the literal name, not the extraction patterns of
+            _extract_all_items_from_content(): a name that appeared earlier in
+            a comment or inside a longer identifier resolves to that commit.
+        
+        Args:
+            item_names: List of item identifiers to track
+            branches: Branch → tags mapping
+        
+        Returns:
+            Dict of item_name → {branch → first_version}
+        """
+        results = {name: {} for name in item_names}
+        branch_tags = {branch: set(tags) for branch, tags in branches.items()}
+        jobs = [
+            (name, branch, tags[-1])
+            for branch, tags in sorted(branches.items())
+            for name in item_names
+        ]
+        
+        def first_tag(job: Tuple[str, str, str]) -> Optional[str]:
+            name, branch, newest_tag = job
+            commit = self.git_op.find_introducing_commit(name, self.source_files, newest_tag)
+            if commit is None:
+                return None
+            tag = self.git_op.get_first_tag_containing(commit, branch)
+            return tag if tag in branch_tags[branch] else None
+        
+        with ThreadPoolExecutor(max_workers=DEFAULT_PICKAXE_WORKERS) as executor:
+            for (name, branch, _), tag in zip(jobs, executor.map(first_tag, jobs)):
+                if tag:
+                    results[name][branch] = tag
         
         return results
     
@@ -376,32 +569,110 @@ class BaseVersionExtractor:
         """
         Load version data from file.
         
+        The parsed data is kept with the file's mtime and size, and returned
+        again (not re-parsed) while the file is unchanged; treat it as
+        read-only. Columnar files (see _to_columns()) are converted back,
+        files in the original layout are read as is.
+        
         Returns:
             {
               "metadata": {...},
               "versions": {item_name: {branch: version}}
             }
         """
-        if not self.version_file.exists():
+        try:
+            st = self.version_file.stat()
+        except FileNotFoundError:
             logger.debug(f"Version file not found: {self.version_file}")
             return {"metadata": {}, "versions": {}}
         
+        cached = getattr(self, '_loaded_version_data', None)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        
         try:
-            with open(self.version_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._from_columns(json_io.loads(self.version_file.read_bytes()))
             logger.debug(f"Loaded version cache: {len(data.get('versions', {}))} items")
+            self._loaded_version_data = (st.st_mtime_ns, st.st_size, data)
             return data
         except Exception as e:
             logger.warning(f"Failed to load version file: {e}")
             return {"metadata": {}, "versions": {}}
     
-    def _save_version_file(self, versions: Dict[str, Dict[str, str]], maintained_branches: List[str]):
+    @property
+    def tag_cache_file(self) -> Path:
+        """Sidecar of the version file holding the items of each parsed blob"""
+        return self.version_file.with_suffix('.tagcache.json')
+    
+    def _tag_cache_key(self) -> str:
+        """
+        Digest of everything the cached item sets depend on.
+        
+        Covers the extractor class, its EXTRACTION_VERSION and the compiled
+        regexes of its module, so changing how items are extracted
+        invalidates the blobs parsed the old way.
+        
+        Returns:
+            Hex digest stored in the tag cache
+        """
+        cls = type(self)
+        digest = hashlib.sha1(
+            f"{TAG_CACHE_SCHEMA}:{cls.__module__}.{cls.__qualname__}:{cls.EXTRACTION_VERSION}".encode()
+        )
+        for value in vars(sys.modules[cls.__module__]).values():
+            if isinstance(value, re.Pattern):
+                digest.update(repr((value.pattern, value.flags)).encode())
+        return digest.hexdigest()
+    
+    def _load_tag_cache(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Load the items extracted from source file blobs by earlier runs.
+        
+        A blob id names exact file content, so the items found in it only go
+        stale when extraction changes; a cache written under a different
+        _tag_cache_key() is discarded.
+        
+        Returns:
+            Dict of blob id → item names
+        """
+        if not self.tag_cache_file.exists():
+            return {}
+        
+        try:
+            data = json_io.loads(self.tag_cache_file.read_bytes())
+            if data.get("schema") != self._tag_cache_key():
+                logger.debug(f"Discarding tag cache written by another extractor version: {self.tag_cache_file}")
+                return {}
+            return {blob_id: frozenset(map(sys.intern, items)) for blob_id, items in data["blobs"].items()}
+        except Exception as e:
+            logger.warning(f"Failed to load tag cache: {e}")
+            return {}
+    
+    def _save_tag_cache(self, blob_items: Dict[str, FrozenSet[str]]) -> None:
+        """Write the tag cache atomically (see _load_tag_cache())"""
+        blobs = {blob_id: sorted(items) for blob_id, items in blob_items.items()}
+        data = {"schema": self._tag_cache_key(), "blobs": blobs}
+        try:
+            write_atomic(self.tag_cache_file, json_io.dumps(data))
+            logger.debug(f"Saved tag cache: {len(blobs)} blobs to {self.tag_cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to save tag cache: {e}")
+    
+    def _save_version_file(self, versions: Dict[str, Dict[str, str]], maintained_branches: List[str]) -> Dict:
         """
         Save version data to file.
         
+        Serialized through json_io (orjson when installed) and replaced
+        atomically, like the tag cache. The file is columnar (see
+        _to_columns()); the returned data keeps the item → {branch: version}
+        layout.
+        
         Args:
             versions: Item versions mapping
             maintained_branches: List of maintained branches
+        
+        Returns:
+            The saved version data, also kept as load_version_file()'s memo
         """
         data = {
             "metadata": {
@@ -413,15 +684,73 @@ class BaseVersionExtractor:
         }
         
         try:
-            with open(self.version_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_atomic(self.version_file, json_io.dumps(self._to_columns(data), indent=True))
+            st = self.version_file.stat()
+            self._loaded_version_data = (st.st_mtime_ns, st.st_size, data)
             logger.debug(f"Saved version cache: {len(versions)} items to {self.version_file}")
         except Exception as e:
             logger.error(f"Failed to save version file: {e}")
             raise
+        
+        return data
     
     @staticmethod
-    def compute_display_versions(branch_versions: Dict[str, str], maintained_branches: Optional[List[str]] = None) -> List[str]:
+    def _to_columns(data: Dict) -> Dict:
+        """
+        Convert version data to the columnar file layout.
+        
+        Branch names are stored once; each item holds one slot per branch,
+        the first version or None:
+            {
+              "schema_version": 2,
+              "metadata": {...},
+              "branches": ["3.0", "3.1", "3.2"],
+              "items": {"enable_xxx": [null, "3.1.1", "3.2.0"]}
+            }
+        """
+        versions = data["versions"]
+        branches = sorted({branch for item in versions.values() for branch in item}, key=semver_key)
+        return {
+            "schema_version": VERSION_SCHEMA,
+            "metadata": data["metadata"],
+            "branches": branches,
+            "items": {
+                name: [item.get(branch) for branch in branches]
+                for name, item in versions.items()
+            }
+        }
+    
+    @staticmethod
+    def _from_columns(data: Dict) -> Dict:
+        """Inverse of _to_columns(); data in the original layout is returned as is"""
+        if data.get("schema_version") != VERSION_SCHEMA:
+            return data
+        branches = data["branches"]
+        return {
+            "metadata": data.get("metadata", {}),
+            "versions": {
+                name: {branch: tag for branch, tag in zip(branches, tags) if tag is not None}
+                for name, tags in data["items"].items()
+            }
+        }
+    
+    @staticmethod
+    def index_branches(branches: List[str]) -> Dict[str, int]:
+        """
+        Map each branch to its position in version order.
+        
+        Build it once and pass it to compute_display_versions() as
+        maintained_index when computing many items against the same
+        maintained branches.
+        """
+        return {branch: i for i, branch in enumerate(sorted(branches, key=semver_key))}
+    
+    @staticmethod
+    def compute_display_versions(
+        branch_versions: Dict[str, str],
+        maintained_branches: Optional[List[str]] = None,
+        maintained_index: Optional[Dict[str, int]] = None
+    ) -> List[str]:
         """
         Compute display versions from raw branch→version mapping.
         
@@ -451,6 +780,8 @@ class BaseVersionExtractor:
                             e.g., {"3.0": "3.0.11", "3.1": "3.1.1"}
             maintained_branches: List of all maintained branches (optional)
                                 If not provided, inferred from branch_versions
+            maintained_index: index_branches() of the maintained branches;
+                              takes precedence over maintained_branches
         
         Returns:
             List of versions to display, sorted by branch
@@ -464,35 +795,30 @@ class BaseVersionExtractor:
         # Sort branches by version number
         sorted_branches = sorted(
             branch_versions.keys(),
-            key=lambda b: [int(x) for x in b.split('.')]
+            key=semver_key
         )
         
-        # Infer maintained branches if not provided
-        if maintained_branches is None:
-            maintained_branches = sorted_branches
-        else:
-            # Sort maintained branches
-            maintained_branches = sorted(
-                maintained_branches,
-                key=lambda b: [int(x) for x in b.split('.')]
+        # Position of each maintained branch (inferred from branch_versions if not provided)
+        if maintained_index is None:
+            maintained_index = BaseVersionExtractor.index_branches(
+                sorted_branches if maintained_branches is None else maintained_branches
             )
         
         highest_branch = sorted_branches[-1]
-        highest_maintained = maintained_branches[-1] if maintained_branches else highest_branch
         
         # Rule 1: If all maintained branches have the config, only show the earliest
-        if len(sorted_branches) == len(maintained_branches) and set(sorted_branches) == set(maintained_branches):
+        if len(sorted_branches) == len(maintained_index) and all(b in maintained_index for b in sorted_branches):
             # All branches have it, return only the first version
             return [branch_versions[sorted_branches[0]]]
         
         # Rule 2: If config exists in consecutive branches up to the highest maintained branch
         # Check if the actual branches are consecutive (no gaps between them)
-        if highest_branch == highest_maintained:
-            # Check if sorted_branches are consecutive in the maintained_branches list
+        if maintained_index.get(highest_branch) == len(maintained_index) - 1:
+            # Check if sorted_branches are consecutive in the maintained branches
             is_consecutive = True
             for i in range(len(sorted_branches) - 1):
-                current_idx = maintained_branches.index(sorted_branches[i])
-                next_idx = maintained_branches.index(sorted_branches[i + 1])
+                current_idx = maintained_index[sorted_branches[i]]
+                next_idx = maintained_index[sorted_branches[i + 1]]
                 if next_idx - current_idx != 1:
                     is_consecutive = False
                     break
@@ -531,6 +857,8 @@ class BaseVersionExtractor:
 
         raw_versions = version_data.get("versions", {})
         maintained_branches = version_data.get("metadata", {}).get("maintained_branches")
+        # Sorted and indexed once for all items
+        maintained_index = None if maintained_branches is None else self.index_branches(maintained_branches)
 
         result: Dict[str, List[str]] = {}
 
@@ -539,7 +867,7 @@ class BaseVersionExtractor:
         for item_name in items_to_process:
             if item_name in raw_versions:
                 branch_versions = raw_versions[item_name]
-                display_versions = self.compute_display_versions(branch_versions, maintained_branches)
+                display_versions = self.compute_display_versions(branch_versions, maintained_index=maintained_index)
                 result[item_name] = display_versions
             else:
                 result[item_name] = []
@@ -47,15 +47,69 @@ Features:
 """
 import sys
 import re
-import json
+from operator import methodcaller
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
 from docsagent.config import config
+from docsagent.core import json_io
 from docsagent.domains.models import ConfigItem, CATALOGS_LANGS, get_default_catalog
 
 
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Split by catalog headings (### to #####)
+_CATALOG_SPLIT_RE = re.compile(r'\n(#{3,5})\s+(.+?)\n')
+
+_EDITION_SPECIFIC_RE = re.compile(r'<EditionSpecific(?:FE|BE)Item\s*/>', re.IGNORECASE)
+
+
+def _split_property(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a bullet line '- **PropertyName**: Value' into (name, value).
+    
+    The bold (or __) markers are optional and the colon may be fullwidth.
+    Returns None unless line starts with '-' or '*' plus whitespace and
+    names a property: non-empty, without '*', '_' or ':'.
+    """
+    if line[:1] not in ('-', '*') or not line[1:2].isspace():
+        return None
+    rest = line[1:].lstrip()
+    if rest.startswith(('**', '__')):
+        rest = rest[2:]
+    
+    # First colon, ASCII or fullwidth
+    colon = rest.find(':')
+    fullwidth = rest.find('：', 0, colon if colon >= 0 else len(rest))
+    if fullwidth >= 0:
+        colon = fullwidth
+    if colon < 0:
+        return None
+    
+    name = rest[:colon]
+    if name.endswith(('**', '__')):
+        name = name[:-2]
+    name = name.strip()
+    if not name or '*' in name or '_' in name:
+        return None
+    return name, rest[colon + 1:]
+
+
+def _section_pattern(scope: str) -> re.Pattern:
+    """Heading of the parameter description section, one alternative per language"""
+    alternatives = [
+        r'Understand\s+' + scope + r'\s+[Pp]arameters?\n',  # English: "Understand FE/BE parameters"
+        scope + r'\s+[Pp]arameter.*[Dd]escription.*\n',  # English alternative
+        scope + r'\s+参数描述\n',  # Chinese
+        scope + r'\s+.*パラメータを理解する.*\n',  # Japanese
+    ]
+    return re.compile(r'##\s+(?:' + '|'.join(alternatives) + ')', re.IGNORECASE)
+
+
+_SECTION_RE = {scope: _section_pattern(scope) for scope in ('FE', 'BE')}
+
+
 class ConfigMetaExtract:
     """Extract config items from FE/BE configuration documentation in multiple languages"""
     
@@ -72,7 +126,10 @@ class ConfigMetaExtract:
         Returns:
             Content with HTML comments removed
         """
-        return re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+        # Most documents have no comment at all; skip the regex for them
+        if '<!--' not in content:
+            return content
+        return _HTML_COMMENT_RE.sub('', content)
     
     def __init__(self):
         """Initialize the extractor."""
@@ -173,22 +230,16 @@ class ConfigMetaExtract:
         # Find config parameters section
         # For FE: "Understand FE parameters" / "FE 参数描述"
         # For BE: "Understand BE parameters" / "BE 参数描述"
-        section_patterns = [
-            r'##\s+Understand\s+' + scope + r'\s+[Pp]arameters?\n',  # English: "Understand FE/BE parameters"
-            r'##\s+' + scope + r'\s+[Pp]arameter.*[Dd]escription.*\n',  # English alternative
-            r'##\s+' + scope + r'\s+参数描述\n',  # Chinese
-            r'##\s+' + scope + r'\s+.*パラメータを理解する.*\n',  # Japanese
-        ]
+        section_re = _SECTION_RE.get(scope) or _section_pattern(scope)
         
         configs = []
         start_pos = None
         
-        for pattern in section_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                start_pos = match.end()
-                logger.debug(f"Found section with pattern: {pattern}")
-                break
+        # One search for all languages; the first matching heading wins
+        match = section_re.search(content)
+        if match:
+            start_pos = match.end()
+            logger.debug(f"Found section: {match.group().strip()}")
         
         if start_pos is None:
             logger.warning(f"Could not find parameter description section in {md_file}")
@@ -205,9 +256,8 @@ class ConfigMetaExtract:
         """Parse config section organized by catalogs (### headings)."""
         configs = []
         
-        # Split by catalog headings (### or ####)
-        catalog_pattern = r'\n(#{3,5})\s+(.+?)\n'
-        parts = re.split(catalog_pattern, section)
+        # Split by catalog headings (### to #####)
+        parts = _CATALOG_SPLIT_RE.split(section)
         
         current_catalog = get_default_catalog()  # Default catalog
         
@@ -267,7 +317,7 @@ class ConfigMetaExtract:
             return None
         
         # Remove EditionSpecific component tags
-        block = re.sub(r'<EditionSpecific(?:FE|BE)Item\s*/>', '', block, flags=re.IGNORECASE)
+        block = _EDITION_SPECIFIC_RE.sub('', block)
         
         # Extract properties from bullet points
         props = self._extract_properties(block)
@@ -342,16 +392,31 @@ class ConfigMetaExtract:
         return "false"
     
     def _extract_properties(self, block: str) -> Dict[str, str]:
-        """Extract properties from bullet points (- **PropertyName**: Value)."""
-        properties = {}
-        
-        # Pattern for markdown list items with bold property names
-        pattern = r'[-*]\s+(?:\*\*|__)?([^*_:]+?)(?:\*\*|__)?[:：]\s*(.+?)(?=\n[-*]\s+(?:\*\*|__)?[^*_:]+?(?:\*\*|__)?[:：]|\n\n|\Z)'
+        """Extract properties from bullet points (- **PropertyName**: Value).
         
-        for match in re.finditer(pattern, block, re.DOTALL):
-            prop_name = match.group(1).strip()
-            prop_value = ' '.join(match.group(2).strip().split())  # Clean whitespace
-            properties[prop_name] = prop_value
+        Single pass over the lines: a property runs until the next top-level
+        property bullet or a blank line; indented and non-property lines in
+        between continue its value. While no property is open (at the start
+        or after a blank line), indented property bullets start one too.
+        """
+        properties = {}
+        prop_name = None
+        parts: List[str] = []
+        
+        # The trailing '' closes the last property like a blank line
+        for line in block.split('\n') + ['']:
+            prop = _split_property(line.lstrip() if prop_name is None else line) if line else None
+            if prop is None and line:
+                if prop_name is not None:
+                    parts.append(line)
+                continue
+            
+            # A blank line or the next property bullet ends the current property
+            if prop_name is not None:
+                prop_value = ' '.join(' '.join(parts).split())  # Clean whitespace
+                if prop_value:
+                    properties[prop_name] = prop_value
+            prop_name, parts = (prop[0], [prop[1]]) if prop else (None, [])
         
         return properties
     
@@ -367,11 +432,10 @@ class ConfigMetaExtract:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Convert to dict
-        data = [cfg.to_dict() for cfg in configs]
+        data = list(map(methodcaller('to_dict'), configs))
         
         # Save to JSON
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        output_path.write_bytes(json_io.dumps(data, indent=True))
         
         logger.info(f"Saved {len(configs)} configs to {output_file}")
     
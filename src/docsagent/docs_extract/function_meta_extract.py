@@ -50,12 +50,12 @@ Features:
     - Saves/loads from JSON format
 """
 import re
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
 from docsagent.config import config
+from docsagent.core import json_io
 from docsagent.domains.models import FunctionItem
 
 
@@ -408,8 +408,7 @@ class FunctionMetaExtract:
         
         for func in functions:
             func_file = meta_dir / f"{func.name}.meta"
-            with func_file.open('w', encoding='utf-8') as f:
-                json.dump(func.to_dict(), f, ensure_ascii=False, indent=2)
+            func_file.write_bytes(json_io.dumps(func.to_dict(), indent=True))
         
         logger.info(f"Saved {len(functions)} functions to {meta_dir}")
     
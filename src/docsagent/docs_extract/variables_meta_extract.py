@@ -47,12 +47,13 @@ Features:
 """
 import sys
 import re
-import json
+from operator import methodcaller
 from pathlib import Path
 from typing import Dict, List, Optional
 from loguru import logger
 
 from docsagent.config import config
+from docsagent.core import json_io
 from docsagent.domains.models import VariableItem
 
 
@@ -276,11 +277,10 @@ class VariablesMetaExtract:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Convert to dict
-        data = [var.to_dict() for var in variables]
+        data = list(map(methodcaller('to_dict'), variables))
         
         # Save to JSON
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        output_path.write_bytes(json_io.dumps(data, indent=True))
         
         logger.info(f"Saved {len(variables)} variables to {output_file}")
     
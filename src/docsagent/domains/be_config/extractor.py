@@ -46,7 +46,7 @@ class BEConfigExtractor(ItemExtractor):
     
     def __init__(self, code_paths: List[str] = None):
         """Initialize the BE config extractor"""
-        self.supported_extensions = {'.h', '.hpp', '.cc', '.cpp'}
+        self.supported_extensions = frozenset({'.h', '.hpp', '.cc', '.cpp'})
         self.meta_path = Path(config.META_DIR) / "be_config.meta"
         self.code_paths = code_paths or self._get_source_code_paths()
         Path(self.meta_path).parent.mkdir(parents=True, exist_ok=True)
@@ -62,6 +62,9 @@ class BEConfigExtractor(ItemExtractor):
         full_paths = [str(starrocks_dir / path) for path in config_paths]
         return full_paths
     
+    def _extract_file(self, file_path: str) -> List[ConfigItem]:
+        return self._extract_config_items(file_path)
+    
     def _extract_config_items(self, file_path: str) -> List[ConfigItem]:
         """Extract configuration items from C++ files using regex (simple and reliable)"""
         # Skip non-C++ files
@@ -76,7 +79,7 @@ class BEConfigExtractor(ItemExtractor):
             if "CONF_" not in content:
                 return []
 
-            logger.debug(f"Processing file: {file_path}")
+            logger.debug("Processing file: {}", file_path)
             return self._extract_with_regex(content, file_path)
         except Exception as e:
             logger.warning(f"Failed to parse {file_path}: {e}")
@@ -140,7 +143,7 @@ class BEConfigExtractor(ItemExtractor):
             
             line_number = content[:match.start()].count('\n') + 1
             name_alias[target_name] = alias_name
-            logger.debug(f"Found alias config: {alias_name} -> {target_name} at line {line_number}")
+            logger.debug("Found alias config: {} -> {} at line {}", alias_name, target_name, line_number)
                     
         
         # Extract standard CONF_* configs
@@ -166,9 +169,9 @@ class BEConfigExtractor(ItemExtractor):
             alias_name = name_alias.get(field_name, None)
             if alias_name:
                 field_name = alias_name
-                logger.debug(f"Found config item: {field_name}, alias: {alias_name} at line {line_number}")
+                logger.debug("Found config item: {}, alias: {} at line {}", field_name, alias_name, line_number)
             else:
-                logger.debug(f"Found config item: {field_name} at line {line_number}")
+                logger.debug("Found config item: {} at line {}", field_name, line_number)
 
             item = ConfigItem(
                 name=field_name,
@@ -192,19 +195,7 @@ class BEConfigExtractor(ItemExtractor):
         """Scan all files and extract config items (required by ExtractorMixin)"""
         sources_files = self.code_paths
 
-        all_items: List[ConfigItem] = []
-        
-        for file_path in sources_files:
-            try:
-                config_items = self._extract_config_items(file_path)
-                all_items.extend(config_items)
-                
-                if config_items:
-                    logger.debug(f"Found {len(config_items)} config items in {file_path}")
-                else:
-                    logger.debug(f"No config items found in {file_path}")
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
+        all_items: List[ConfigItem] = self.extract_parallel(sources_files, workers=kwargs.get('extract_workers'))
 
         # Load existing metadata and merge
         exists_metas = {}
@@ -214,9 +205,10 @@ class BEConfigExtractor(ItemExtractor):
         for meta in all_items:
             if meta.name in exists_metas:
                 meta.useLocations = exists_metas[meta.name].useLocations
-                meta.documents = exists_metas[meta.name].documents
+                meta.documents = dict(exists_metas[meta.name].documents)
                 meta.catalog = exists_metas[meta.name].catalog
                 meta.version = exists_metas[meta.name].version
+                meta.contentHashes = dict(exists_metas[meta.name].contentHashes)
 
         # Search for code usages if configured
         if 'force_search_code' in kwargs and kwargs['force_search_code']:
@@ -33,7 +33,7 @@ class BEConfigGitPersister(GitPersister):
     def __init__(self):
         super().__init__(domain="be_config")
     
-    def get_file_mappings(self) -> Dict[str, str]:
+    def _compute_file_mappings(self) -> Dict[str, str]:
         """
         Get file mappings for BE configuration documentation.
         
@@ -62,7 +62,7 @@ class BEConfigGitPersister(GitPersister):
         if not mappings:
             logger.warning(
                 "No file mappings generated for BE config. "
-                "Please configure target paths in get_file_mappings()."
+                "Please configure target paths in _compute_file_mappings()."
             )
         
         return mappings
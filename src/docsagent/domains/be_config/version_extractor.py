@@ -21,6 +21,29 @@ from docsagent.core.version_extractor import BaseVersionExtractor
 from docsagent.config import config
 
 
+# Standard CONF_* macros
+_CONF_RE = re.compile(
+    rb'CONF_m?'  # CONF_ with optional 'm' for mutable
+    rb'\w+\s*'  # Type (Int32, String, Bool, etc.)
+    rb'\(\s*'  # Opening parenthesis
+    rb'(\w+)\s*,\s*'  # Field name (capture group)
+    rb'"[^"]*"\s*'  # Default value in quotes
+    rb'(?:,\s*"[^"]*")?\s*'  # Optional third parameter (for String_enum)
+    rb'\)',  # Closing parenthesis
+    re.MULTILINE
+)
+
+# CONF_Alias(alias_name, target_name)
+_CONF_ALIAS_RE = re.compile(
+    rb'CONF_Alias\s*'  # CONF_Alias
+    rb'\(\s*'  # Opening parenthesis
+    rb'(\w+)\s*,\s*'  # Alias name (capture group 1)
+    rb'(\w+)\s*'  # Target name (capture group 2)
+    rb'\)',  # Closing parenthesis
+    re.MULTILINE
+)
+
+
 class BEConfigVersionExtractor(BaseVersionExtractor):
     """
     Version tracker for BE configuration items.
@@ -40,7 +63,7 @@ class BEConfigVersionExtractor(BaseVersionExtractor):
             item_identifier_field="name"
         )
     
-    def _extract_all_items_from_content(self, content: str) -> set:
+    def _extract_all_items_from_bytes(self, content: bytes) -> set:
         """
         Extract all BE config names from config.h/cpp content.
         
@@ -48,43 +71,21 @@ class BEConfigVersionExtractor(BaseVersionExtractor):
         Uses the same pattern as BEConfigExtractor to ensure consistency.
         
         Args:
-            content: File content
+            content: File content (bytes)
         
         Returns:
             Set of config names found
         """
         config_names = set()
         
-        # Pattern 1: Standard CONF_* macros
-        standard_pattern = re.compile(
-            r'CONF_m?'  # CONF_ with optional 'm' for mutable
-            r'\w+\s*'  # Type (Int32, String, Bool, etc.)
-            r'\(\s*'  # Opening parenthesis
-            r'(\w+)\s*,\s*'  # Field name (capture group)
-            r'"[^"]*"\s*'  # Default value in quotes
-            r'(?:,\s*"[^"]*")?\s*'  # Optional third parameter (for String_enum)
-            r'\)',  # Closing parenthesis
-            re.MULTILINE
-        )
-        
-        # Pattern 2: CONF_Alias(alias_name, target_name)
-        alias_pattern = re.compile(
-            r'CONF_Alias\s*'  # CONF_Alias
-            r'\(\s*'  # Opening parenthesis
-            r'(\w+)\s*,\s*'  # Alias name (capture group 1)
-            r'(\w+)\s*'  # Target name (capture group 2)
-            r'\)',  # Closing parenthesis
-            re.MULTILINE
-        )
-        
         # Extract standard configs
-        for match in standard_pattern.finditer(content):
-            field_name = match.group(1)
+        for match in _CONF_RE.finditer(content):
+            field_name = match.group(1).decode()
             config_names.add(field_name)
         
         # Extract aliases - use alias name (first capture group)
-        for match in alias_pattern.finditer(content):
-            alias_name = match.group(1)
+        for match in _CONF_ALIAS_RE.finditer(content):
+            alias_name = match.group(1).decode()
             config_names.add(alias_name)
         
         return config_names
@@ -32,7 +32,7 @@ class FEConfigExtractor(ItemExtractor):
     
     def __init__(self, code_paths: List[str] = None):
         """Initialize the config extractor (regex-based, simple and reliable)"""
-        self.supported_extensions = {'.java'}
+        self.supported_extensions = frozenset({'.java'})
         self.meta_path = Path(config.META_DIR) / "fe_config.meta"
         self.code_paths = code_paths or self._get_source_code_paths()
         Path(self.meta_path).parent.mkdir(parents=True, exist_ok=True)
@@ -49,6 +49,9 @@ class FEConfigExtractor(ItemExtractor):
         full_paths = [str(starrocks_dir / path) for path in config_paths]
         return full_paths
     
+    def _extract_file(self, file_path: str) -> List[ConfigItem]:
+        return self._extract_config_items(file_path)
+    
     def _extract_config_items(self, file_path: str) -> List[ConfigItem]:
         """Extract configuration items from Java files using regex (simple and reliable)"""
         # Skip non-Java files
@@ -63,7 +66,7 @@ class FEConfigExtractor(ItemExtractor):
             if "@ConfField" not in content:
                 return []
 
-            logger.debug(f"Processing file: {file_path}")
+            logger.debug("Processing file: {}", file_path)
             return self._extract_with_regex(content, file_path)
         except Exception as e:
             logger.warning(f"Failed to parse {file_path}: {e}")
@@ -132,7 +135,7 @@ class FEConfigExtractor(ItemExtractor):
                 version=None
             )
             
-            logger.debug(f"Found config item: {field_name} at line {line_number}")
+            logger.debug("Found config item: {} at line {}", field_name, line_number)
             items.append(item)
         
         return items
@@ -141,19 +144,7 @@ class FEConfigExtractor(ItemExtractor):
         """Scan all files in code paths and extract config items"""
         sources_files = self.code_paths
 
-        all_items: List[ConfigItem] = []
-        
-        for file_path in sources_files:
-            try:
-                config_items = self._extract_config_items(file_path)
-                all_items.extend(config_items)
-                
-                if config_items:
-                    logger.debug(f"Found {len(config_items)} config items in {file_path}")
-                else:
-                    logger.debug(f"No config items found in {file_path}")
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
+        all_items: List[ConfigItem] = self.extract_parallel(sources_files, workers=kwargs.get('extract_workers'))
 
         # Load existing metadata and merge
         exists_metas = {}
@@ -164,9 +155,10 @@ class FEConfigExtractor(ItemExtractor):
         for meta in all_items:
             if meta.name in exists_metas:
                 meta.useLocations = exists_metas[meta.name].useLocations
-                meta.documents = exists_metas[meta.name].documents
+                meta.documents = dict(exists_metas[meta.name].documents)
                 meta.catalog = exists_metas[meta.name].catalog
                 meta.version = exists_metas[meta.name].version
+                meta.contentHashes = dict(exists_metas[meta.name].contentHashes)
 
         # Search for code usages if configured
         if 'force_search_code' in kwargs and kwargs['force_search_code']:
@@ -33,7 +33,7 @@ class FEConfigGitPersister(GitPersister):
     def __init__(self):
         super().__init__(domain="fe_config")
     
-    def get_file_mappings(self) -> Dict[str, str]:
+    def _compute_file_mappings(self) -> Dict[str, str]:
         """
         Get file mappings for FE configuration documentation.
         
@@ -73,7 +73,7 @@ class FEConfigGitPersister(GitPersister):
         if not mappings:
             logger.warning(
                 "No file mappings generated for FE config. "
-                "Please configure target paths in get_file_mappings()."
+                "Please configure target paths in _compute_file_mappings()."
             )
         
         return mappings
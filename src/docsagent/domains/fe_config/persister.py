@@ -16,11 +16,10 @@
 
 from pathlib import Path
 from typing import List
-from collections import defaultdict
-from string import Template
 from loguru import logger
 
 from docsagent.core import DocPersister
+from docsagent.core.protocols import load_template
 from docsagent.domains.models import ConfigItem, CATALOGS_LANGS
 from docsagent import config
 
@@ -35,48 +34,37 @@ class FEConfigPersister(DocPersister):
     
     def _save_documents(self, configs: List[ConfigItem], output_dir: str, target_langs: List[str]) -> None:
         """Generate and save markdown docs for each language"""
-        catalogs = self._organize_by_catalog(configs)
+        # Grouped and sorted once; the order is the same for every language
+        catalogs = self.group_by_category(configs)
+        logger.debug(f"Grouped into {len(catalogs)} catalogs")
+        sorted_catalogs = [(catalog, catalogs[catalog]) for catalog in CATALOGS_LANGS if catalog in catalogs]
         
         for lang in target_langs:
             logger.debug(f"Generating {lang} docs...")
             
-            target_docs = {lang: ""}
-            
-            for catalog in CATALOGS_LANGS:
-                if catalog not in catalogs or not catalogs[catalog]:
-                    continue
-                
-                target_docs[lang] += f"### {CATALOGS_LANGS[catalog][lang]}\n\n"
-                sorted_configs = sorted(catalogs[catalog], key=lambda c: c.name)
+            parts = []
+            for catalog, sorted_configs in sorted_catalogs:
+                parts.append(f"### {CATALOGS_LANGS[catalog][lang]}\n\n")
                 for config in sorted_configs:
-                    if lang in config.documents and config.documents[lang].strip():
-                        target_docs[lang] += config.documents[lang].strip() + "\n\n"
+                    body = self.format(config, lang)
+                    if body:
+                        parts.append(body + "\n\n")
                     else:
                         logger.warning(f"Missing {lang} doc: {config.name}")
             
-            self._apply_template_and_save(target_docs, lang, output_dir)
+            self._apply_template_and_save({lang: "".join(parts)}, lang, output_dir)
         
         logger.debug(f"Saved docs for {len(target_langs)} languages")
     
-    def _organize_by_catalog(self, configs: List[ConfigItem]) -> dict:
-        """Group configs by catalog"""
-        catalogs = defaultdict(list)
-        for cc in configs:
-            catalogs[cc.catalog].append(cc)
-        
-        logger.debug(f"Grouped into {len(catalogs)} catalogs")
-        return catalogs
-    
     def _apply_template_and_save(self, target_docs: dict, lang: str, output_dir: str) -> None:
         """Apply template ($content substitution) and save to file"""
         template_path = self.docs_module_dir / lang / "FE_configuration.md"
+        template = load_template(template_path)
         
-        if not template_path.exists():
+        if template is None:
             logger.warning(f"Template not found: {template_path}")
             final_content = target_docs[lang]
         else:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = Template(f.read())
             final_content = template.safe_substitute(outputs=target_docs[lang])
         
         output_path = Path(output_dir) / lang / "FE_configuration.md"
@@ -21,6 +21,19 @@ from docsagent.core.version_extractor import BaseVersionExtractor
 from docsagent.config import config
 
 
+# All @ConfField annotated fields, same pattern as FEConfigExtractor._extract_with_regex
+_CONF_FIELD_RE = re.compile(
+    rb'@ConfField\s*(?:\([^)]*\))?\s*'  # @ConfField with optional parameters
+    rb'(?:@\w+(?:\([^)]*\))?\s*)*'  # Skip other annotations like @Deprecated
+    rb'(?:(?:public|protected|private|static|final|transient|volatile|synchronized|native|strictfp)\s+)*'  # All modifiers
+    rb'[\w\[\]<>,\s]+?\s+'  # Type (including generics, arrays)
+    rb'(\w+)\s*'  # Field name (capture group)
+    rb'=\s*'  # Assignment
+    rb'[^;]+;',  # Default value until semicolon
+    re.MULTILINE | re.DOTALL
+)
+
+
 class FEConfigVersionExtractor(BaseVersionExtractor):
     """
     Version tracker for FE configuration items.
@@ -39,7 +52,7 @@ class FEConfigVersionExtractor(BaseVersionExtractor):
             item_identifier_field="name"
         )
     
-    def _extract_all_items_from_content(self, content: str) -> set:
+    def _extract_all_items_from_bytes(self, content: bytes) -> set:
         """
         Extract all FE config names from Config.java content.
         
@@ -47,28 +60,15 @@ class FEConfigVersionExtractor(BaseVersionExtractor):
         Uses the same pattern as FEConfigExtractor to ensure consistency.
         
         Args:
-            content: File content
+            content: File content (bytes)
         
         Returns:
             Set of config names found
         """
-        # Pattern to extract all @ConfField annotated fields
-        # Same pattern as FEConfigExtractor._extract_with_regex
-        pattern = re.compile(
-            r'@ConfField\s*(?:\([^)]*\))?\s*'  # @ConfField with optional parameters
-            r'(?:@\w+(?:\([^)]*\))?\s*)*'  # Skip other annotations like @Deprecated
-            r'(?:(?:public|protected|private|static|final|transient|volatile|synchronized|native|strictfp)\s+)*'  # All modifiers
-            r'[\w\[\]<>,\s]+?\s+'  # Type (including generics, arrays)
-            r'(\w+)\s*'  # Field name (capture group)
-            r'=\s*'  # Assignment
-            r'[^;]+;',  # Default value until semicolon
-            re.MULTILINE | re.DOTALL
-        )
-        
         # Extract all field names
         field_names = set()
-        for match in pattern.finditer(content):
-            field_name = match.group(1)
+        for match in _CONF_FIELD_RE.finditer(content):
+            field_name = match.group(1).decode()
             field_names.add(field_name)
         
         return field_names
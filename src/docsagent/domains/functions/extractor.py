@@ -17,13 +17,13 @@
 import os
 import re
 import ast
-import json
 
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
 from docsagent import config
+from docsagent.core import json_io
 from docsagent.core.protocols import ItemExtractor
 from docsagent.domains.models import FunctionItem
 from docsagent.tools.code_search import CodeFileSearch
@@ -35,7 +35,7 @@ class FunctionsExtractor(ItemExtractor):
     
     def __init__(self, code_paths: List[str] = None):
         """Initialize the function extractor"""
-        self.supported_extensions = {'.py', '.cpp', '.h', '.hpp'}
+        self.supported_extensions = frozenset({'.py', '.cpp', '.h', '.hpp'})
         self.meta_path = Path(config.META_DIR) / "functions/"
         self.code_paths = code_paths or self._get_default_code_paths()
         Path(self.meta_path).mkdir(parents=True, exist_ok=True)
@@ -63,7 +63,7 @@ class FunctionsExtractor(ItemExtractor):
         4. Return aggregated FunctionItem list
         """
         # Skip non-supported files
-        if not any(file_path.lower().endswith(ext) for ext in self.supported_extensions):
+        if not file_path.lower().endswith(tuple(self.supported_extensions)):
             return []
 
         if 'functions.py' not in file_path:
@@ -77,7 +77,7 @@ class FunctionsExtractor(ItemExtractor):
             if "vectorized_functions" not in content:
                 return []
 
-            logger.debug(f"Processing file: {file_path}")
+            logger.debug("Processing file: {}", file_path)
             
             # Step 1: Parse all raw function definitions
             raw_functions = self._parse_functions_file(content, file_path)
@@ -206,8 +206,8 @@ class FunctionsExtractor(ItemExtractor):
             # Deduplicate aliases and sort
             unique_aliases = sorted(list(data['aliases']))
             
-            # Deduplicate implement_fns
-            unique_implement_fns = list(set(fn for fn in data['implement_fns'] if fn))
+            # Deduplicate and sort implement_fns
+            unique_implement_fns = sorted(set(fn for fn in data['implement_fns'] if fn))
             
             # Determine catalog from function name if not set
             
@@ -232,7 +232,7 @@ class FunctionsExtractor(ItemExtractor):
         logger.debug(f"Aggregated into {len(aggregated)} unique functions")
         for item in aggregated[:5]:  # Log first 5 as examples
             alias_info = f" (aliases: {', '.join(item.alias)})" if item.alias else ""
-            logger.debug(f"  {item.name}{alias_info}: {len(item.signature)} overload(s)")
+            logger.debug("  {}{}: {} overload(s)", item.name, alias_info, len(item.signature))
         
         return aggregated
     
@@ -318,9 +318,9 @@ class FunctionsExtractor(ItemExtractor):
                     all_items[key] = item
                 
                 if function_items:
-                    logger.debug(f"Found {len(function_items)} function items in {file_path}")
+                    logger.debug("Found {} function items in {}", len(function_items), file_path)
                 else:
-                    logger.debug(f"No function items found in {file_path}")
+                    logger.debug("No function items found in {}", file_path)
             except Exception as e:
                 logger.error(f"Error processing file {file_path}: {e}")
 
@@ -415,7 +415,7 @@ class FunctionsExtractor(ItemExtractor):
             # Update items with usage locations (remove duplicates)
         for item in exists_metas:
             if item.name in cases_by_func:
-                item.testCases = list(set(cases_by_func[item.name]))[:3]
+                item.testCases = sorted(set(cases_by_func[item.name]))[:3]
     
     def _generate_search_keywords(self, item: FunctionItem) -> List[str]:
         keywords = []
@@ -438,12 +438,12 @@ class FunctionsExtractor(ItemExtractor):
             for root, dirs, files in os.walk(self.meta_path):
                 for file in files:
                     if file.endswith('.meta'):
-                        with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
-                            data = json.load(f)
+                        with open(os.path.join(root, file), 'rb') as f:
+                            data = json_io.loads(f.read())
                         items.append(FunctionItem.from_dict(data))
             return items
             
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in meta file: {e}")
             return []
         except Exception as e:
@@ -36,7 +36,7 @@ class FunctionsGitPersister(GitPersister):
     def __init__(self):
         super().__init__(domain="functions")
     
-    def get_file_mappings(self) -> Dict[str, str]:
+    def _compute_file_mappings(self) -> Dict[str, str]:
         """
         Get file mappings for SQL functions documentation.
         
@@ -82,7 +82,7 @@ class FunctionsGitPersister(GitPersister):
         if not mappings:
             logger.warning(
                 "No file mappings generated for functions. "
-                "Please configure target paths in get_file_mappings()."
+                "Please configure target paths in _compute_file_mappings()."
             )
         
         return mappings
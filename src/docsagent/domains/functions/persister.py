@@ -14,14 +14,13 @@
 
 """FEConfigPersister: Save multi-language docs and metadata"""
 
-import json
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 from collections import defaultdict
 from string import Template
 from loguru import logger
 
-from docsagent.core import DocPersister
+from docsagent.core import DocPersister, json_io
 from docsagent.domains.models import FunctionItem
 from docsagent import config
 
@@ -35,6 +34,20 @@ class FunctionsPersister(DocPersister):
 
     def _save_documents(self, funcs: List[FunctionItem], output_dir: str, target_langs: List[str]) -> None:
         """Generate and save markdown docs for each language"""
+        self.save_batch(self._document_files(funcs, output_dir, target_langs))
+        logger.debug(f"Saved docs for {len(target_langs)} languages")
+    
+    def target_path(self, item: FunctionItem, lang: str, output_dir: str) -> Path:
+        """Each function is written to <lang>/functions/<catalog>/<name>.md"""
+        return Path(output_dir) / lang / "functions" / item.catalog / f"{item.name}.md"
+    
+    def format(self, item: FunctionItem, lang: str) -> str:
+        """Function pages are written as generated, without stripping"""
+        return item.documents.get(lang, "")
+    
+    def _document_files(self, funcs: List[FunctionItem], output_dir: str, target_langs: List[str]) -> List[Tuple[Path, str]]:
+        """One markdown file per function and language"""
+        files = []
         for item in funcs:
             if item.catalog is None:
                 logger.info(f"Skipping function {item.name} due to missing catalog")
@@ -44,28 +57,20 @@ class FunctionsPersister(DocPersister):
             for lang in target_langs:
                 logger.debug(f"Generating {lang} docs...")
                 
-                if item.documents.get(lang, "").strip() == "":
+                body = self.format(item, lang)
+                if body.strip() == "":
                     lost_lang.append(lang)
                     continue
 
-                output_path = Path(output_dir) / lang / "functions" / item.catalog / f"{item.name}.md"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(item.documents.get(lang, ""))
+                files.append((self.target_path(item, lang, output_dir), body))
             logger.info(f"Skipping function {item.name} for lost languages: {lost_lang}")
         
-        logger.debug(f"Saved docs for {len(target_langs)} languages")
+        return files
 
     def _save_meta(self, items: List[FunctionItem]) -> None:
-        """Save metadata as JSON file"""
-        if not self.meta_path.exists():
-            self.meta_path.mkdir(parents=True, exist_ok=True)
-
-        for item in items:
-            meta_file = self.meta_path / f"{item.name}.meta"
-
-            with open(meta_file, 'w', encoding='utf-8') as f:
-                json.dump(item.to_dict(), f, ensure_ascii=False, indent=2)
-            
-            logger.debug(f"Saved metadata → {meta_file}")
\ No newline at end of file
+        """Save metadata as one JSON file per function, rewriting only changed ones"""
+        written = self.save_batch([
+            (self.meta_path / f"{item.name}.meta", json_io.dumps(item.to_dict(), indent=True))
+            for item in items
+        ], skip_unchanged=True)
+        logger.debug(f"Saved metadata for {written}/{len(items)} changed functions → {self.meta_path}")
@@ -16,9 +16,12 @@
 """Domain models for DocsAgent"""
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any
+from typing import ClassVar, List, Dict, Any, Tuple
 
-from docsagent.core.protocols import DocumentableItem
+from docsagent.core.protocols import DocumentableItem, ContentHashMixin
+from docsagent.core.abcs import assert_slotted, register_item_class
+from docsagent.core.serialize import FieldsTupleMixin
+from docsagent.core.intern import InternedDocumentsMixin
 import json
 
 
@@ -90,8 +93,8 @@ def get_default_catalog() -> str:
     return 'Other'
 
 
-@dataclass
-class ConfigItem:
+@dataclass(slots=True)
+class ConfigItem(ContentHashMixin, FieldsTupleMixin, InternedDocumentsMixin):
     """
     FE/BE configuration item model.
     
@@ -109,6 +112,7 @@ class ConfigItem:
         useLocations: List of places where the config is used
         documents: Multi-language documentation (lang code -> content)
         catalog: Documentation category (e.g., 'Logging', 'Server', etc.)
+        contentHashes: Input hash of each derived doc (see content_hashes)
     """
     # Required fields (from source code parsing)
     name: str
@@ -124,6 +128,13 @@ class ConfigItem:
     documents: Dict[str, str] = field(default_factory=dict)  # Multi-language documentation
     catalog: str = None  # Options: VALID_CATALOGS
     version: List[str] = field(default_factory=list)  # Version introduced
+    contentHashes: Dict[str, str] = field(default_factory=dict)  # Lang -> input hash of derived docs
+    
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        'name', 'type', 'defaultValue', 'comment', 'isMutable', 'scope', 'define',
+        'useLocations', 'documents', 'catalog', 'version', 'contentHashes',
+    )
+    CATEGORY_FIELD: ClassVar[str] = 'catalog'
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -138,8 +149,8 @@ class ConfigItem:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
-@dataclass
-class VariableItem:
+@dataclass(slots=True)
+class VariableItem(ContentHashMixin, FieldsTupleMixin, InternedDocumentsMixin):
     """
     Variable configuration item model, implements DocumentableItem protocol.
     
@@ -158,6 +169,13 @@ class VariableItem:
     useLocations: List[str] = field(default_factory=list)
     documents: Dict[str, str] = field(default_factory=dict)  # Multi-language documentation
     version: List[str] = field(default_factory=list)  # Version introduced
+    contentHashes: Dict[str, str] = field(default_factory=dict)  # Lang -> input hash of derived docs
+
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        'name', 'show', 'type', 'defaultValue', 'comment', 'invisible', 'scope',
+        'useLocations', 'documents', 'version', 'contentHashes',
+    )
+    CATEGORY_FIELD: ClassVar[str] = 'scope'
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -171,8 +189,8 @@ class VariableItem:
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)    
     
-@dataclass
-class FunctionItem:
+@dataclass(slots=True)
+class FunctionItem(ContentHashMixin, FieldsTupleMixin, InternedDocumentsMixin):
     """
     Variable configuration item model, implements DocumentableItem protocol.
     
@@ -191,6 +209,13 @@ class FunctionItem:
     useLocations: List[str] = field(default_factory=list)
     documents: Dict[str, str] = field(default_factory=dict)  # Multi-language documentation
     version: List[str] = field(default_factory=list)  # Version introduced
+    contentHashes: Dict[str, str] = field(default_factory=dict)  # Lang -> input hash of derived docs
+
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        'name', 'alias', 'signature', 'catalog', 'module', 'implement_fns', 'testCases',
+        'useLocations', 'documents', 'version', 'contentHashes',
+    )
+    CATEGORY_FIELD: ClassVar[str] = 'catalog'
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -202,4 +227,9 @@ class FunctionItem:
     # ============ Additional Methods ============
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)    
\ No newline at end of file
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+
+# Nominal registration, so runtime checks skip the structural Protocol walk
+for _item_class in (ConfigItem, VariableItem, FunctionItem):
+    register_item_class(assert_slotted(_item_class))
@@ -45,7 +45,7 @@ class VariablesExtractor(ItemExtractor):
     
     def __init__(self, code_paths: List[str] = None):
         """Initialize the variables extractor"""
-        self.supported_extensions = {'.java', '.h', '.cpp', '.hpp'}
+        self.supported_extensions = frozenset({'.java', '.h', '.cpp', '.hpp'})
         self.meta_path = Path(config.META_DIR) / "variables.meta"
         self.code_paths = code_paths or self._get_source_code_paths()
         Path(self.meta_path).parent.mkdir(parents=True, exist_ok=True)
@@ -62,6 +62,9 @@ class VariablesExtractor(ItemExtractor):
         full_paths = [str(starrocks_dir / path) for path in config_paths]
         return full_paths
     
+    def _extract_file(self, file_path: str) -> List[VariableItem]:
+        return self._extract_variables(file_path)
+    
     def _extract_variables(self, file_path: str) -> List[VariableItem]:
         """Extract configuration items from Java files using regex (simple and reliable)"""
         # Skip non-Java files
@@ -76,12 +79,12 @@ class VariablesExtractor(ItemExtractor):
             if "@VarAttr" not in content and "@VariableMgr.VarAttr" not in content:
                 return []
 
-            logger.debug(f"Processing file: {file_path}")
+            logger.debug("Processing file: {}", file_path)
             items = self._extract_with_regex(content, file_path)
             
             logger.info(f"Extracted {len(items)} variable items from {file_path}")
             for i in items:
-                logger.debug(f"  - {i.show} (type: {i.type}, default: {i.defaultValue})")
+                logger.debug("  - {} (type: {}, default: {})", i.show, i.type, i.defaultValue)
             
             return items
         except Exception as e:
@@ -143,7 +146,7 @@ class VariablesExtractor(ItemExtractor):
                 )
                 
                 items.append(item)
-                logger.debug(f"Extracted variable: {item.name} (type: {item.type}, default: {item.defaultValue})")
+                logger.debug("Extracted variable: {} (type: {}, default: {})", item.name, item.type, item.defaultValue)
                 
             except Exception as e:
                 logger.warning(f"Failed to parse variable at position {match.start()}: {e}")
@@ -198,19 +201,7 @@ class VariablesExtractor(ItemExtractor):
         """Scan all files and extract variable items (required by ExtractorMixin)"""
         sources_files = self.code_paths
 
-        all_items: List[VariableItem] = []
-        
-        for file_path in sources_files:
-            try:
-                var_items = self._extract_variables(file_path)
-                all_items.extend(var_items)
-                
-                if var_items:
-                    logger.debug(f"Found {len(var_items)} variable items in {file_path}")
-                else:
-                    logger.debug(f"No variable items found in {file_path}")
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
+        all_items: List[VariableItem] = self.extract_parallel(sources_files, workers=kwargs.get('extract_workers'))
                 
         # Load existing metadata and merge
         exists_metas = {}
@@ -220,8 +211,9 @@ class VariablesExtractor(ItemExtractor):
         for meta in all_items:
             if meta.show in exists_metas:
                 meta.useLocations = exists_metas[meta.show].useLocations
-                meta.documents = exists_metas[meta.show].documents
+                meta.documents = dict(exists_metas[meta.show].documents)
                 meta.version = exists_metas[meta.show].version
+                meta.contentHashes = dict(exists_metas[meta.show].contentHashes)
             
         # Search for code usages if configured
         if 'force_search_code' in kwargs and kwargs['force_search_code']:
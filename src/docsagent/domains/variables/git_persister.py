@@ -33,7 +33,7 @@ class VariablesGitPersister(GitPersister):
     def __init__(self):
         super().__init__(domain="variables")
     
-    def get_file_mappings(self) -> Dict[str, str]:
+    def _compute_file_mappings(self) -> Dict[str, str]:
         """
         Get file mappings for system variables documentation.
         
@@ -62,7 +62,7 @@ class VariablesGitPersister(GitPersister):
         if not mappings:
             logger.warning(
                 "No file mappings generated for variables. "
-                "Please configure target paths in get_file_mappings()."
+                "Please configure target paths in _compute_file_mappings()."
             )
         
         return mappings
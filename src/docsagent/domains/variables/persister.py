@@ -17,10 +17,10 @@
 from pathlib import Path
 from typing import List
 from collections import defaultdict
-from string import Template
 from loguru import logger
 
 from docsagent.core import DocPersister
+from docsagent.core.protocols import load_template
 from docsagent.domains.models import VariableItem
 from docsagent import config
 
@@ -54,15 +54,18 @@ class VariablesPersister(DocPersister):
 
         for lang in target_langs:
             logger.debug(f"Generating {lang} docs...")
+            parts = []
             for var in variables:
-                if lang in var.documents and var.documents[lang].strip():
+                body = self.format(var, lang)
+                if body:
                     if var.invisible:
-                        # target_docs[lang] += f"<div style='display: none'>\n{var.documents[lang]}\n</div>\n\n"
+                        # parts.append(f"<div style='display: none'>\n{body}\n</div>\n\n")
                         logger.debug(f"Adding invisible variable to docs: {var.show}")
                         continue
                     else:
-                        target_docs[lang] += var.documents[lang].strip() + "\n\n"
+                        parts.append(body + "\n\n")
                         logger.debug(f"Adding variable to docs: {var.show}")
+            target_docs[lang] = "".join(parts)
                         
             self._apply_template_and_save(target_docs, lang, output_dir)
         
@@ -71,13 +74,12 @@ class VariablesPersister(DocPersister):
     def _apply_template_and_save(self, target_docs: dict, lang: str, output_dir: str) -> None:
         """Apply template ($content substitution) and save to file"""
         template_path = self.docs_module_dir / lang / "System_variable.md"
+        template = load_template(template_path)
         
-        if not template_path.exists():
+        if template is None:
             logger.warning(f"Template not found: {template_path}")
             final_content = target_docs[lang]
         else:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = Template(f.read())
             final_content = template.safe_substitute(global_variables_list=target_docs["global"], variables_lists=target_docs[lang])
         
         output_path = Path(output_dir) / lang / "System_variable.md"
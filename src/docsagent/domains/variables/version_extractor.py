@@ -21,6 +21,23 @@ from docsagent.core.version_extractor import BaseVersionExtractor
 from docsagent.config import config
 
 
+# [modifiers] String CONSTANT_NAME = "value"; modifiers in any order (consistent with extractor)
+_STRING_CONSTANT_RE = re.compile(
+    rb'(?:(?:public|protected|private|static|final|transient|volatile|synchronized|native|strictfp)\s+)*String\s+(\w+)\s*=\s*["\']([^"\']+)["\']',
+    re.MULTILINE
+)
+
+# @VarAttr(...show = "value"...) or @VarAttr(...show = CONSTANT...), capturing the parameters
+_VAR_ATTR_RE = re.compile(
+    rb'@(?:VariableMgr\.)?VarAttr\s*\(([^)]+)\)',
+    re.MULTILINE | re.DOTALL
+)
+
+# show / name parameter value: string literal or constant reference
+_SHOW_PARAM_RE = re.compile(rb'show\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\w+))')
+_NAME_PARAM_RE = re.compile(rb'name\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\w+))')
+
+
 class VariablesVersionExtractor(BaseVersionExtractor):
     """
     Version tracker for StarRocks variables (Session and Global).
@@ -44,7 +61,7 @@ class VariablesVersionExtractor(BaseVersionExtractor):
             item_identifier_field="show"  # Use 'show' field instead of 'name'
         )
     
-    def _extract_all_items_from_content(self, content: str) -> set:
+    def _extract_all_items_from_bytes(self, content: bytes) -> set:
         """
         Extract all variable show names from content.
         
@@ -52,7 +69,7 @@ class VariablesVersionExtractor(BaseVersionExtractor):
         Extracts the 'show' parameter value from @VarAttr annotations.
         
         Args:
-            content: File content
+            content: File content (bytes)
         
         Returns:
             Set of variable show names found
@@ -60,38 +77,26 @@ class VariablesVersionExtractor(BaseVersionExtractor):
         show_names = set()
         
         # First, build a map of constants to their string values
-        # Pattern: [modifiers] String CONSTANT_NAME = "value";
-        # Supports all Java field modifiers in any order (consistent with extractor)
         constant_map = {}
-        constant_pattern = re.compile(
-            r'(?:(?:public|protected|private|static|final|transient|volatile|synchronized|native|strictfp)\s+)*String\s+(\w+)\s*=\s*["\']([^"\']+)["\']',
-            re.MULTILINE
-        )
-        for match in constant_pattern.finditer(content):
+        for match in _STRING_CONSTANT_RE.finditer(content):
             constant_name = match.group(1)
-            constant_value = match.group(2)
+            constant_value = match.group(2).decode()
             constant_map[constant_name] = constant_value
         
-        # Pattern to extract show parameter from @VarAttr annotations
-        # Matches: @VarAttr(...show = "value"...) or @VarAttr(...show = CONSTANT...)
-        pattern = re.compile(
-            r'@(?:VariableMgr\.)?VarAttr\s*\(([^)]+)\)',  # Capture annotation parameters
-            re.MULTILINE | re.DOTALL
-        )
-        
-        for match in pattern.finditer(content):
+        # Extract show parameter from @VarAttr annotations
+        for match in _VAR_ATTR_RE.finditer(content):
             params_str = match.group(1)
             
             # Extract show parameter value (can be string literal or constant reference)
-            show_match = re.search(r'show\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\w+))', params_str)
+            show_match = _SHOW_PARAM_RE.search(params_str)
             if show_match:
                 if show_match.group(1):
                     # Double-quoted string literal
-                    show_name = show_match.group(1)
+                    show_name = show_match.group(1).decode()
                     show_names.add(show_name)
                 elif show_match.group(2):
                     # Single-quoted string literal
-                    show_name = show_match.group(2)
+                    show_name = show_match.group(2).decode()
                     show_names.add(show_name)
                 elif show_match.group(3):
                     # Constant reference - resolve it
@@ -101,13 +106,13 @@ class VariablesVersionExtractor(BaseVersionExtractor):
                         show_names.add(show_name)
             else:
                 # If no show parameter, try to extract name parameter as fallback
-                name_match = re.search(r'name\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\w+))', params_str)
+                name_match = _NAME_PARAM_RE.search(params_str)
                 if name_match:
                     if name_match.group(1):
-                        name_value = name_match.group(1)
+                        name_value = name_match.group(1).decode()
                         show_names.add(name_value)
                     elif name_match.group(2):
-                        name_value = name_match.group(2)
+                        name_value = name_match.group(2).decode()
                         show_names.add(name_value)
                     elif name_match.group(3):
                         constant_ref = name_match.group(3)
@@ -151,6 +151,25 @@ Examples:
         help='Enable version tracking for items without version info'
     )
     
+    parser.add_argument(
+        '-rc', '--refresh-changed',
+        action='store_true',
+        help='Regenerate docs whose source changed since they were last saved'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the LLM instead of reusing cached docs and translations'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=None,
+        help='Seconds a cached LLM response stays valid (default: LLM_CACHE_TTL from config)'
+    )
+    
         
     parser.add_argument(
         '-n', '--name',
@@ -270,6 +289,8 @@ def generate_docs(args):
         "limit": args.limit,
         "ci": args.ci,
         "pr": args.pr,
+        "no_cache": args.no_cache,
+        "cache_ttl": args.cache_ttl,
         "name": args.name
     })
     
@@ -304,6 +325,9 @@ def generate_docs(args):
             create_pr=args.pr,
             limit=args.limit,
             track_version=args.track_version,
+            refresh_changed=args.refresh_changed,
+            use_cache=False if args.no_cache else None,
+            cache_ttl=args.cache_ttl,
             name_filter=args.name
         )
         
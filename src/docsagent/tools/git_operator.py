@@ -14,16 +14,36 @@
 
 """Git operations for committing and pushing documentation changes"""
 
+import asyncio
 import os
 import re
+import subprocess
+import threading
+import time
 import requests
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from git import Repo, InvalidGitRepositoryError, GitCommandError
 from loguru import logger
 
 
+GITHUB_USER_API_URL = "https://api.github.com/user"
+GITHUB_PULLS_API_URL = "https://api.github.com/repos/{repo}/pulls"
+
+
+@lru_cache(maxsize=None)
+def semver_key(version: str) -> Tuple[int, ...]:
+    """
+    Sort key of a dotted version or branch ('3.3.13' → (3, 3, 13)).
+    
+    Memoized: the same tags and branches are sorted over and over, and
+    tuples compare in C.
+    """
+    return tuple(int(x) for x in version.split('.'))
+
+
 class GitOperator:
     """
     Git operations wrapper for documentation updates.
@@ -51,6 +71,8 @@ class GitOperator:
         self.repo: Optional[Repo] = None
         self.current_branch: Optional[str] = None
         self._github_repo: Optional[str] = github_repo  # Manual config or auto-detect
+        self._validated: bool = False  # Memoized validate_repository() result
+        self._release_tag_shas: Optional[Dict[str, str]] = None  # Memoized list_release_tags_with_shas()
         
         logger.debug(f"GitOperator initialized: repo_path={repo_path}")
     
@@ -60,13 +82,21 @@ class GitOperator:
         
         Returns:
             True if valid git repository, False otherwise
+        
+        Note:
+            A successful validation is memoized, so repeated calls on a shared
+            operator do not re-open the repository.
         """
+        if self._validated and self.repo is not None:
+            return True
+        
         if not self.repo_path.exists():
             logger.warning(f"Repository path does not exist: {self.repo_path}")
             return False
         
         try:
             self.repo = Repo(self.repo_path)
+            self._validated = True
             logger.debug(f"Valid git repository found: {self.repo_path}")
             return True
         except InvalidGitRepositoryError:
@@ -197,9 +227,14 @@ class GitOperator:
         if not self.repo:
             raise RuntimeError("Repository not initialized")
         
-        changed_files = []
+        copied_files = []
         
         try:
+            # Create each target directory once, not once per file
+            target_dirs = {(self.repo_path / target_rel).parent for target_rel in file_mappings.values()}
+            for target_dir in target_dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+            
             # Copy files according to mapping
             for source_rel, target_rel in file_mappings.items():
                 source_path = Path(source_rel).resolve()
@@ -209,24 +244,15 @@ class GitOperator:
                     logger.warning(f"Source file not found, skipping: {source_path}")
                     continue
                 
-                # Create target directory if needed
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Check if file needs to be updated
-                needs_copy = True
-                if target_path.exists():
-                    # Compare file contents
-                    import filecmp
-                    if filecmp.cmp(source_path, target_path, shallow=False):
-                        logger.debug(f"File unchanged, skipping: {target_rel}")
-                        needs_copy = False
-                
-                # Copy file only if needed
-                if needs_copy:
-                    import shutil
-                    shutil.copy2(source_path, target_path)
-                    changed_files.append(str(target_rel))
-                    logger.debug(f"Copied: {source_rel} -> {target_rel}")
+                # Callers drop unchanged files beforehand; git reports any
+                # copy that still left the content as it was
+                import shutil
+                shutil.copy2(source_path, target_path)
+                copied_files.append(str(target_rel))
+                logger.debug(f"Copied: {source_rel} -> {target_rel}")
+            
+            # Only ask git about the paths we copied, not the whole working tree
+            changed_files = self._get_changed_paths(copied_files) if copied_files else []
             
             if not changed_files:
                 logger.info("No files were modified, skipping commit")
@@ -249,6 +275,39 @@ class GitOperator:
             logger.error(f"Failed to copy and commit files: {e}")
             return False, []
     
+    def _get_changed_paths(self, paths: List[str]) -> List[str]:
+        """
+        Get paths that differ from HEAD, limited to the given pathspec.
+        
+        Uses `git status --porcelain=v2 -z -- <paths>` so the cost is bounded by
+        the number of mapped files instead of the repository size.
+        
+        Args:
+            paths: Relative paths to check (from repo root)
+        
+        Returns:
+            Changed or untracked paths, in git status order
+        """
+        output = self.repo.git.status("--porcelain=v2", "-z", "--untracked-files=all", "--", *paths)
+        
+        changed = []
+        records = iter(output.split("\0"))
+        for record in records:
+            if record.startswith("1 "):
+                # 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+                changed.append(record.split(" ", 8)[8])
+            elif record.startswith("2 "):
+                # 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path>\0<origPath>
+                changed.append(record.split(" ", 9)[9])
+                next(records, None)
+            elif record.startswith("u "):
+                # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+                changed.append(record.split(" ", 10)[10])
+            elif record.startswith("? "):
+                changed.append(record[2:])
+        
+        return changed
+    
     def _generate_commit_message(
         self, 
         domain: str, 
@@ -269,14 +328,13 @@ class GitOperator:
         lang_str = ", ".join(languages) if languages else "multiple languages"
         date_str = datetime.now().strftime("%Y-%m-%d")
         
+        files_block = "".join(f"- {file}\n" for file in changed_files)
+        
         message = f"""[Doc] docs({domain}): update {lang_str} documentation
 
 Updated {len(changed_files)} file(s):
-"""
-        for file in changed_files:
-            message += f"- {file}\n"
-        
-        message += f"\nGenerated by DocsAgent on {date_str}"
+{files_block}
+Generated by DocsAgent on {date_str}"""
         
         return message
     
@@ -335,12 +393,153 @@ Updated {len(changed_files)} file(s):
             logger.error(f"Failed to push: {e}")
             return False
     
+    async def push_async(self, remote: str = "origin") -> bool:
+        """
+        Async twin of push() running `git push` via asyncio subprocess.
+        
+        Args:
+            remote: Remote name (default: 'origin')
+        
+        Returns:
+            True if push succeeded, False otherwise
+        """
+        if not self.repo or not self.current_branch:
+            logger.error("No branch to push")
+            return False
+        
+        process = await asyncio.create_subprocess_exec(
+            "git", "push", remote, self.current_branch,
+            cwd=str(self.repo_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        
+        if process.returncode != 0:
+            logger.error(f"Failed to push: {stderr.decode(errors='replace').strip()}")
+            return False
+        
+        logger.info(f"Pushed branch '{self.current_branch}' to {remote}")
+        return True
+    
+    @staticmethod
+    def _github_request(http, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GitHub API request, waiting out an exhausted rate limit once.
+        
+        Args:
+            http: requests.Session (or the requests module) used to send
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to http.request()
+        
+        Returns:
+            Response of the request
+        """
+        response = http.request(method, url, **kwargs)
+        if response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = int(response.headers.get("X-RateLimit-Reset", "0"))
+            wait_seconds = max(reset_at - time.time(), 0) + 1
+            logger.warning(f"GitHub rate limit exhausted, waiting {wait_seconds:.0f}s until reset")
+            time.sleep(wait_seconds)
+            response = http.request(method, url, **kwargs)
+        return response
+    
+    def _get_pr_target(self, head: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Validate PR prerequisites and resolve the target repository and head branch.
+        
+        Args:
+            head: Head branch (default: current_branch)
+        
+        Returns:
+            Tuple of (github_repo, head_branch), or None if a PR cannot be created
+        """
+        if not self.github_token:
+            logger.error("GitHub token not provided, cannot create PR")
+            return None
+        
+        # Auto-detect GitHub repository
+        github_repo = self._get_github_repo()
+        if not github_repo:
+            logger.error("Could not determine GitHub repository from remote URL")
+            return None
+        
+        head_branch = head or self.current_branch
+        if not head_branch:
+            logger.error("No branch specified for PR")
+            return None
+        
+        return github_repo, head_branch
+    
+    def _github_headers(self) -> Dict[str, str]:
+        """Build GitHub REST API request headers."""
+        return {
+            "Authorization": f"token {self.github_token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+    
+    def _resolve_head_ref(self, github_repo: str, head_branch: str, base: str, user_login: Optional[str]) -> str:
+        """
+        Determine the PR head reference.
+        
+        - Fork repo (origin owner != target owner): use "fork_owner:branch"
+        - Same repo (origin owner == target owner): use "branch"
+        
+        Args:
+            github_repo: Target repository in 'owner/repo' format
+            head_branch: Branch the PR is created from
+            base: Base branch (for logging)
+            user_login: Authenticated user's login, used as fallback owner
+        
+        Returns:
+            Head reference for the GitHub pulls API
+        """
+        try:
+            origin_url = self.repo.remote('origin').url
+            logger.info(f"Origin URL: {origin_url}")
+            logger.info(f"Target repo: {github_repo}")
+            
+            # Parse origin owner from URL (support both SSH and HTTPS, with or without token)
+            origin_owner = None
+            if 'github.com' in origin_url:
+                if origin_url.startswith('git@'):
+                    # SSH: git@github.com:username/repo.git
+                    origin_owner = origin_url.split(':')[1].split('/')[0]
+                else:
+                    # HTTPS: https://[token@]github.com/username/repo.git
+                    # Remove token part if present
+                    url_without_token = origin_url.split('@github.com/')[-1] if '@github.com/' in origin_url else origin_url.split('github.com/')[-1]
+                    origin_owner = url_without_token.split('/')[0]
+            
+            target_owner = github_repo.split('/')[0]
+            
+            logger.info(f"Parsed - Origin owner: {origin_owner}, Target owner: {target_owner}")
+            
+            # Determine if it's a fork by comparing owners
+            if origin_owner and origin_owner.lower() != target_owner.lower():
+                # Case 1: Fork repository - use "fork_owner:branch" format
+                head_ref = f"{origin_owner}:{head_branch}"
+                logger.info(f"✓ Detected FORK repo - Creating PR from fork: {head_ref} -> {github_repo}:{base}")
+            else:
+                # Case 2: Same repository - just use branch name
+                head_ref = head_branch
+                logger.info(f"✓ Detected SAME repo - Creating PR in same repo: {head_ref} -> {base}")
+        except Exception as e:
+            logger.error(f"Failed to determine fork status: {e}")
+            # Fallback: try username:branch if we have user login
+            head_ref = f"{user_login}:{head_branch}" if user_login else head_branch
+            logger.warning(f"Using fallback head format: {head_ref}")
+        
+        return head_ref
+    
     def create_pull_request(
         self,
         title: str,
         body: str,
         base: str = "main",
-        head: Optional[str] = None
+        head: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ) -> Optional[str]:
         """
         Create a Pull Request on GitHub.
@@ -350,6 +549,7 @@ Updated {len(changed_files)} file(s):
             body: PR description
             base: Base branch (default: 'main')
             head: Head branch (default: current_branch)
+            session: Shared HTTP session to reuse connections (default: none)
         
         Returns:
             PR URL if successful, None otherwise
@@ -358,74 +558,20 @@ Updated {len(changed_files)} file(s):
             - github_token to be set
             - Repository must be a GitHub repository
         """
-        if not self.github_token:
-            logger.error("GitHub token not provided, cannot create PR")
-            return None
-        
-        # Auto-detect GitHub repository
-        github_repo = self._get_github_repo()
-        if not github_repo:
-            logger.error("Could not determine GitHub repository from remote URL")
-            return None
-        
-        head_branch = head or self.current_branch
-        if not head_branch:
-            logger.error("No branch specified for PR")
+        target = self._get_pr_target(head)
+        if not target:
             return None
+        github_repo, head_branch = target
         
         try:
             # Get the authenticated user's login to construct proper head reference
-            user_api_url = "https://api.github.com/user"
-            headers = {
-                "Authorization": f"token {self.github_token}",
-                "Accept": "application/vnd.github.v3+json"
-            }
-            
-            user_response = requests.get(user_api_url, headers=headers)
+            headers = self._github_headers()
+            http = session or requests
+            user_response = self._github_request(http, "GET", GITHUB_USER_API_URL, headers=headers)
             user_response.raise_for_status()
             user_login = user_response.json().get("login")
             
-            # Determine head format based on repository type:
-            # - Fork repo (origin owner != target owner): use "fork_owner:branch"
-            # - Same repo (origin owner == target owner): use "branch"
-            try:
-                origin_url = self.repo.remote('origin').url
-                logger.info(f"Origin URL: {origin_url}")
-                logger.info(f"Target repo: {github_repo}")
-                
-                # Parse origin owner from URL (support both SSH and HTTPS, with or without token)
-                origin_owner = None
-                if 'github.com' in origin_url:
-                    if origin_url.startswith('git@'):
-                        # SSH: git@github.com:username/repo.git
-                        origin_owner = origin_url.split(':')[1].split('/')[0]
-                    else:
-                        # HTTPS: https://[token@]github.com/username/repo.git
-                        # Remove token part if present
-                        url_without_token = origin_url.split('@github.com/')[-1] if '@github.com/' in origin_url else origin_url.split('github.com/')[-1]
-                        origin_owner = url_without_token.split('/')[0]
-                
-                target_owner = github_repo.split('/')[0]
-                
-                logger.info(f"Parsed - Origin owner: {origin_owner}, Target owner: {target_owner}")
-                
-                # Determine if it's a fork by comparing owners
-                if origin_owner and origin_owner.lower() != target_owner.lower():
-                    # Case 1: Fork repository - use "fork_owner:branch" format
-                    head_ref = f"{origin_owner}:{head_branch}"
-                    logger.info(f"✓ Detected FORK repo - Creating PR from fork: {head_ref} -> {github_repo}:{base}")
-                else:
-                    # Case 2: Same repository - just use branch name
-                    head_ref = head_branch
-                    logger.info(f"✓ Detected SAME repo - Creating PR in same repo: {head_ref} -> {base}")
-            except Exception as e:
-                logger.error(f"Failed to determine fork status: {e}")
-                # Fallback: try username:branch if we have user login
-                head_ref = f"{user_login}:{head_branch}" if user_login else head_branch
-                logger.warning(f"Using fallback head format: {head_ref}")
-            
-            # GitHub API endpoint
-            api_url = f"https://api.github.com/repos/{github_repo}/pulls"
+            head_ref = self._resolve_head_ref(github_repo, head_branch, base, user_login)
             
             data = {
                 "title": title,
@@ -437,7 +583,8 @@ Updated {len(changed_files)} file(s):
             logger.debug(f"Full PR data: {data}")
             
             # Create PR
-            response = requests.post(api_url, json=data, headers=headers)
+            api_url = GITHUB_PULLS_API_URL.format(repo=github_repo)
+            response = self._github_request(http, "POST", api_url, json=data, headers=headers)
             response.raise_for_status()
             
             pr_data = response.json()
@@ -455,6 +602,9 @@ Updated {len(changed_files)} file(s):
         """
         Cleanup: return to original branch.
         
+        Safe to call multiple times; the operator stays usable afterwards so it
+        can be shared across domains.
+        
         Args:
             return_to_branch: Branch to checkout after operations
         """
@@ -467,6 +617,8 @@ Updated {len(changed_files)} file(s):
                 logger.debug(f"Returned to branch: {return_to_branch}")
         except Exception as e:
             logger.warning(f"Failed to cleanup: {e}")
+        finally:
+            self.current_branch = None
     
     # ============ Version Tracking Methods ============
     
@@ -474,6 +626,9 @@ Updated {len(changed_files)} file(s):
         """
         Get all release tags matching the pattern (x.y.z format).
         
+        Tags come from list_release_tags_with_shas(), filtered by pattern
+        after stripping the 'v'.
+        
         Args:
             pattern: Regex pattern to filter tags (default: x.y.z format)
         
@@ -488,19 +643,12 @@ Updated {len(changed_files)} file(s):
             raise RuntimeError("Repository not initialized. Call validate_repository() first.")
         
         try:
-            all_tags = [tag.name for tag in self.repo.tags]
-            
             # Filter tags by pattern
             regex = re.compile(pattern)
-            release_tags = []
-            
-            for tag in all_tags:
-                normalized = tag.lstrip('v')
-                if regex.match(normalized):
-                    release_tags.append(normalized)
+            release_tags = [tag for tag in self.list_release_tags_with_shas() if regex.match(tag)]
             
             # Sort by version number
-            release_tags.sort(key=lambda v: [int(x) for x in v.split('.')])
+            release_tags.sort(key=semver_key)
             
             logger.debug(f"Found {len(release_tags)} release tags")
             return release_tags
@@ -509,6 +657,40 @@ Updated {len(changed_files)} file(s):
             logger.error(f"Failed to get release tags: {e}")
             raise
     
+    def list_release_tags_with_shas(self) -> Dict[str, str]:
+        """
+        Map release-looking tags to their commits with one git call.
+        
+        Runs `git for-each-ref` over tags starting with a digit or 'v' + digit,
+        so git drops other tags; annotated tags are peeled to their commit.
+        Names are normalized without the 'v', and 'vX.Y.Z' wins over 'X.Y.Z'
+        as in get_file_at_tag(). Memoized per operator.
+        
+        Returns:
+            Dict of normalized tag name → commit hash
+            
+        Example:
+            >>> git_op.list_release_tags_with_shas()
+            {'3.0.0': '5f1e...', '3.0.1': '9ac2...', ...}
+        """
+        if not self.repo:
+            raise RuntimeError("Repository not initialized. Call validate_repository() first.")
+        
+        if self._release_tag_shas is None:
+            output = self.repo.git.for_each_ref(
+                "--format=%(refname:lstrip=2)%09%(objectname)%09%(*objectname)",
+                "refs/tags/[0-9]*", "refs/tags/v[0-9]*"
+            )
+            shas: Dict[str, str] = {}
+            for line in output.splitlines():
+                name, object_id, peeled_id = line.split("\t")
+                normalized = name.lstrip('v')
+                if name.startswith('v') or normalized not in shas:
+                    shas[normalized] = peeled_id or object_id
+            self._release_tag_shas = shas
+        
+        return self._release_tag_shas
+    
     def get_file_at_tag(self, tag: str, file_path: str) -> Optional[str]:
         """
         Get file content at a specific tag.
@@ -542,6 +724,215 @@ Updated {len(changed_files)} file(s):
         logger.debug(f"File {file_path} not found at tag {tag}")
         return None
     
+    def find_introducing_commit(self, pattern: str, paths: List[str], branch_ref: str) -> Optional[str]:
+        """
+        Find the oldest commit reachable from branch_ref that added pattern.
+        
+        Uses git's pickaxe (`git log --reverse -S<pattern>`), so the history
+        is searched inside git instead of reading the files at every tag.
+        
+        Args:
+            pattern: Literal string to search for (e.g., a config name)
+            paths: Relative paths to limit the search to
+            branch_ref: Tag or branch to search back from (e.g., '3.3.13')
+        
+        Returns:
+            Full commit hash, or None if pattern never appears in paths
+        """
+        if not self.repo:
+            raise RuntimeError("Repository not initialized. Call validate_repository() first.")
+        
+        # Same tag spellings as get_file_at_tag()
+        for ref in dict.fromkeys([branch_ref if branch_ref.startswith('v') else f'v{branch_ref}', branch_ref.lstrip('v')]):
+            try:
+                output = self.repo.git.log("--reverse", f"-S{pattern}", "--pretty=%H", ref, "--", *paths)
+            except GitCommandError:
+                continue
+            return output.split("\n", 1)[0] or None
+        
+        logger.debug(f"Ref {branch_ref} not found while searching for {pattern}")
+        return None
+    
+    def get_first_tag_containing(self, commit: str, branch: str) -> Optional[str]:
+        """
+        Get the nearest release tag of a branch that contains commit.
+        
+        Args:
+            commit: Commit hash
+            branch: Release branch (x.y) whose x.y.z tags are considered
+        
+        Returns:
+            Normalized tag name (e.g., '3.3.2'), or None if no tag of the
+            branch contains commit
+        """
+        if not self.repo:
+            raise RuntimeError("Repository not initialized. Call validate_repository() first.")
+        
+        try:
+            name = self.repo.git.describe("--contains", "--match", f"v{branch}.*", "--match", f"{branch}.*", commit)
+        except GitCommandError:
+            return None
+        # 'v3.3.2~14' or '3.3.2^0' → '3.3.2'
+        return re.split(r'[~^]', name, maxsplit=1)[0].lstrip('v')
+    
+    def get_files_at_tags_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        decode: bool = True
+    ) -> Dict[Tuple[str, str], Union[str, bytes, None]]:
+        """
+        Get the content of many files at many tags with one git process.
+        
+        Batch counterpart of get_file_at_tag(): every `<tag>:<path>` revision
+        is fed to a single `git cat-file --batch` instead of spawning one
+        `git show` per pair. Tags are tried as 'vX.Y.Z' first, then 'X.Y.Z'.
+        
+        Args:
+            pairs: (tag, file_path) pairs, file paths relative to repo root
+            decode: Decode contents as UTF-8; False returns the raw bytes
+        
+        Returns:
+            Dict of (tag, file_path) → file content, or None if the file
+            doesn't exist at that tag
+            
+        Example:
+            >>> contents = git_op.get_files_at_tags_batch([('3.3.0', 'be/src/common/config.h')])
+        """
+        contents = self._cat_files_at_tags(pairs)
+        found = sum(content is not None for content in contents.values())
+        logger.debug(f"Retrieved {found}/{len(contents)} files at tags")
+        if not decode:
+            return contents
+        return {
+            pair: None if content is None else content.decode('utf-8', errors='replace')
+            for pair, content in contents.items()
+        }
+    
+    def get_blob_ids_at_tags_batch(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Get the blob id of many files at many tags with one git process.
+        
+        Like get_files_at_tags_batch(), but runs `git cat-file --batch-check`
+        and reads no content: a file unchanged between tags keeps its blob id,
+        which makes the id a content-addressed cache key.
+        
+        Args:
+            pairs: (tag, file_path) pairs, file paths relative to repo root
+        
+        Returns:
+            Dict of (tag, file_path) → blob id (hex), or None if the file
+            doesn't exist at that tag
+        """
+        return {
+            pair: None if blob_id is None else blob_id.decode('ascii')
+            for pair, blob_id in self._cat_files_at_tags(pairs, check_only=True).items()
+        }
+    
+    def _cat_files_at_tags(self, pairs: List[Tuple[str, str]], check_only: bool = False) -> Dict[Tuple[str, str], Optional[bytes]]:
+        """
+        Resolve (tag, file_path) pairs through _cat_file_batch().
+        
+        Release tags are addressed by their commit from
+        list_release_tags_with_shas(); other tags are tried as 'vX.Y.Z' first,
+        then 'X.Y.Z' for the pairs still missing, as in get_file_at_tag().
+        """
+        if not self.repo:
+            raise RuntimeError("Repository not initialized. Call validate_repository() first.")
+        
+        shas = self.list_release_tags_with_shas()
+        results: Dict[Tuple[str, str], Optional[bytes]] = {}
+        pending = []
+        by_commit = []
+        for pair in dict.fromkeys(pairs):
+            commit = shas.get(pair[0].lstrip('v'))
+            if commit is None:
+                pending.append(pair)
+            else:
+                by_commit.append((pair, f"{commit}:{pair[1]}"))
+        
+        if by_commit:
+            blobs = self._cat_file_batch([rev for _, rev in by_commit], check_only)
+            results.update(zip((pair for pair, _ in by_commit), blobs))
+        
+        for spell in (lambda t: t if t.startswith('v') else f'v{t}', lambda t: t.lstrip('v')):
+            if not pending:
+                break
+            blobs = self._cat_file_batch([f"{spell(tag)}:{path}" for tag, path in pending], check_only)
+            missing = []
+            for pair, blob in zip(pending, blobs):
+                if blob is None:
+                    missing.append(pair)
+                else:
+                    results[pair] = blob
+            pending = missing
+        
+        for pair in pending:
+            results[pair] = None
+        return results
+    
+    def _cat_file_batch(self, revs: List[str], check_only: bool = False) -> List[Optional[bytes]]:
+        """
+        Read blobs for revisions through one `git cat-file --batch` process.
+        
+        Revisions are written from a helper thread while blobs are read, so
+        neither pipe can fill up and stall the other side.
+        
+        Args:
+            revs: Revisions like '<tag>:<path>'
+            check_only: Run --batch-check and return blob ids, not contents
+        
+        Returns:
+            Blob contents (or ids) in revs order, None for missing revisions
+            or non-blobs
+        """
+        mode = "--batch-check" if check_only else "--batch"
+        process = subprocess.Popen(
+            ["git", "cat-file", f"{mode}=%(objecttype) %(objectsize) %(objectname)"],
+            cwd=str(self.repo_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        
+        def feed() -> None:
+            try:
+                process.stdin.write("".join(f"{rev}\n" for rev in revs).encode())
+            except BrokenPipeError:
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+        
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        
+        blobs: List[Optional[bytes]] = []
+        try:
+            stdout = process.stdout
+            for rev in revs:
+                header = stdout.readline()
+                if not header:
+                    raise RuntimeError(f"git cat-file exited before {rev}")
+                # '<type> <size> <id>' on success, '<rev> missing' / '<rev> ambiguous' otherwise
+                if header.endswith((b" missing\n", b" ambiguous\n")):
+                    blobs.append(None)
+                    continue
+                kind, size, object_id = header.split()
+                if check_only:
+                    blobs.append(object_id if kind == b"blob" else None)
+                    continue
+                data = stdout.read(int(size))
+                stdout.read(1)  # Trailing newline after the content
+                blobs.append(data if kind == b"blob" else None)
+        finally:
+            process.stdout.close()
+            writer.join()
+            process.wait()
+        
+        return blobs
+    
     def get_current_version(self) -> str:
         """
         Get current HEAD commit hash (short version).
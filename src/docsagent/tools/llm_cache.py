@@ -0,0 +1,89 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache for LLM responses
+
+Stores one small JSON file per response under a directory sharded by the first
+two hex chars of the key, so unchanged inputs skip the LLM call on later runs:
+
+    meta/translation_cache/3f/3fa2...e1.json
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+
+class ResponseCache:
+    """SHA-256 keyed response cache with optional TTL"""
+
+    def __init__(self, cache_dir: str, ttl: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            ttl: Seconds an entry stays valid (None = never expires)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts that determine the response"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None on a miss or expired entry"""
+        path = self._path(key)
+        try:
+            with path.open('r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if self.ttl is not None and time.time() - entry.get('ts', 0) > self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.get('value')
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value; write failures are logged and otherwise ignored"""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with tmp_path.open('w', encoding='utf-8') as f:
+                json.dump({'value': value, 'ts': time.time()}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
@@ -22,7 +22,8 @@ Collects and reports execution statistics for DocsAgent including:
 - Agent and tool invocation statistics
 """
 
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -200,6 +201,8 @@ class StatsCollector:
     
     _instance: Optional['StatsCollector'] = None
     _stats: Optional[ExecutionStats] = None
+    # Guards counter updates made from concurrent translation threads
+    _lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
@@ -258,20 +261,22 @@ class StatsCollector:
     def record_document(cls, language: str, count: int = 1):
         """Record generated document for a language"""
         stats = cls.get_stats()
-        stats.docs_per_language[language] = stats.docs_per_language.get(language, 0) + count
+        with cls._lock:
+            stats.docs_per_language[language] = stats.docs_per_language.get(language, 0) + count
         logger.debug(f"Recorded {count} document(s) for language: {language}")
     
     @classmethod
     def record_agent_call(cls, agent_name: str, input_tokens: int = 0, output_tokens: int = 0):
         """Record agent invocation"""
         stats = cls.get_stats()
-        stats.agent_calls[agent_name] = stats.agent_calls.get(agent_name, 0) + 1
-        
-        if input_tokens > 0 or output_tokens > 0:
-            if agent_name not in stats.agent_tokens:
-                stats.agent_tokens[agent_name] = {"input": 0, "output": 0}
-            stats.agent_tokens[agent_name]["input"] += input_tokens
-            stats.agent_tokens[agent_name]["output"] += output_tokens
+        with cls._lock:
+            stats.agent_calls[agent_name] = stats.agent_calls.get(agent_name, 0) + 1
+            
+            if input_tokens > 0 or output_tokens > 0:
+                if agent_name not in stats.agent_tokens:
+                    stats.agent_tokens[agent_name] = {"input": 0, "output": 0}
+                stats.agent_tokens[agent_name]["input"] += input_tokens
+                stats.agent_tokens[agent_name]["output"] += output_tokens
         
         logger.debug(f"Recorded agent call: {agent_name} (in: {input_tokens}, out: {output_tokens} tokens)")
     
@@ -293,10 +298,17 @@ class StatsCollector:
     @classmethod
     def record_translated_item(cls, item_name: str):
         """Record an item that was translated"""
+        cls.record_translated_items((item_name,))
+    
+    @classmethod
+    def record_translated_items(cls, item_names: Iterable[str]):
+        """Record a batch of translated items under a single lock acquisition"""
         stats = cls.get_stats()
-        if item_name not in stats.translate_items:
-            stats.translate_items.add(item_name)
-            logger.debug(f"Recorded translated item: {item_name}")
+        with cls._lock:
+            before = len(stats.translate_items)
+            stats.translate_items.update(item_names)
+            added = len(stats.translate_items) - before
+        logger.debug(f"Recorded {added} translated item(s)")
     
     @classmethod
     def record_error(cls, error: str):
@@ -383,6 +395,10 @@ def record_translated_item(item_name: str):
     """Record an item that was translated"""
     StatsCollector.record_translated_item(item_name)
 
+def record_translated_items(item_names: Iterable[str]):
+    """Record a batch of translated items"""
+    StatsCollector.record_translated_items(item_names)
+
 
 def record_error(error: str):
     """Record an error"""
@@ -0,0 +1,90 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared pytest setup: import docsagent from src without installing it, shared fixtures"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from docsagent.domains.models import ConfigItem  # noqa: E402
+from docsagent.tools.git_operator import GitOperator  # noqa: E402
+
+BINARY = b"\x00\x01\n\xff\n"
+
+
+@pytest.fixture
+def make_config_item():
+    """Factory for an FE config item; keyword arguments override its fields"""
+    def make(**overrides) -> ConfigItem:
+        fields = dict(
+            name='query_timeout', type='int', defaultValue='300', comment='Timeout',
+            isMutable='true', scope='FE', define='',
+        )
+        fields.update(overrides)
+        return ConfigItem(**fields)
+    return make
+
+
+def run_git(repo, *args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def commit_files(repo, files, message):
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", message)
+
+
+@pytest.fixture
+def git():
+    """Runs git in a repository: git(repo, *args) -> stripped stdout"""
+    return run_git
+
+
+@pytest.fixture
+def commit():
+    """Writes files into a repository and commits them: commit(repo, {name: bytes}, message)"""
+    return commit_files
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Scratch repo tagged v3.0.0 (lightweight), 3.1.0 (no 'v') and v3.1.1 (annotated)"""
+    run_git(tmp_path, "init", "-q")
+    run_git(tmp_path, "config", "user.email", "dev@example.com")
+    run_git(tmp_path, "config", "user.name", "dev")
+    commit_files(tmp_path, {"f.txt": b"a\nb\n", "bin.dat": BINARY, "dir/g.txt": b"g\n"}, "first")
+    run_git(tmp_path, "tag", "v3.0.0")
+    commit_files(tmp_path, {"f.txt": b"a\nb\nc\n"}, "second")
+    run_git(tmp_path, "tag", "3.1.0")
+    commit_files(tmp_path, {"f.txt": b"a\nb\nc\nd\n"}, "third")
+    run_git(tmp_path, "tag", "-a", "v3.1.1", "-m", "release")
+    return tmp_path
+
+
+@pytest.fixture
+def operator(repo):
+    """Validated GitOperator over the scratch repo"""
+    git_op = GitOperator(str(repo))
+    assert git_op.validate_repository()
+    return git_op
@@ -0,0 +1,69 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Separator batches that come back with the wrong number of docs"""
+import asyncio
+
+import pytest
+
+from docsagent.core.pipeline import DocGenerationPipeline, _SEP_RE
+
+
+class FakeAgent:
+    """Upper-cases each doc; batches holding a lossy doc gain a stray extra doc"""
+    
+    def __init__(self, lossy_docs=()):
+        self.lossy_docs = set(lossy_docs)
+        self.calls = 0
+    
+    def translate(self, text, target_lang, preserve_markers=True):
+        self.calls += 1
+        parts = [part.strip() for part in _SEP_RE.split(text) if part.strip()]
+        if self.lossy_docs.intersection(parts):
+            parts.insert(1, "extra")
+        return "".join(f"{part.upper()}\n\n<!-- ITEM_SEP_{i} -->\n\n" for i, part in enumerate(parts))
+    
+    async def atranslate(self, text, target_lang, preserve_markers=True):
+        return self.translate(text, target_lang, preserve_markers)
+
+
+def make_pipeline(agent) -> DocGenerationPipeline:
+    pipeline = DocGenerationPipeline(extractor=None, translation_agent=agent)
+    pipeline.batch_protocol = 'separator'
+    return pipeline
+
+
+def test_split_batch_rejects_count_mismatch():
+    pipeline = make_pipeline(FakeAgent())
+    with pytest.raises(ValueError):
+        pipeline._split_batch("only one doc", ["a", "b"])
+
+
+def test_clean_batch_is_one_call():
+    agent = FakeAgent()
+    assert make_pipeline(agent)._translate_single_batch(["a", "b", "c"], "zh") == ["A", "B", "C"]
+    assert agent.calls == 1
+
+
+def test_mismatched_batch_is_retried_in_halves():
+    agent = FakeAgent(lossy_docs={"b"})
+    pipeline = make_pipeline(agent)
+    # "b" breaks every batch it is in; the other docs still get translated
+    assert pipeline._translate_single_batch(["a", "b", "c", "d"], "zh") == ["A", None, "C", "D"]
+
+
+def test_mismatched_batch_async():
+    pipeline = make_pipeline(FakeAgent(lossy_docs={"c"}))
+    result = asyncio.run(pipeline._translate_single_batch_async(["a", "b", "c"], "zh"))
+    assert result == ["A", "B", None]
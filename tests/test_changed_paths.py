@@ -0,0 +1,40 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""GitOperator._get_changed_paths() over porcelain v2 status, on a scratch repo (see conftest)"""
+import subprocess
+
+
+def test_changed_paths_porcelain_v2(repo, operator, git):
+    (repo / "f.txt").write_bytes(b"changed\n")                   # 1: modified
+    git(repo, "mv", "dir/g.txt", "dir/renamed g.txt")             # 2: renamed, path with a space
+    (repo / "dir" / "new.txt").write_bytes(b"new\n")             # ?: untracked
+    (repo / "other.txt").write_bytes(b"outside pathspec\n")
+    
+    changed = operator._get_changed_paths(["f.txt", "dir"])
+    assert sorted(changed) == ["dir/new.txt", "dir/renamed g.txt", "f.txt"]
+
+
+def test_changed_paths_unmerged(repo, operator, git, commit):
+    git(repo, "checkout", "-qb", "side", "v3.0.0")
+    commit(repo, {"f.txt": b"side\n"}, "side")
+    git(repo, "checkout", "-q", "-")
+    merge = subprocess.run(["git", "merge", "-q", "side"], cwd=repo, capture_output=True)
+    assert merge.returncode != 0
+    
+    assert operator._get_changed_paths(["f.txt"]) == ["f.txt"]
+
+
+def test_changed_paths_clean_tree(operator):
+    assert operator._get_changed_paths(["f.txt"]) == []
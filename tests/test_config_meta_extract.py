@@ -0,0 +1,76 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Property line scanner of the config doc parser"""
+import pytest
+
+from docsagent.docs_extract.config_meta_extract import ConfigMetaExtract, _split_property
+
+
+@pytest.fixture
+def extractor():
+    # _extract_properties() needs no paths from __init__
+    return ConfigMetaExtract.__new__(ConfigMetaExtract)
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('- **Default**: 300', ('Default', ' 300')),
+    ('* __Type__: Int', ('Type', ' Int')),
+    ('- Unit: Seconds', ('Unit', ' Seconds')),
+    ('- **默认值**：300', ('默认值', '300')),
+    ('- **Description**: a: b', ('Description', ' a: b')),
+    ('-**Default**: 300', None),
+    ('- **snake_case**: 1', None),
+    ('- no colon', None),
+    ('Default: 300', None),
+    ('', None),
+])
+def test_split_property(line, expected):
+    assert _split_property(line) == expected
+
+
+def test_extract_properties(extractor):
+    block = "\n".join([
+        "- **Default**: 300",
+        "- **Type**: Int",
+        "- **Unit**:",
+        "- **Is mutable**: true",
+        "- **Description**: Timeout of a query.",
+        "  Second line continues.",
+        "  - **Nested**: stays in the description",
+        "- **Introduced in**: v3.2.0",
+        "",
+        "A paragraph after a blank line belongs to no property.",
+    ])
+    assert extractor._extract_properties(block) == {
+        'Default': '300',
+        'Type': 'Int',
+        'Is mutable': 'true',
+        'Description': 'Timeout of a query. Second line continues. - **Nested**: stays in the description',
+        'Introduced in': 'v3.2.0',
+    }
+
+
+def test_indented_bullet_opens_a_property_after_a_blank_line(extractor):
+    block = "Intro text\n\n  - **Default**: 1\n  - **Type**: Int"
+    # The second bullet is indented, so it continues the open property
+    assert extractor._extract_properties(block) == {'Default': '1 - **Type**: Int'}
+
+
+def test_last_property_is_closed_at_end_of_block(extractor):
+    assert extractor._extract_properties("- **Default**: 1\n  more") == {'Default': '1 more'}
+
+
+def test_empty_block(extractor):
+    assert extractor._extract_properties("") == {}
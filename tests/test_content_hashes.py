@@ -0,0 +1,138 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content hashes and the refresh_changed stale-doc drop"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from docsagent.core.pipeline import DocGenerationPipeline
+from docsagent.domains.models import ConfigItem, FunctionItem
+
+
+def make_pipeline() -> DocGenerationPipeline:
+    return DocGenerationPipeline(extractor=None, translation_agent=object())
+
+
+def derive(pipeline: DocGenerationPipeline, item: ConfigItem, lang: str, doc: str, source=None) -> None:
+    pipeline._set_document(item, lang, doc, source)
+
+
+def reload(item: ConfigItem, **changes) -> ConfigItem:
+    """The item as the next run extracts it: saved docs and hashes, current source fields"""
+    data = item.to_dict()
+    data.update(changes)
+    return ConfigItem.from_dict(data)
+
+
+def test_source_change_drops_only_docs_derived_from_it(make_config_item):
+    pipeline = make_pipeline()
+    item = make_config_item(documents={'zh': '导入的文档'})
+    derive(pipeline, item, 'en', 'Generated doc')
+    derive(pipeline, item, 'ja', 'Translated doc', 'en')
+    pipeline._record_content_hashes([item])
+    assert set(item.contentHashes) == {'en', 'ja'}
+    
+    changed = reload(item, defaultValue='600')
+    pipeline._drop_stale_documents([changed])
+    
+    # The imported ZH doc is not derived from the source fields
+    assert changed.documents == {'zh': '导入的文档'}
+
+
+def test_unchanged_item_keeps_every_doc(make_config_item):
+    pipeline = make_pipeline()
+    item = make_config_item()
+    derive(pipeline, item, 'en', 'Generated doc')
+    derive(pipeline, item, 'zh', '翻译', 'en')
+    derive(pipeline, item, 'ja', '翻訳', 'en')
+    pipeline._record_content_hashes([item])
+    
+    unchanged = reload(item)
+    pipeline._drop_stale_documents([unchanged])
+    
+    assert unchanged.documents == item.documents
+
+
+def test_translation_of_unchanged_import_survives_source_change(make_config_item):
+    pipeline = make_pipeline()
+    item = make_config_item(documents={'zh': '导入的文档'})
+    derive(pipeline, item, 'en', 'Translated from zh', 'zh')
+    derive(pipeline, item, 'ja', 'Translated from en', 'en')
+    pipeline._record_content_hashes([item])
+    
+    changed = reload(item, defaultValue='600')
+    pipeline._drop_stale_documents([changed])
+    
+    assert set(changed.documents) == {'zh', 'en', 'ja'}
+
+
+def test_changed_import_drops_its_translations(make_config_item):
+    pipeline = make_pipeline()
+    item = make_config_item(documents={'zh': '导入的文档'})
+    derive(pipeline, item, 'en', 'Translated from zh', 'zh')
+    derive(pipeline, item, 'ja', 'Translated from en', 'en')
+    pipeline._record_content_hashes([item])
+    
+    edited = reload(item)
+    edited.documents['zh'] = '修改后的文档'
+    pipeline._drop_stale_documents([edited])
+    
+    assert edited.documents == {'zh': '修改后的文档'}
+
+
+def test_failed_generation_is_retried_by_refresh(make_config_item):
+    pipeline = make_pipeline()
+    item = make_config_item()
+    derive(pipeline, item, 'en', 'Documentation generation failed.')
+    pipeline._doc_inputs[item.name]['en'] = ''
+    pipeline._record_content_hashes([item])
+    
+    again = reload(item)
+    pipeline._drop_stale_documents([again])
+    
+    assert again.documents == {}
+
+
+def make_function(test_cases, implement_fns=('StringFunctions::upper',)) -> FunctionItem:
+    return FunctionItem(
+        name='upper', alias=['ucase'], signature=['upper(VARCHAR) -> VARCHAR'], catalog='String Functions',
+        module='Scalar', implement_fns=list(implement_fns), testCases=list(test_cases),
+        documents={'en': 'doc'},
+    )
+
+
+def test_test_case_order_does_not_change_hashes():
+    cases = ['test/sql/R/a', 'test/sql/R/b', 'test/sql/R/c']
+    assert make_function(cases).content_hashes == make_function(reversed(cases)).content_hashes
+
+
+def test_hashes_are_stable_across_processes():
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from docsagent.domains.models import FunctionItem;"
+        "item = FunctionItem(name='upper', alias=['ucase'], signature=['s'], catalog='c', module='Scalar',"
+        " implement_fns=['f'], testCases=['t'], documents={'en': 'doc'});"
+        "print(sorted(item.content_hashes.items()))"
+    )
+    src = str(Path(__file__).parent.parent / "src")
+    outputs = {
+        subprocess.run(
+            [sys.executable, '-c', script, src], capture_output=True, text=True, check=True,
+            env={**os.environ, 'PYTHONHASHSEED': seed},
+        ).stdout
+        for seed in ('1', '2')
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,63 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ItemExtractor.extract_parallel() inline and over a process pool"""
+import pytest
+
+from docsagent.core.protocols import ItemExtractor
+
+
+class NoFileExtractor(ItemExtractor):
+    def _get_default_code_paths(self):
+        return []
+    
+    def _extract_all_items(self, force_search_code=False, **kwargs):
+        return []
+    
+    def get_statistics(self, items):
+        return {}
+
+
+class LineExtractor(NoFileExtractor):
+    """One item (the line) per line of each file; 'bad' files fail"""
+    
+    def _extract_file(self, file_path):
+        if file_path.endswith('bad.txt'):
+            raise ValueError('unparsable')
+        with open(file_path) as f:
+            return f.read().split()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f'{i}.txt'
+        path.write_text(f'a{i}\nb{i}\n')
+        paths.append(str(path))
+    bad = tmp_path / 'bad.txt'
+    bad.write_text('x\n')
+    paths.insert(3, str(bad))
+    return paths
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_items_keep_file_order(sources, workers):
+    items = LineExtractor().extract_parallel(sources, workers=workers)
+    assert items == [f'{c}{i}' for i in range(6) for c in 'ab']
+
+
+def test_missing_extract_file_raises():
+    with pytest.raises(TypeError, match='_extract_file'):
+        NoFileExtractor().extract_parallel(['a.txt'])
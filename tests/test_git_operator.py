@@ -0,0 +1,61 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""GitOperator cat-file batches over tags, on a scratch repo (see conftest)"""
+
+
+def test_cat_file_batch_contents(repo, operator):
+    binary = (repo / "bin.dat").read_bytes()
+    blobs = operator._cat_file_batch(["v3.0.0:f.txt", "v3.0.0:bin.dat", "v3.0.0:absent", "v3.0.0:dir", "v3.1.1:f.txt"])
+    # Binary content with embedded newlines survives the size-framed protocol;
+    # missing paths and trees come back as None
+    assert blobs == [b"a\nb\n", binary, None, None, b"a\nb\nc\nd\n"]
+
+
+def test_cat_file_batch_check_only(repo, operator, git):
+    ids = operator._cat_file_batch(["v3.0.0:f.txt", "3.1.0:f.txt", "v3.0.0:absent"], check_only=True)
+    assert ids == [
+        git(repo, "rev-parse", "v3.0.0:f.txt").encode(),
+        git(repo, "rev-parse", "3.1.0:f.txt").encode(),
+        None,
+    ]
+
+
+def test_cat_file_batch_empty(operator):
+    assert operator._cat_file_batch([]) == []
+
+
+def test_files_at_tags_resolve_either_spelling(operator):
+    contents = operator.get_files_at_tags_batch([
+        ("3.0.0", "f.txt"),
+        ("v3.1.0", "f.txt"),
+        ("3.1.1", "f.txt"),
+        ("3.1.1", "absent"),
+        ("9.9.9", "f.txt"),
+    ])
+    assert contents == {
+        ("3.0.0", "f.txt"): "a\nb\n",
+        ("v3.1.0", "f.txt"): "a\nb\nc\n",
+        ("3.1.1", "f.txt"): "a\nb\nc\nd\n",
+        ("3.1.1", "absent"): None,
+        ("9.9.9", "f.txt"): None,
+    }
+
+
+def test_blob_ids_match_between_unchanged_tags(operator):
+    ids = operator.get_blob_ids_at_tags_batch([
+        ("3.0.0", "dir/g.txt"), ("3.1.1", "dir/g.txt"), ("3.0.0", "f.txt"), ("3.1.0", "f.txt"),
+    ])
+    assert ids[("3.0.0", "dir/g.txt")] == ids[("3.1.1", "dir/g.txt")]
+    assert ids[("3.0.0", "f.txt")] != ids[("3.1.0", "f.txt")]
@@ -0,0 +1,58 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pickle item cache matched by the digest of its source content"""
+import pickle
+
+from docsagent.core.cache import read_cache, source_digest, write_atomic, write_cache
+import pytest
+
+
+@pytest.fixture
+def items(make_config_item):
+    return [make_config_item(documents={'en': 'Timeout'})]
+
+
+def test_round_trip(tmp_path, items):
+    path = tmp_path / 'fe_config.meta.pkl'
+    digest = source_digest(b'[{"name": "query_timeout"}]')
+    write_cache(items, path, digest)
+    
+    cached = read_cache(path, digest)
+    assert [item.to_dict() for item in cached] == [item.to_dict() for item in items]
+
+
+def test_changed_source_misses(tmp_path, items):
+    path = tmp_path / 'fe_config.meta.pkl'
+    write_cache(items, path, source_digest(b'old'))
+    # Same size, possibly the same mtime tick: only the content tells them apart
+    assert read_cache(path, source_digest(b'new')) is None
+
+
+def test_legacy_cache_without_digest_misses(tmp_path, items):
+    path = tmp_path / 'fe_config.meta.pkl'
+    path.write_bytes(pickle.dumps(items))
+    assert read_cache(path, source_digest(b'[]')) is None
+
+
+def test_missing_cache(tmp_path):
+    assert read_cache(tmp_path / 'absent.pkl', source_digest(b'')) is None
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path):
+    path = tmp_path / 'versions.json'
+    write_atomic(path, b'old')
+    write_atomic(path, b'new', durable=True)
+    assert path.read_bytes() == b'new'
+    assert [p.name for p in tmp_path.iterdir()] == ['versions.json']
@@ -0,0 +1,66 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ItemExtractor.load_meta() over packed meta rows"""
+import os
+
+from docsagent.core.protocols import ItemExtractor
+from docsagent.core.serialize import pack_items
+from docsagent.domains.models import ConfigItem
+
+
+class MetaExtractor(ItemExtractor):
+    item_class = ConfigItem
+    
+    def __init__(self, meta_path):
+        self.meta_path = meta_path
+    
+    def _get_default_code_paths(self):
+        return []
+    
+    def _extract_all_items(self, force_search_code=False, **kwargs):
+        return []
+    
+    def get_statistics(self, items):
+        return {}
+
+
+def test_unchanged_file_returns_fresh_items(tmp_path, make_config_item):
+    meta_path = tmp_path / 'fe_config.meta'
+    meta_path.write_bytes(pack_items([make_config_item(comment='Timeout', documents={'en': 'Timeout'})], ConfigItem))
+    extractor = MetaExtractor(meta_path)
+    
+    first = extractor.load_meta()
+    assert first[0].comment == 'Timeout'
+    first[0].useLocations.append('Config.java')
+    
+    second = extractor.load_meta()
+    assert second[0] is not first[0]
+    assert second[0].useLocations == []
+    first[0].useLocations.clear()
+    assert second == first
+
+
+def test_same_size_rewrite_with_same_mtime_is_reloaded(tmp_path, make_config_item):
+    meta_path = tmp_path / 'fe_config.meta'
+    meta_path.write_bytes(pack_items([make_config_item(comment='Timeout', documents={'en': 'Timeout'})], ConfigItem))
+    extractor = MetaExtractor(meta_path)
+    extractor.load_meta()
+    st = meta_path.stat()
+    
+    meta_path.write_bytes(pack_items([make_config_item(comment='Latency', documents={'en': 'Latency'})], ConfigItem))
+    os.utime(meta_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert meta_path.stat().st_size == st.st_size
+    
+    assert extractor.load_meta()[0].comment == 'Latency'
@@ -0,0 +1,21 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""GitOperator release tags listed through for-each-ref, on a scratch repo (see conftest)"""
+
+
+def test_release_tags_peel_annotated_tags(repo, operator, git):
+    shas = operator.list_release_tags_with_shas()
+    assert shas["3.1.1"] == git(repo, "rev-parse", "v3.1.1^{commit}")
+    assert shas["3.1.0"] == git(repo, "rev-parse", "3.1.0")
@@ -0,0 +1,26 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-language saves run on snapshots of the items being translated"""
+from docsagent.core.pipeline import DocGenerationPipeline
+
+
+def test_snapshot_is_isolated_from_later_writes(make_config_item):
+    item = make_config_item(documents={'en': 'Timeout'})
+    snapshot, = DocGenerationPipeline._snapshot_items([item])
+    item.documents['ja'] = 'タイムアウト'
+    
+    assert snapshot is not item
+    assert snapshot.name == item.name
+    assert snapshot.documents == {'en': 'Timeout'}
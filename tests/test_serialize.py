@@ -0,0 +1,83 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Packed (fields + rows) meta serialization"""
+import pickle
+
+import pytest
+
+from docsagent.core import json_io
+from docsagent.core.serialize import is_packed, pack_items, unpack_items, unpack_rows
+from docsagent.domains.models import ConfigItem
+
+
+@pytest.fixture
+def items(make_config_item):
+    return [
+        make_config_item(
+            define='Config.java', useLocations=['A.java:1'],
+            documents={'en': 'Timeout', 'zh': '超时'}, catalog='Query engine',
+            version=['3.0.0'], contentHashes={'en': 'abc'},
+        ),
+        make_config_item(
+            name='be_port', defaultValue='9060', comment='',
+            isMutable='false', scope='BE', define='config.h',
+        ),
+    ]
+
+
+def as_dicts(items):
+    return [item.to_dict() for item in items]
+
+
+def test_layout_stores_field_names_once(items):
+    data = json_io.loads(pack_items(items, ConfigItem))
+    assert is_packed(data)
+    assert data['fields'] == list(ConfigItem.FIELDS)
+    assert data['rows'][0][:2] == ['query_timeout', 'int']
+    assert len(data['rows']) == 2
+
+
+def test_round_trip(items):
+    assert as_dicts(unpack_items(ConfigItem, pack_items(items, ConfigItem))) == as_dicts(items)
+
+
+def test_round_trip_indented(items):
+    blob = pack_items(items, ConfigItem, indent=True)
+    assert b'\n' in blob
+    assert as_dicts(unpack_items(ConfigItem, blob)) == as_dicts(items)
+
+
+def test_rows_of_an_older_schema_map_by_field_name():
+    # Written before 'version' and 'contentHashes' existed, in another order
+    data = {
+        'fields': ['scope', 'name', 'type', 'defaultValue', 'comment', 'isMutable', 'define'],
+        'rows': [['FE', 'query_timeout', 'int', '300', 'Timeout', 'true', '']],
+    }
+    item, = unpack_rows(ConfigItem, data)
+    assert (item.name, item.scope, item.defaultValue) == ('query_timeout', 'FE', '300')
+    assert item.version == [] and item.contentHashes == {}
+
+
+def test_short_row_takes_trailing_defaults():
+    item = ConfigItem.from_tuple(('be_port', 'int', '9060', '', 'false', 'BE', 'config.h'))
+    assert item.documents == {} and item.catalog is None
+
+
+def test_legacy_list_is_not_packed(items):
+    assert not is_packed(json_io.loads(json_io.dumps(as_dicts(items))))
+
+
+def test_pickles_as_row(items):
+    assert as_dicts(pickle.loads(pickle.dumps(items))) == as_dicts(items)
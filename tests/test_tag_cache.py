@@ -0,0 +1,71 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Version extractor tag cache keyed by the extraction version and regexes"""
+import re
+import sys
+
+from docsagent.core import json_io
+from docsagent.core.version_extractor import BaseVersionExtractor
+
+_NAME_RE = re.compile(rb'CONF_(\w+)')
+
+
+class NameExtractor(BaseVersionExtractor):
+    def _extract_all_items_from_bytes(self, content: bytes) -> set:
+        return {m.decode() for m in _NAME_RE.findall(content)}
+
+
+class OtherExtractor(NameExtractor):
+    pass
+
+
+def make(cls, tmp_path):
+    extractor = cls.__new__(cls)
+    extractor.version_file = tmp_path / 'versions.json'
+    return extractor
+
+
+BLOBS = {'abc123': frozenset({'a', 'b'})}
+
+
+def test_round_trip(tmp_path):
+    extractor = make(NameExtractor, tmp_path)
+    extractor._save_tag_cache(BLOBS)
+    assert extractor._load_tag_cache() == BLOBS
+
+
+def test_other_extractor_discards_cache(tmp_path):
+    make(NameExtractor, tmp_path)._save_tag_cache(BLOBS)
+    assert make(OtherExtractor, tmp_path)._load_tag_cache() == {}
+
+
+def test_bumped_extraction_version_discards_cache(tmp_path, monkeypatch):
+    extractor = make(NameExtractor, tmp_path)
+    extractor._save_tag_cache(BLOBS)
+    monkeypatch.setattr(NameExtractor, 'EXTRACTION_VERSION', 2)
+    assert extractor._load_tag_cache() == {}
+
+
+def test_changed_pattern_discards_cache(tmp_path, monkeypatch):
+    extractor = make(NameExtractor, tmp_path)
+    extractor._save_tag_cache(BLOBS)
+    monkeypatch.setattr(sys.modules[__name__], '_NAME_RE', re.compile(rb'CONF_m?(\w+)'))
+    assert extractor._load_tag_cache() == {}
+
+
+def test_legacy_cache_without_key_is_discarded(tmp_path):
+    extractor = make(NameExtractor, tmp_path)
+    extractor.tag_cache_file.write_bytes(json_io.dumps({'abc123': ['a', 'b']}))
+    assert extractor._load_tag_cache() == {}
@@ -0,0 +1,67 @@
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar version file layout"""
+from docsagent.core import json_io
+from docsagent.core.version_extractor import VERSION_SCHEMA, BaseVersionExtractor
+
+DATA = {
+    "metadata": {"git_version": "a3f5b2c", "maintained_branches": ["3.0", "3.1", "3.10"]},
+    "versions": {
+        "enable_a": {"3.0": "3.0.11", "3.1": "3.1.1", "3.10": "3.10.0"},
+        "enable_b": {"3.10": "3.10.2"},
+        "enable_c": {},
+    },
+}
+
+
+def make(tmp_path) -> BaseVersionExtractor:
+    extractor = BaseVersionExtractor.__new__(BaseVersionExtractor)
+    extractor.version_file = tmp_path / "versions.json"
+    return extractor
+
+
+def test_to_columns_layout():
+    columns = BaseVersionExtractor._to_columns(DATA)
+    assert columns["schema_version"] == VERSION_SCHEMA
+    # Branches in version order, not string order
+    assert columns["branches"] == ["3.0", "3.1", "3.10"]
+    assert columns["items"] == {
+        "enable_a": ["3.0.11", "3.1.1", "3.10.0"],
+        "enable_b": [None, None, "3.10.2"],
+        "enable_c": [None, None, None],
+    }
+
+
+def test_columns_round_trip():
+    assert BaseVersionExtractor._from_columns(BaseVersionExtractor._to_columns(DATA)) == DATA
+
+
+def test_round_trip_through_json():
+    blob = json_io.dumps(BaseVersionExtractor._to_columns(DATA), indent=True)
+    assert BaseVersionExtractor._from_columns(json_io.loads(blob)) == DATA
+
+
+def test_legacy_layout_passes_through():
+    assert BaseVersionExtractor._from_columns(DATA) is DATA
+
+
+def test_load_version_file_reads_columnar_file(tmp_path):
+    extractor = make(tmp_path)
+    extractor.version_file.write_bytes(json_io.dumps(BaseVersionExtractor._to_columns(DATA)))
+    assert extractor.load_version_file() == DATA
+
+
+def test_load_version_file_missing(tmp_path):
+    assert make(tmp_path).load_version_file() == {"metadata": {}, "versions": {}}